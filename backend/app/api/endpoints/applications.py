@@ -1,120 +1,151 @@
 # In backend/app/api/endpoints/applications.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+import asyncio
+import time
 import uuid
 import logging
 import json
-from typing import Any, Dict
-from pydantic import HttpUrl
 from datetime import datetime
+from typing import List, Literal, Optional, Union
 
 from ... import schemas, crud
-from ...db.database import get_db
-from ...core.security import generate_resume_and_cover_letter
-from ..endpoints.auth import get_current_user
-from ...models.user import User as UserModel
+from ...db.database import get_db, get_async_db, AsyncSessionLocal
+from ..endpoints.auth import get_current_user, get_current_user_id
+from ...core.principal_cache import Principal
 from ...logging_config import api_logger
+from ...core.config import settings
+from ...crud.pagination import InvalidCursor, decode_cursor, encode_cursor
 from ...crud.jobpostings import get_job_posting
-from ...schemas.job_postings import JobPosting as JobPostingSchema
+from ...core.security import stream_resume_and_cover_letter, parse_generation_response, gemini_rate_limiter, llm_client
+from ...llm import LLMUnavailable
+from ...services.generation import (
+    generate_application_coalesced,
+    generation_flights,
+    build_generation_inputs,
+    get_generation_fingerprint,
+    get_cached_application_async,
+    build_application_create,
+    store_application_async,
+    generate_applications_batch,
+    regenerate_application_section,
+    missing_section_specs,
+)
+from ...services.sections import SECTIONS, SECTIONS_BY_NAME, clean_section_text, generate_sections_async, stream_sections
+from ...services.structured_output import MalformedOutputError, structured_output_stats
+from ...services.streaming import SectionStreamParser, format_sse
+from ...services.generation_cache import generation_cache
 
 router = APIRouter()
 
-def convert_unserializable_objects_to_strings(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively converts Pydantic HttpUrl, UUID, and datetime objects to strings."""
-    for key, value in data.items():
-        if isinstance(value, dict):
-            data[key] = convert_unserializable_objects_to_strings(value)
-        elif isinstance(value, list):
-            data[key] = [
-                convert_unserializable_objects_to_strings(item) if isinstance(item, dict) else str(item)
-                for item in value
-            ]
-        elif isinstance(value, (HttpUrl, uuid.UUID, datetime)):
-            data[key] = str(value)
-    return data
-
-def extract_text_from_nested_dict(data: Dict[str, Any]) -> str:
-    """Recursively extracts all string values from a nested dictionary and joins them."""
-    extracted_strings = []
-    for key, value in data.items():
-        if isinstance(value, str):
-            extracted_strings.append(value)
-        elif isinstance(value, dict):
-            extracted_strings.append(extract_text_from_nested_dict(value))
-        elif isinstance(value, list):
-            for item in value:
-                if isinstance(item, str):
-                    extracted_strings.append(item)
-                elif isinstance(item, dict):
-                    extracted_strings.append(extract_text_from_nested_dict(item))
-    return "\n\n".join(extracted_strings)
-
-@router.post("/generate", response_model=schemas.ApplicationCreate, status_code=status.HTTP_200_OK)
+TERMINAL_JOB_STATUSES = ("succeeded", "failed")
+
+@router.get("", response_model=schemas.ApplicationPage)
+async def list_applications(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    company: Optional[str] = None,
+    location: Optional[str] = None,
+    generated_from: Optional[datetime] = None,
+    generated_to: Optional[datetime] = None,
+    fields: Literal["summary", "full"] = "summary",
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
+):
+    """
+    List the authenticated user's generated applications, newest first.
+
+    Pass `next_cursor` from the previous page as `cursor` to continue.
+    `company` and `location` filter on the application's job posting. With
+    `fields=summary` (the default) the generated documents are left out.
+    """
+    try:
+        before = None
+        if cursor:
+            position = decode_cursor(cursor, "generated_at", "id")
+            before = (datetime.fromisoformat(position["generated_at"]), int(position["id"]))
+    except (InvalidCursor, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+
+    rows = await crud.applications.list_user_applications_async(
+        db,
+        current_user_id,
+        limit=limit + 1,
+        before=before,
+        company=company,
+        location=location,
+        generated_from=generated_from,
+        generated_to=generated_to,
+        include_text=fields == "full",
+    )
+    has_more = len(rows) > limit
+    item_schema = schemas.ApplicationInDB if fields == "full" else schemas.ApplicationSummary
+    items = [item_schema.model_validate(row) for row in rows[:limit]]
+    return schemas.ApplicationPage(
+        items=items,
+        next_cursor=encode_cursor({"generated_at": items[-1].generated_at, "id": items[-1].id}) if has_more else None,
+    )
+
+@router.post(
+    "/generate",
+    response_model=Union[schemas.ApplicationCreate, schemas.GenerationJobInDB],
+    status_code=status.HTTP_200_OK
+)
 def generate_application(
     job_posting_id: int,
+    response: Response,
+    async_mode: bool = False,
+    force_regenerate: bool = False,
     db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Generates a tailored resume and cover letter for a specific job posting,
     saves it, and returns the generated content.
+
+    With `async_mode=true` the work is queued for a generation worker instead and
+    a job is returned immediately; poll `/applications/jobs/{job_id}` for its status.
+    A previous generation from an unchanged profile and posting is returned from
+    the generation cache unless `force_regenerate=true`.
     """
-    # 1. Retrieve the authenticated user's profile with all relationships
-    user_with_relations = crud.users.get_user_with_relations(db, user_id=current_user.id)
-    if not user_with_relations:
-        raise HTTPException(status_code=404, detail="User profile not found.")
-        
-    # 2. Retrieve the job posting
+    # 1. Retrieve the job posting
     job_posting = get_job_posting(db, job_posting_id)
     if not job_posting:
         raise HTTPException(status_code=404, detail="Job posting not found.")
 
-    # 3. Convert SQLAlchemy objects to Pydantic models and then to dictionaries.
-    user_data = schemas.User.model_validate(user_with_relations).model_dump()
-    job_data = JobPostingSchema.model_validate(job_posting).model_dump()
-    
-    # Convert any unserializable objects to strings
-    user_data = convert_unserializable_objects_to_strings(user_data)
-    job_data = convert_unserializable_objects_to_strings(job_data)
+    if async_mode:
+        generation_job = crud.generation_jobs.create_generation_job(
+            db, user_id=current_user.id, job_posting_id=job_posting.id, force_regenerate=force_regenerate
+        )
+        api_logger.info({"message": "Queued application generation", "job_id": str(generation_job.id), "job_posting_id": job_posting.id})
+        response.status_code = status.HTTP_202_ACCEPTED
+        return schemas.GenerationJobInDB.model_validate(generation_job)
+
+    # 2. Retrieve the authenticated user's profile with all relationships
+    user_with_relations = crud.users.get_user_with_relations(db, user_id=current_user.id)
+    if not user_with_relations:
+        raise HTTPException(status_code=404, detail="User profile not found.")
 
-    # 4. Generate the resume and cover letter using the data
+    # 3. Generate, save and return the resume and cover letter
     try:
-        generated_data = generate_resume_and_cover_letter(user_data, job_data)
-        
-        # 5. Extract text and create the application schema
-        resume_text = generated_data.get("resume", "")
-        if isinstance(resume_text, dict):
-            resume_text = extract_text_from_nested_dict(resume_text)
-
-        cover_letter_text = generated_data.get("cover_letter", "")
-
-        email_template_text = generated_data.get("generated_email_template", "")
-        if isinstance(email_template_text, dict):
-            email_template_text = extract_text_from_nested_dict(email_template_text)
-
-        application_create_schema = schemas.ApplicationCreate(
-            user_id=current_user.id,
-            job_posting_id=job_posting.id,
-            generated_resume_text=resume_text,
-            generated_cover_letter_text=cover_letter_text,
-            generated_email_template=email_template_text
+        return generate_application_coalesced(
+            db, user_with_relations, job_posting, force_regenerate=force_regenerate
         )
-        
-        # 6. Save to the database
-        crud.applications.create_application(
-            db=db,
-            application=application_create_schema
+
+    except LLMUnavailable as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="The LLM provider is failing; try again shortly.",
+            headers={"Retry-After": str(max(1, int(e.retry_after or 0)))},
         )
-        
-        # 7. Return the generated content to the frontend
-        return application_create_schema
 
-    except json.JSONDecodeError as e:
-        api_logger.error({"message": "LLM response was not valid JSON", "error": str(e)}, exc_info=True)
+    except MalformedOutputError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to parse LLM response. The generated content may be malformed."
+            detail=str(e)
         )
 
     except Exception as e:
@@ -124,23 +155,267 @@ def generate_application(
             detail=f"An unexpected error occurred: {str(e)}"
         )
 
+@router.post("/generate/batch", response_model=schemas.ApplicationBatchGenerateResponse)
+async def generate_applications_for_postings(
+    batch_request: schemas.ApplicationBatchGenerateRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
+):
+    """
+    Generates applications for several saved job postings in one request.
+    The profile is loaded once; Gemini calls run concurrently within
+    GENERATION_BATCH_CONCURRENCY and the GEMINI_REQUESTS_PER_MINUTE quota.
+    """
+    if len(batch_request.job_posting_ids) > settings.GENERATION_BATCH_MAX_POSTINGS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"A batch may contain at most {settings.GENERATION_BATCH_MAX_POSTINGS} job postings."
+        )
+
+    user_with_relations = await crud.users.get_user_with_relations_async(db, user_id=current_user_id)
+    if not user_with_relations:
+        raise HTTPException(status_code=404, detail="User profile not found.")
+
+    started = time.time()
+    response = await generate_applications_batch(
+        db, user_with_relations, batch_request.job_posting_ids, force_regenerate=batch_request.force_regenerate
+    )
+    api_logger.info({
+        "message": "Batch generation finished",
+        "job_postings": len(response.results),
+        "generated": response.generated,
+        "cached": response.cached,
+        "failed": response.failed,
+        "process_time_ms": int((time.time() - started) * 1000),
+    })
+    return response
+
+@router.post("/generate/stream")
+async def generate_application_stream(
+    job_posting_id: int,
+    force_regenerate: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
+):
+    """
+    Streaming variant of `/generate`. Emits server-sent events:
+    `delta` events carry `{"section", "text"}` as the model writes each section
+    (interleaved in sectioned mode, where the sections are written concurrently),
+    then a single `complete` event with the saved application (or `error`).
+    """
+    job_posting = await crud.jobpostings.get_job_posting_async(db, job_posting_id)
+    if not job_posting:
+        raise HTTPException(status_code=404, detail="Job posting not found.")
+    user_with_relations = await crud.users.get_user_with_relations_async(db, user_id=current_user_id)
+    if not user_with_relations:
+        raise HTTPException(status_code=404, detail="User profile not found.")
+
+    user_data, job_data = build_generation_inputs(user_with_relations, job_posting)
+    fingerprint = get_generation_fingerprint(user_data, job_data)
+    cached_application = await get_cached_application_async(db, current_user_id, fingerprint, force_regenerate)
+    cached = schemas.ApplicationCreate.model_validate(cached_application, from_attributes=True) if cached_application else None
+    user_id = current_user_id
+
+    async def event_stream():
+        if cached is not None:
+            for section, field in (
+                ("resume", "generated_resume_text"),
+                ("cover_letter", "generated_cover_letter_text"),
+                ("generated_email_template", "generated_email_template"),
+            ):
+                yield format_sse("delta", {"section": section, "text": getattr(cached, field)})
+            yield format_sse("complete", cached.model_dump(mode="json"))
+            return
+
+        try:
+            if settings.GENERATION_MODE == "sectioned":
+                # All three sections stream at once; their deltas interleave
+                section_chunks = {}
+                async for section, text in stream_sections(user_data, job_data):
+                    section_chunks.setdefault(section, []).append(text)
+                    yield format_sse("delta", {"section": section, "text": text})
+                # Held to the same checks as the non-streaming path: unfenced, and no section left empty
+                generated_data = {
+                    spec.key: clean_section_text(spec, "".join(section_chunks.get(spec.key, [])))
+                    for spec in SECTIONS
+                }
+            else:
+                parser = SectionStreamParser()
+                raw_chunks = []
+                async for chunk in stream_resume_and_cover_letter(user_data, job_data):
+                    raw_chunks.append(chunk)
+                    for section, text in parser.feed(chunk):
+                        yield format_sse("delta", {"section": section, "text": text})
+                generated_data = parse_generation_response("".join(raw_chunks))
+                missing = missing_section_specs(generated_data)
+                if missing:
+                    # Sections lost from the streamed reply are written separately and sent whole
+                    refilled = await generate_sections_async(user_data, job_data, missing)
+                    for section, text in refilled.items():
+                        yield format_sse("delta", {"section": section, "text": text})
+                    generated_data.update(refilled)
+
+            application_create_schema = build_application_create(user_id, job_posting_id, generated_data)
+            # The request-scoped session is not guaranteed to outlive the response stream.
+            async with AsyncSessionLocal() as persist_db:
+                await store_application_async(persist_db, application_create_schema, fingerprint)
+        except MalformedOutputError as e:
+            yield format_sse("error", {"detail": str(e)})
+            return
+        except Exception as e:
+            api_logger.error({"message": "Streaming application generation failed", "error": str(e)}, exc_info=True)
+            yield format_sse("error", {"detail": f"An unexpected error occurred: {str(e)}"})
+            return
+
+        yield format_sse("complete", application_create_schema.model_dump(mode="json"))
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        # Stop reverse proxies from buffering the stream and defeating the point.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.get("/cache/stats", dependencies=[Depends(get_current_user_id)])
+def get_generation_cache_stats():
+    """Report generation cache, request coalescing and LLM client counters for this process."""
+    return {
+        **generation_cache.stats(),
+        "single_flight": generation_flights.stats(),
+        "rate_limiter": gemini_rate_limiter.stats(),
+        "llm_client": llm_client.stats(),
+        "structured_output": structured_output_stats.stats(),
+    }
+
+async def _get_owned_generation_job(db: AsyncSession, job_id: uuid.UUID, user_id: uuid.UUID):
+    generation_job = await crud.generation_jobs.get_generation_job_async(db, job_id)
+    if not generation_job:
+        raise HTTPException(status_code=404, detail="Generation job not found.")
+    if generation_job.user_id != user_id:
+        api_logger.warning({"message": "User not authorized to access generation job", "job_id": str(job_id), "user_id": user_id})
+        raise HTTPException(status_code=403, detail="Not authorized to access this generation job.")
+    return generation_job
+
+@router.get("/jobs/{job_id}", response_model=schemas.GenerationJobInDB)
+async def get_generation_job_status(
+    job_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
+):
+    """Poll the status of a queued application generation job."""
+    return await _get_owned_generation_job(db, job_id, current_user_id)
+
+@router.get("/jobs/{job_id}/events")
+async def stream_generation_job_status(
+    job_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
+):
+    """
+    Subscribe to a generation job as server-sent events. An event is emitted
+    whenever the job status changes and the stream closes once it finishes.
+    """
+    await _get_owned_generation_job(db, job_id, current_user_id)
+
+    async def load_job_status() -> schemas.GenerationJobInDB:
+        # A short-lived session per poll so the stream never pins a pooled connection.
+        async with AsyncSessionLocal() as poll_db:
+            generation_job = await crud.generation_jobs.get_generation_job_async(poll_db, job_id)
+            return schemas.GenerationJobInDB.model_validate(generation_job)
+
+    async def event_stream():
+        last_payload = None
+        while True:
+            job_status = await load_job_status()
+            payload = job_status.model_dump_json()
+            if payload != last_payload:
+                yield f"event: status\ndata: {payload}\n\n"
+                last_payload = payload
+            if job_status.status in TERMINAL_JOB_STATUSES:
+                return
+            await asyncio.sleep(settings.GENERATION_JOB_EVENTS_POLL_SECONDS)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+async def _get_owned_application(db: AsyncSession, application_id: int, user_id: uuid.UUID):
+    application = await crud.applications.get_application_async(db, application_id)
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found.")
+    if application.user_id != user_id:
+        api_logger.warning({"message": "User not authorized to access application", "application_id": application_id, "user_id": user_id})
+        raise HTTPException(status_code=403, detail="Not authorized to access this application.")
+    return application
+
+@router.post("/{application_id}/regenerate", response_model=schemas.ApplicationInDB)
+async def regenerate_application_section_endpoint(
+    application_id: int,
+    section: Literal["resume", "cover_letter", "email"],
+    regenerate_request: Optional[schemas.ApplicationRegenerateRequest] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
+):
+    """
+    Rewrites one section of a saved application, optionally following
+    `instructions`, and leaves the other two untouched. The previous text is
+    kept and listed by `/applications/{application_id}/revisions`.
+    """
+    start_time = time.perf_counter()
+    application = await _get_owned_application(db, application_id, current_user_id)
+    instructions = regenerate_request.instructions if regenerate_request else None
+
+    try:
+        application = await regenerate_application_section(
+            db, application, SECTIONS_BY_NAME[section], instructions=instructions
+        )
+    except LLMUnavailable as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="The LLM provider is failing; try again shortly.",
+            headers={"Retry-After": str(max(1, int(e.retry_after or 0)))},
+        )
+    except Exception as e:
+        api_logger.error({"message": "Section regeneration failed", "application_id": application_id, "section": section, "error": str(e)}, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+    api_logger.info({
+        "message": "Application section replaced",
+        "application_id": application_id,
+        "section": section,
+        "process_time_ms": int((time.perf_counter() - start_time) * 1000),
+    })
+    return application
+
+@router.get("/{application_id}/revisions", response_model=List[schemas.ApplicationRevisionInDB])
+async def list_application_revisions(
+    application_id: int,
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
+):
+    """Earlier text of regenerated sections, newest first."""
+    await _get_owned_application(db, application_id, current_user_id)
+    return await crud.applications.list_application_revisions_async(db, application_id, limit)
+
 @router.get("/{job_posting_id}", response_model=schemas.ApplicationInDB)
-def get_application_by_job_id(
+async def get_application_by_job_id(
     job_posting_id: int,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
 ):
     """
     Retrieves a generated application for a specific job posting.
     Ensures the application belongs to the authenticated user.
     """
-    application = crud.applications.get_application_by_job_id(db, job_posting_id)
+    application = await crud.applications.get_application_by_job_id_async(db, job_posting_id)
     if not application:
         api_logger.warning({"message": "Application not found for job_posting_id", "job_posting_id": job_posting_id})
         raise HTTPException(status_code=404, detail="Application not found for this job posting.")
     
-    if application.user_id != current_user.id:
-        api_logger.warning({"message": "User not authorized to access application", "application_id": application.id, "user_id": current_user.id})
+    if application.user_id != current_user_id:
+        api_logger.warning({"message": "User not authorized to access application", "application_id": application.id, "user_id": current_user_id})
         raise HTTPException(status_code=403, detail="Not authorized to access this application.")
         
     return application
\ No newline at end of file
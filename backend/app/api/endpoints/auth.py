@@ -2,37 +2,54 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
+import uuid
 from ... import schemas, crud
-from ...db.database import get_db
-from ...core.security import create_access_token, authenticate_user, decode_access_token
+from ...db.database import get_async_db
+from ...core.security import create_access_token, authenticate_user_async, decode_access_token, password_hasher
+from ...core.passwords import PasswordHasherBusy
 from ...core.config import settings
+from ...core.principal_cache import Principal, principal_cache
 import logging
 from ...logging_config import api_logger
 
 router = APIRouter()
 
+def _hasher_busy_exception() -> HTTPException:
+    api_logger.warning({"message": "Password hasher queue is full", **password_hasher.stats()})
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many sign-in requests right now. Please try again shortly.",
+        headers={"Retry-After": "1"},
+    )
+
 # Declare the oauth2_scheme so it can be used in other files.
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
 
-@router.post("/signup", response_model=schemas.User, status_code=status.HTTP_201_CREATED)
-def signup(user_data: schemas.UserCreate, db: Session = Depends(get_db)):
-    db_user = crud.users.get_user_by_email(db, email=user_data.email)
+@router.post("/signup", response_model=schemas.UserProfile, status_code=status.HTTP_201_CREATED)
+async def signup(user_data: schemas.UserCreate, db: AsyncSession = Depends(get_async_db)):
+    db_user = await crud.users.get_user_by_email_async(db, email=user_data.email)
     if db_user:
         api_logger.warning({"message": "Attempted signup with an existing email", "email": user_data.email})
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
-    return crud.users.create_user(db=db, user=user_data)
+    try:
+        return await crud.users.create_user_async(db=db, user=user_data)
+    except PasswordHasherBusy:
+        raise _hasher_busy_exception()
 
 @router.post("/token", response_model=schemas.Token)
-def login_for_access_token(
+async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    user = authenticate_user(db, email=form_data.username, password=form_data.password)
+    try:
+        user = await authenticate_user_async(db, email=form_data.username, password=form_data.password)
+    except PasswordHasherBusy:
+        raise _hasher_busy_exception()
     if not user:
         api_logger.warning({"message": "Failed login attempt", "email": form_data.username})
         raise HTTPException(
@@ -46,19 +63,52 @@ def login_for_access_token(
     )
     return {"access_token": access_token, "token_type": "bearer"}
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> uuid.UUID:
+    """
+    The user id from a valid token's claims, without touching the database.
+    For endpoints that only scope queries by user id: a user deleted after
+    the token was issued is still accepted until the token expires.
+    """
     payload = decode_access_token(token)
-    if payload is None or "sub" not in payload:
-        raise credentials_exception
-    user_id = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
-    user = crud.users.get_user(db, user_id=user_id)
-    if user is None:
-        raise credentials_exception
-    return user
\ No newline at end of file
+    if payload is None or payload.get("sub") is None:
+        raise _credentials_exception()
+    try:
+        return uuid.UUID(payload["sub"])
+    except (TypeError, ValueError):
+        raise _credentials_exception()
+
+async def get_current_user(
+    user_id: uuid.UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """
+    The authenticated user's identity, confirmed to still exist. Served from
+    the principal cache when warm; FastAPI resolves it once per request
+    however many dependencies ask for it.
+    """
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+    identity = await crud.users.get_user_identity_async(db, user_id=user_id)
+    if identity is None:
+        raise _credentials_exception()
+    principal = Principal(id=identity.id, email=identity.email, name=identity.name)
+    principal_cache.set(principal)
+    return principal
+
+@router.get("/principal-cache", dependencies=[Depends(get_current_user_id)])
+def get_principal_cache_stats():
+    """Report principal cache counters for this process."""
+    return principal_cache.stats()
+
+@router.get("/password-hasher", dependencies=[Depends(get_current_user_id)])
+def get_password_hasher_stats():
+    """Report password hashing pool mode, queue depth and timings for this process."""
+    return password_hasher.stats()
@@ -1,26 +1,89 @@
 # In backend/app/api/endpoints/jobpostings.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+import httpx
+import json
+import time
 import uuid
+from datetime import datetime
+from typing import Literal, Optional
 from ... import schemas, crud
-from ...db.database import get_db
-from ...scraping.linkedin_scraper import LinkedInScraper
+from ...core.config import settings
+from ...db.database import get_async_db, AsyncSessionLocal
+from ...scraping.linkedin_scraper import LinkedInScraper, scrape_path_stats
+from ...scraping.http_client import get_http_client
+from ...scraping.browser_pool import BrowserPool, BrowserPoolTimeout, get_browser_pool
+from ...scraping.cache import scrape_cache
+from ...scraping.urls import canonicalize_job_url
+from ...services.scraping import (
+    get_job_payload, scrape_lock, scrape_flights,
+    prepare_batch, iter_scrape_payloads, store_batch, build_batch_response
+)
+from ...db.locks import AdvisoryLockTimeout
+from ...crud.pagination import InvalidCursor, decode_cursor, encode_cursor
 import logging
 from ...logging_config import api_logger  # Import the logger
-from ..endpoints.auth import get_current_user # Import the authentication dependency
-from ...models.user import User as UserModel
+from ..endpoints.auth import get_current_user, get_current_user_id # Import the authentication dependencies
+from ...core.principal_cache import Principal
 
 router = APIRouter()
 
+@router.get("", response_model=schemas.JobPostingPage)
+async def list_job_postings(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    company: Optional[str] = None,
+    location: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    fields: Literal["summary", "full"] = "summary",
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
+):
+    """
+    List the authenticated user's saved postings, newest first.
+
+    Pass `next_cursor` from the previous page as `cursor` to continue.
+    `company` and `location` match case-insensitive substrings; the date range
+    applies to when the posting was saved. With `fields=summary` (the default)
+    the description is cut to a short preview.
+    """
+    try:
+        before_id = int(decode_cursor(cursor, "id")["id"]) if cursor else None
+    except (InvalidCursor, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+
+    job_postings = await crud.jobpostings.list_user_job_postings_async(
+        db,
+        current_user_id,
+        limit=limit + 1,
+        before_id=before_id,
+        company=company,
+        location=location,
+        created_from=created_from,
+        created_to=created_to,
+        include_description=fields == "full",
+    )
+    has_more = len(job_postings) > limit
+    job_postings = job_postings[:limit]
+    item_schema = schemas.JobPostingInDB if fields == "full" else schemas.JobPostingSummary
+    return schemas.JobPostingPage(
+        items=[item_schema.model_validate(job_posting) for job_posting in job_postings],
+        next_cursor=encode_cursor({"id": job_postings[-1].id}) if has_more else None,
+    )
+
 @router.post("/scrape", response_model=schemas.JobPostingInDB)
 async def scrape_job_posting(
     scrape_request: schemas.JobScrapeRequest,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user) # Add the authentication dependency
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_user), # Add the authentication dependency
+    browser_pool: BrowserPool = Depends(get_browser_pool),
+    http_client: httpx.AsyncClient = Depends(get_http_client)
 ):
     """Scrape job posting from LinkedIn URL for the authenticated user"""
-    # Validate the URL
-    url_str = str(scrape_request.url)
+    # Reduce the URL to its canonical LinkedIn job form so repeats dedupe
+    url_str = canonicalize_job_url(str(scrape_request.url))
     if "jobs/search" in url_str:
         api_logger.warning({"message": "Invalid scrape URL provided", "url": url_str})
         raise HTTPException(
@@ -28,50 +91,165 @@ async def scrape_job_posting(
             detail="Please provide a direct link to a job posting, not a search results page."
         )
     
-    scraper = LinkedInScraper()
+    scraper = LinkedInScraper(browser_pool, http_client)
     try:
-        job_data = await scraper.scrape_job_posting(url_str)
+        async with scrape_lock(url_str):
+            # The user already saved this posting: nothing to scrape or insert
+            existing_posting = await crud.jobpostings.get_user_job_posting_by_url_async(db, current_user.id, url_str)
+            if existing_posting:
+                return existing_posting
+
+            job_data = await get_job_payload(db, url_str, scraper)
+            if not job_data:
+                api_logger.warning({"message": "Scraping returned no data", "url": url_str})
+                raise HTTPException(
+                    status_code=400,
+                    detail="Failed to scrape job posting. Please check that the URL is a valid LinkedIn job posting and try again."
+                )
+
+            # Create job posting in database using the authenticated user's ID
+            job_posting = schemas.JobPostingCreate(
+                user_id=current_user.id,  # Use the ID from the authenticated user
+                url=url_str,
+                job_title=job_data.get('title', ''),
+                company_name=job_data.get('company', ''),
+                location=job_data.get('location', ''),
+                job_description=job_data.get('description', ''),
+                job_description_compact=job_data.get('description_compact'),
+            )
+
+            return await crud.jobpostings.create_job_posting_async(db=db, job_posting=job_posting)
+    except HTTPException:
+        raise
+    except (BrowserPoolTimeout, AdvisoryLockTimeout):
+        api_logger.warning({"message": "No scrape slot became available", "url": url_str, **browser_pool.stats()})
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="The scraper is busy right now. Please try again shortly."
+        )
     except Exception as e:
         api_logger.error({"message": "Scraping failed due to an exception", "url": url_str, "error": str(e)})
         raise HTTPException(
             status_code=500,
             detail="An internal error occurred while scraping the job posting."
         )
-    
-    if not job_data:
-        api_logger.warning({"message": "Scraping returned no data", "url": url_str})
+
+@router.post("/scrape/batch", response_model=schemas.JobBatchScrapeResponse)
+async def scrape_job_postings_batch(
+    batch_request: schemas.JobBatchScrapeRequest,
+    stream: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_user),
+    browser_pool: BrowserPool = Depends(get_browser_pool),
+    http_client: httpx.AsyncClient = Depends(get_http_client)
+):
+    """
+    Scrape several job posting URLs in one request.
+
+    URLs are scraped concurrently (bounded by SCRAPE_BATCH_CONCURRENCY) and the
+    new postings are saved with a single bulk insert. With stream=true the
+    response is NDJSON: one "result" line per URL as it finishes, then a
+    "summary" line carrying the same body as the non-streaming response.
+    """
+    if len(batch_request.urls) > settings.SCRAPE_BATCH_MAX_URLS:
         raise HTTPException(
             status_code=400,
-            detail="Failed to scrape job posting. Please check that the URL is a valid LinkedIn job posting and try again."
+            detail=f"A batch may contain at most {settings.SCRAPE_BATCH_MAX_URLS} URLs."
         )
-    
-    # Create job posting in database using the authenticated user's ID
-    job_posting = schemas.JobPostingCreate(
-        user_id=current_user.id,  # Use the ID from the authenticated user
-        url=scrape_request.url,
-        job_title=job_data.get('title', ''),
-        company_name=job_data.get('company', ''),
-        location=job_data.get('location', ''),
-        job_description=job_data.get('description', ''),
-    )
-    
-    return crud.jobpostings.create_job_posting(db=db, job_posting=job_posting)
+
+    started = time.time()
+    user_id = current_user.id
+    pairs, existing = await prepare_batch(db, user_id, [str(url) for url in batch_request.urls])
+    to_scrape = list(dict.fromkeys(
+        canonical for _, canonical in pairs if "jobs/search" not in canonical and canonical not in existing
+    ))
+    scraper = LinkedInScraper(browser_pool, http_client)
+
+    def log_batch(response: schemas.JobBatchScrapeResponse):
+        api_logger.info({
+            "message": "Batch scrape finished",
+            "urls": len(pairs),
+            "scraped": len(to_scrape),
+            "created": response.created,
+            "existing": response.existing,
+            "failed": response.failed,
+            "process_time_ms": int((time.time() - started) * 1000),
+        })
+
+    if not stream:
+        payloads, errors = {}, {}
+        async for canonical_url, job_data, error in iter_scrape_payloads(to_scrape, scraper):
+            if job_data:
+                payloads[canonical_url] = job_data
+            else:
+                errors[canonical_url] = error
+        created = {}
+        if payloads:
+            created, saved_concurrently = await store_batch(db, user_id, payloads)
+            existing.update(saved_concurrently)
+        response = build_batch_response(pairs, existing, created, errors)
+        log_batch(response)
+        return response
+
+    async def event_stream():
+        payloads, errors = {}, {}
+        for url, canonical_url in pairs:
+            if canonical_url in existing:
+                yield json.dumps({"type": "result", "url": url, "canonical_url": canonical_url, "status": "existing"}) + "\n"
+        async for canonical_url, job_data, error in iter_scrape_payloads(to_scrape, scraper):
+            if job_data:
+                payloads[canonical_url] = job_data
+            else:
+                errors[canonical_url] = error
+            yield json.dumps({
+                "type": "result",
+                "canonical_url": canonical_url,
+                "status": "scraped" if job_data else "failed",
+                "error": error,
+            }) + "\n"
+
+        # The request-scoped session is closed once the response starts streaming.
+        created = {}
+        if payloads:
+            async with AsyncSessionLocal() as stream_db:
+                created, saved_concurrently = await store_batch(stream_db, user_id, payloads)
+                existing.update(saved_concurrently)
+        response = build_batch_response(pairs, existing, created, errors)
+        log_batch(response)
+        yield json.dumps({"type": "summary", **response.model_dump(mode="json")}) + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+@router.get("/scraper/pool", dependencies=[Depends(get_current_user_id)])
+def get_scraper_pool_stats(browser_pool: BrowserPool = Depends(get_browser_pool)):
+    """Report browser pool hit/miss counters and slot wait times."""
+    return browser_pool.stats()
+
+@router.get("/scraper/paths", dependencies=[Depends(get_current_user_id)])
+def get_scraper_path_stats():
+    """Report how often the HTTP fast path served a scrape versus falling back to Playwright."""
+    return scrape_path_stats.stats()
+
+@router.get("/scraper/cache", dependencies=[Depends(get_current_user_id)])
+def get_scrape_cache_stats():
+    """Report scrape cache and request coalescing counters for this process."""
+    return {**scrape_cache.stats(), "single_flight": scrape_flights.stats()}
 
 @router.get("/{job_posting_id}", response_model=schemas.JobPostingInDB)
-def get_job_posting_by_id(
+async def get_job_posting_by_id(
     job_posting_id: int,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
 ):
     """Retrieve a single job posting by its ID for the authenticated user."""
-    db_job_posting = crud.jobpostings.get_job_posting(db, job_posting_id)
+    db_job_posting = await crud.jobpostings.get_job_posting_async(db, job_posting_id)
     if not db_job_posting:
         api_logger.warning({"message": "Job posting not found", "job_posting_id": job_posting_id})
         raise HTTPException(status_code=404, detail="Job posting not found")
     
     # Ensure the job posting belongs to the current user for security
-    if db_job_posting.user_id != current_user.id:
-        api_logger.warning({"message": "User not authorized to access job posting", "job_posting_id": job_posting_id, "user_id": current_user.id})
+    if db_job_posting.user_id != current_user_id:
+        api_logger.warning({"message": "User not authorized to access job posting", "job_posting_id": job_posting_id, "user_id": current_user_id})
         raise HTTPException(status_code=403, detail="Not authorized to access this job posting")
     
     return db_job_posting
\ No newline at end of file
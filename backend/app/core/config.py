@@ -7,15 +7,120 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Authenticated principals are cached per process by token subject; 0 disables
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 4096
+
+    # bcrypt cost factor for new hashes; existing hashes keep the cost they were made with
+    BCRYPT_ROUNDS: int = 12
+    # Processes dedicated to password hashing (0 runs it in the shared threadpool)
+    PASSWORD_HASH_WORKERS: int = 2
+    # Hash/verify calls allowed to queue before auth endpoints answer 503
+    PASSWORD_HASH_MAX_PENDING: int = 64
     
     # New database fields
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
     DATABASE_URL: Optional[str] = None
+
+    # Connection pool, applied to both the sync and the async engine
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
     
     # New field for the Gemini API Key
     GEMINI_API_KEY: str # Add this line
+    GEMINI_MODEL: str = "gemini-2.5-flash"
+    # Request quota for the Gemini API key, enforced per process by a token bucket.
+    GEMINI_REQUESTS_PER_MINUTE: int = 60
+    GEMINI_RATE_LIMIT_BURST: int = 5
+    # LLM client (app/llm). "stub" answers locally with canned output; LLM_BASE_URL
+    # can point the Gemini provider at a stub server (benchmarks/llm_stub_server.py)
+    LLM_PROVIDER: str = "gemini"
+    LLM_BASE_URL: str = "https://generativelanguage.googleapis.com"
+    LLM_MAX_CONNECTIONS: int = 20
+    LLM_CONNECT_TIMEOUT_SECONDS: float = 10.0
+    # Deadline for a whole call, retries included, and for each attempt
+    LLM_TIMEOUT_SECONDS: float = 180.0
+    LLM_ATTEMPT_TIMEOUT_SECONDS: float = 120.0
+    # Retries on timeouts, 429 and 5xx, with full-jitter exponential backoff
+    LLM_MAX_RETRIES: int = 3
+    LLM_BACKOFF_BASE_SECONDS: float = 0.5
+    LLM_BACKOFF_MAX_SECONDS: float = 8.0
+    # Consecutive upstream failures that open the circuit, and how long it stays open
+    LLM_BREAKER_FAILURE_THRESHOLD: int = 5
+    LLM_BREAKER_RESET_SECONDS: float = 30.0
+    # Send a duplicate request when the first has not answered after this long; 0 disables
+    LLM_HEDGE_AFTER_SECONDS: float = 0.0
+    LLM_STUB_LATENCY_MS: int = 0
+    # "sectioned" writes the resume, cover letter and email template as three concurrent
+    # LLM calls, each with its own model and output cap; "single" asks for all three in one call.
+    # Section models left unset use GEMINI_MODEL.
+    GENERATION_MODE: str = "sectioned"
+    GENERATION_RESUME_MODEL: Optional[str] = None
+    GENERATION_RESUME_MAX_OUTPUT_TOKENS: int = 4096
+    GENERATION_COVER_LETTER_MODEL: Optional[str] = None
+    GENERATION_COVER_LETTER_MAX_OUTPUT_TOKENS: int = 2048
+    GENERATION_EMAIL_MODEL: str = "gemini-2.5-flash-lite"
+    GENERATION_EMAIL_MAX_OUTPUT_TOKENS: int = 512
+    # Estimated tokens allowed for ranked experiences, projects and skills in a prompt.
+    PROMPT_PROFILE_TOKEN_BUDGET: int = 1500
+    # Estimated tokens allowed for the preprocessed job description in a prompt
+    PROMPT_JOB_DESCRIPTION_TOKEN_BUDGET: int = 1000
+
+    # Scraper browser pool
+    BROWSER_POOL_SIZE: int = 2
+    BROWSER_CONTEXT_MAX_USES: int = 20
+    SCRAPER_MAX_CONCURRENCY: int = 4
+    SCRAPER_ACQUIRE_TIMEOUT_SECONDS: float = 30.0
+
+    # Plain-HTTP fast path for server-rendered job pages; Playwright is the fallback
+    SCRAPER_HTTP_FAST_PATH: bool = True
+    SCRAPER_HTTP_TIMEOUT_SECONDS: float = 10.0
+    SCRAPER_HTTP_MAX_CONNECTIONS: int = 20
+
+    # Scrape result cache
+    SCRAPE_CACHE_TTL_SECONDS: int = 6 * 60 * 60
+    SCRAPE_CACHE_MAX_ENTRIES: int = 512
+
+    # Batch scraping
+    SCRAPE_BATCH_MAX_URLS: int = 50
+    SCRAPE_BATCH_CONCURRENCY: int = 4
+
+    # Batch generation
+    GENERATION_BATCH_MAX_POSTINGS: int = 50
+    GENERATION_BATCH_CONCURRENCY: int = 4
+
+    # Request coalescing. Identical scrape/generate requests always share one
+    # in-flight operation per process; enable advisory locks to also serialize
+    # them across API processes and workers.
+    SINGLE_FLIGHT_ADVISORY_LOCKS: bool = False
+    ADVISORY_LOCK_TIMEOUT_SECONDS: float = 120.0
+
+    # Background application generation queue
+    GENERATION_WORKER_POLL_INTERVAL_SECONDS: float = 1.0
+    GENERATION_JOB_LEASE_SECONDS: int = 300
+    GENERATION_JOB_MAX_ATTEMPTS: int = 3
+    GENERATION_JOB_EVENTS_POLL_SECONDS: float = 1.0
+
+    # Generation cache
+    GENERATION_CACHE_TTL_SECONDS: int = 7 * 24 * 60 * 60
+    GENERATION_CACHE_MAX_ENTRIES: int = 1024
+
+    # Logging: records are queued and written by a background thread
+    LOG_QUEUE_MAX_SIZE: int = 10000  # records beyond this are dropped, never waited on
+    LOG_BATCH_SIZE: int = 100
+    LOG_FLUSH_INTERVAL_SECONDS: float = 1.0
+    LOG_FILE_MAX_BYTES: int = 10 * 1024 * 1024
+    LOG_FILE_BACKUP_COUNT: int = 5
+    LOG_CONSOLE: bool = True
+    # Share of successful, fast requests written to the access log; errors and
+    # requests slower than LOG_ACCESS_SLOW_MS are always logged
+    LOG_ACCESS_SAMPLE_RATE: float = 1.0
+    LOG_ACCESS_SLOW_MS: int = 1000
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,139 @@
+# In backend/app/core/metrics.py
+
+import functools
+import inspect
+import time
+from typing import Callable, Dict
+
+from prometheus_client import Counter, Histogram, REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+
+# Buckets from a fast DB lookup up to a slow LLM call
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "jaa_http_request_duration_seconds",
+    "API request latency by route template and status code.",
+    ["method", "route", "status_code"],
+    buckets=LATENCY_BUCKETS,
+)
+
+SCRAPE_SECONDS = Histogram(
+    "jaa_scrape_duration_seconds",
+    "Whole scrape latency by the path that served it (http, browser, browser_fallback).",
+    ["path"],
+    buckets=LATENCY_BUCKETS,
+)
+
+SCRAPE_PHASE_SECONDS = Histogram(
+    "jaa_scrape_phase_duration_seconds",
+    "Time spent in each scrape phase: http_fetch, navigation, show_more, selector_wait, parse, markdownify, preprocess.",
+    ["phase"],
+    buckets=LATENCY_BUCKETS,
+)
+
+DB_CALL_SECONDS = Histogram(
+    "jaa_db_call_duration_seconds",
+    "Wall time of each crud function, including the queries it runs.",
+    ["function"],
+    buckets=LATENCY_BUCKETS,
+)
+
+LLM_REQUEST_SECONDS = Histogram(
+    "jaa_llm_request_duration_seconds",
+    "LLM call latency, including retries, backoff and rate limiter waits; outcome is ok, error, timeout or circuit_open.",
+    ["model", "mode", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+
+LLM_TOKENS = Counter(
+    "jaa_llm_tokens_total",
+    "Tokens reported by the LLM provider.",
+    ["model", "kind"],
+)
+
+
+def route_label(scope: dict) -> str:
+    """
+    The matched route's template with its full prefix, e.g. /api/jobpostings/{job_posting_id}.
+    Routes from included routers carry only their own part of the path, so
+    the prefix is recovered from the request path.
+    """
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    template = getattr(route, "path_format", None) or route.path
+    rendered = template
+    for name, value in scope.get("path_params", {}).items():
+        rendered = rendered.replace("{" + name + "}", str(value))
+    path = scope.get("path", "")
+    if rendered and path.endswith(rendered):
+        return path[: len(path) - len(rendered)] + template
+    return template or path
+
+
+def observe_db_calls(module) -> None:
+    """
+    Replaces every public function of a crud module whose first parameter is
+    `db` with a wrapper that records its duration in DB_CALL_SECONDS.
+    """
+    prefix = module.__name__.rsplit(".", 1)[-1]
+    for name, func in list(vars(module).items()):
+        if name.startswith("_") or not inspect.isfunction(func) or func.__module__ != module.__name__:
+            continue
+        parameters = list(inspect.signature(func).parameters)
+        if not parameters or parameters[0] != "db":
+            continue
+        setattr(module, name, _timed(func, DB_CALL_SECONDS.labels(f"{prefix}.{name}")))
+
+
+def _timed(func, histogram):
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - started)
+    return wrapper
+
+
+class StatsCollector:
+    """
+    Exposes the numeric fields of the existing stats() dicts (pools, caches,
+    rate limiter) as gauges named jaa_<source>_<field>, read at scrape time.
+    """
+
+    def __init__(self):
+        self._sources: Dict[str, Callable[[], dict]] = {}
+
+    def register(self, name: str, stats: Callable[[], dict]) -> None:
+        self._sources[name] = stats
+
+    def unregister(self, name: str) -> None:
+        self._sources.pop(name, None)
+
+    def collect(self):
+        for source, stats in list(self._sources.items()):
+            try:
+                values = stats()
+            except Exception:
+                continue
+            for field, value in values.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                yield GaugeMetricFamily(f"jaa_{source}_{field}", f"{field} from the {source} stats.", value=value)
+
+
+stats_collector = StatsCollector()
+REGISTRY.register(stats_collector)
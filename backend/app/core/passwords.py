@@ -0,0 +1,112 @@
+# In backend/app/core/passwords.py
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from fastapi.concurrency import run_in_threadpool
+from passlib.context import CryptContext
+
+# Worker processes import only this module, so keep its imports light.
+logger = logging.getLogger("api_logger")
+_contexts = {}
+
+
+def _context(rounds: int) -> CryptContext:
+    context = _contexts.get(rounds)
+    if context is None:
+        context = _contexts[rounds] = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+    return context
+
+
+def hash_password(password: str, rounds: int) -> str:
+    return _context(rounds).hash(password)
+
+
+def verify_password_hash(password: str, hashed_password: str) -> bool:
+    # The cost factor is read from the hash itself
+    return _context(4).verify(password, hashed_password)
+
+
+def _warm_up() -> None:
+    _context(4)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when more password operations are waiting than the hasher accepts."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a dedicated process pool so logins and signups neither
+    block the event loop nor hold the threadpool that sync endpoints and
+    run_in_threadpool calls share.
+
+    At most `max_pending` operations may be queued or running; beyond that
+    callers get PasswordHasherBusy instead of an ever-growing backlog. With
+    `workers=0`, or before start(), work runs in the shared threadpool.
+    """
+
+    def __init__(self, rounds: int, workers: int, max_pending: int):
+        self.rounds = rounds
+        self.workers = workers
+        self.max_pending = max(1, max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+
+    async def start(self) -> None:
+        if self.workers <= 0 or self._executor is not None:
+            return
+        # spawn, not fork: the API process already runs threads and an event loop
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        loop = asyncio.get_running_loop()
+        try:
+            # Start every worker now rather than on the first login
+            await asyncio.gather(*(loop.run_in_executor(self._executor, _warm_up) for _ in range(self.workers)))
+        except Exception as e:
+            logger.error({"message": "Password hashing workers failed to start; using the threadpool", "error": str(e)})
+            await self.stop()
+
+    async def stop(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    async def _run(self, func, *args):
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHasherBusy()
+        self._pending += 1
+        started = time.perf_counter()
+        try:
+            if self._executor is None:
+                return await run_in_threadpool(func, *args)
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+            self.completed += 1
+            self.total_seconds += time.perf_counter() - started
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password, self.rounds)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password_hash, password, hashed_password)
+
+    def stats(self) -> dict:
+        return {
+            "mode": "process" if self._executor is not None else "thread",
+            "workers": self.workers,
+            "rounds": self.rounds,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_ms": round(self.total_seconds / self.completed * 1000, 1) if self.completed else 0.0,
+        }
@@ -0,0 +1,100 @@
+# In backend/app/core/principal_cache.py
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+
+from .. import models
+from .config import settings
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated user as seen by request handlers: identity only, no password hash or relations."""
+    id: uuid.UUID
+    email: str
+    name: Optional[str] = None
+
+
+class PrincipalCache:
+    """
+    TTL + LRU cache of authenticated principals keyed by the token's `sub`
+    claim, so a warm get_current_user is a JWT decode and a dict lookup.
+
+    Entries are dropped when the User row is updated or deleted through the
+    ORM in this process; other processes see the change within the TTL.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+        max_entries: int = settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[uuid.UUID, tuple[Principal, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, user_id: uuid.UUID) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and time.monotonic() - entry[1] > self.ttl_seconds:
+                del self._entries[user_id]
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, principal: Principal) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[principal.id] = (principal, time.monotonic())
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        with self._lock:
+            if self._entries.pop(user_id, None) is not None:
+                self.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+principal_cache = PrincipalCache()
+
+
+# Bulk UPDATE/DELETE statements bypass these mapper events; expire with
+# principal_cache.invalidate() when touching users that way.
+@event.listens_for(models.User, "after_update")
+@event.listens_for(models.User, "after_delete")
+def _invalidate_principal(mapper, connection, target: models.User) -> None:
+    if target.id is not None:
+        principal_cache.invalidate(target.id)
@@ -0,0 +1,51 @@
+# In backend/app/core/ratelimit.py
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket for pacing calls against a provider quota: refills at
+    `rate_per_minute` tokens per minute and holds at most `burst` tokens.
+    acquire() waits until enough tokens are available; waiters are served in
+    arrival order so one large request cannot be starved by small ones.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait_seconds = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1) -> None:
+        tokens = min(tokens, self.capacity)
+        async with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                wait = (tokens - self._tokens) / self.rate_per_second
+                self.throttled += 1
+                self.total_wait_seconds += wait
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= tokens
+            self.acquired += 1
+
+    def stats(self) -> dict:
+        return {
+            "rate_per_minute": round(self.rate_per_second * 60, 2),
+            "burst": self.capacity,
+            "available": round(min(self.capacity, self._tokens + (time.monotonic() - self._updated_at) * self.rate_per_second), 2),
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+        }
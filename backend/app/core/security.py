@@ -4,48 +4,63 @@ from datetime import datetime, timedelta
 from typing import Optional
 import uuid
 from jose import jwt, JWTError
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import HttpUrl
 from .config import settings
-import google.generativeai as genai
+from .ratelimit import AsyncTokenBucket
+from .passwords import PasswordHasher, hash_password, verify_password_hash
+from .metrics import LLM_TOKENS
 from datetime import datetime, date
-from typing import Optional
+from typing import AsyncIterator, Optional
 import json
+from ..llm import CircuitBreaker, LLMClient, LLMResponse, create_provider
 from ..logging_config import api_logger
-
-# Configure the Gemini API with your key
-genai.configure(api_key=settings.GEMINI_API_KEY)
-
-def generate_resume_and_cover_letter(user_data: dict, job_data: dict) -> dict:
-    
-    # Define a custom default handler for json.dumps
-    def custom_json_serializer(obj):
-        if isinstance(obj, date):
-            return obj.isoformat()
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, (uuid.UUID, HttpUrl)):
-            return str(obj)
-        raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
-    
-    
-    """
-    Generates a tailored resume and cover letter using the Gemini API.
-    """
-    
-    prompt = f"""
+from ..services.prompt_payload import estimate_tokens
+from ..services.structured_output import APPLICATION_RESPONSE_SCHEMA, parse_application_output
+
+# Gemini calls in this process share the API key's request quota.
+gemini_rate_limiter = AsyncTokenBucket(settings.GEMINI_REQUESTS_PER_MINUTE, settings.GEMINI_RATE_LIMIT_BURST)
+
+# One client per process: pooled connections, deadlines, retries and a circuit breaker.
+llm_client = LLMClient(
+    create_provider,
+    default_model=settings.GEMINI_MODEL,
+    rate_limiter=gemini_rate_limiter,
+    breaker=CircuitBreaker(settings.LLM_BREAKER_FAILURE_THRESHOLD, settings.LLM_BREAKER_RESET_SECONDS),
+    timeout=settings.LLM_TIMEOUT_SECONDS,
+    attempt_timeout=settings.LLM_ATTEMPT_TIMEOUT_SECONDS,
+    max_retries=settings.LLM_MAX_RETRIES,
+    backoff_base=settings.LLM_BACKOFF_BASE_SECONDS,
+    backoff_max=settings.LLM_BACKOFF_MAX_SECONDS,
+    hedge_after=settings.LLM_HEDGE_AFTER_SECONDS,
+)
+
+# Bump whenever the prompt below changes so cached generations are not reused.
+PROMPT_TEMPLATE_VERSION = "3"
+
+# Define a custom default handler for json.dumps
+def custom_json_serializer(obj):
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, (uuid.UUID, HttpUrl)):
+        return str(obj)
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+def build_application_prompt(user_data: dict, job_data: dict) -> str:
+    return f"""
     You are an expert career assistant. Your task is to generate a tailored resume, cover letter, and a simple email template for a job application. The output must be in JSON format with three keys: "resume", "cover_letter", and "generated_email_template".
 
     The user's professional profile is:
     <user_profile>
-    {json.dumps(user_data, indent=2, default=custom_json_serializer)}
+    {json.dumps(user_data, separators=(",", ":"), default=custom_json_serializer)}
     </user_profile>
 
     The job posting details are:
     <job_posting>
-    {json.dumps(job_data, indent=2, default=custom_json_serializer)}
+    {json.dumps(job_data, separators=(",", ":"), default=custom_json_serializer)}
     </job_posting>
 
     Instructions:
@@ -56,23 +71,36 @@ def generate_resume_and_cover_letter(user_data: dict, job_data: dict) -> dict:
     Return only the JSON object. Do not include any additional text, markdown, or code blocks outside of the JSON.
     """
 
+def log_token_usage(prompt: str, response: Optional[LLMResponse] = None, section: Optional[str] = None) -> None:
+    """Logs the prompt size per request: our estimate, plus the provider's counts when returned."""
+    model = response.model if response is not None else settings.GEMINI_MODEL
+    usage = {"prompt_tokens_estimate": estimate_tokens(prompt)}
+    if section is not None:
+        usage["section"] = section
+    if response is not None and response.prompt_tokens is not None:
+        usage["prompt_tokens"] = response.prompt_tokens
+        usage["output_tokens"] = response.output_tokens
+        LLM_TOKENS.labels(model, "prompt").inc(usage["prompt_tokens"] or 0)
+        LLM_TOKENS.labels(model, "output").inc(usage["output_tokens"] or 0)
+    api_logger.info({"message": "Gemini token usage", "model": model, **usage})
+
+def parse_generation_response(text: str) -> dict:
+    """
+    The sections recovered from the model's JSON output. Sections lost to
+    truncation are left out; see services/structured_output.py.
+    """
+    return parse_application_output(text)
+
+def generate_resume_and_cover_letter(user_data: dict, job_data: dict) -> dict:
+    """
+    Generates a tailored resume and cover letter using the Gemini API.
+    """
+    prompt = build_application_prompt(user_data, job_data)
+
     try:
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        response = model.generate_content(prompt)
-
-        # Sanitize the output by removing markdown code block fences if present
-        # This makes the JSON parsing more robust.
-        if response.text.startswith("```json") and response.text.endswith("```"):
-            json_text = response.text[7:-3].strip()
-        else:
-            json_text = response.text.strip()
-            
-        generated_data = json.loads(json_text)
-
-        if "resume" not in generated_data or "cover_letter" not in generated_data:
-            raise ValueError("Gemini response did not contain the expected keys.")
-        
-        return generated_data
+        response = llm_client.generate_sync(prompt, response_schema=APPLICATION_RESPONSE_SCHEMA)
+        log_token_usage(prompt, response)
+        return parse_generation_response(response.text)
 
     except Exception as e:
         # Log the specific LLM API error with the traceback for better debugging
@@ -85,14 +113,67 @@ def generate_resume_and_cover_letter(user_data: dict, job_data: dict) -> dict:
         )
         raise e
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+async def generate_resume_and_cover_letter_async(user_data: dict, job_data: dict) -> dict:
+    """
+    Async counterpart of generate_resume_and_cover_letter. Calls share the
+    LLM client's rate limiter so concurrent callers stay within the quota.
+    """
+    prompt = build_application_prompt(user_data, job_data)
+
+    try:
+        response = await llm_client.generate(prompt, response_schema=APPLICATION_RESPONSE_SCHEMA)
+        log_token_usage(prompt, response)
+        return parse_generation_response(response.text)
+
+    except Exception as e:
+        api_logger.error(
+            {
+                "message": "Application generation failed due to LLM error",
+                "error": str(e)
+            },
+            exc_info=True
+        )
+        raise e
+
+async def stream_resume_and_cover_letter(user_data: dict, job_data: dict) -> AsyncIterator[str]:
+    """
+    Streams the raw Gemini output for the same prompt as
+    generate_resume_and_cover_letter, one text chunk at a time.
+    """
+    prompt = build_application_prompt(user_data, job_data)
+
+    try:
+        last_chunk = None
+        async for chunk in llm_client.stream(prompt, response_schema=APPLICATION_RESPONSE_SCHEMA):
+            # The final chunk carries the token counts for the whole exchange.
+            if chunk.prompt_tokens is not None:
+                last_chunk = chunk
+            if chunk.text:
+                yield chunk.text
+        log_token_usage(prompt, last_chunk)
+
+    except Exception as e:
+        api_logger.error(
+            {
+                "message": "Streaming generation failed due to LLM error",
+                "error": str(e)
+            },
+            exc_info=True
+        )
+        raise e
+
+password_hasher = PasswordHasher(
+    rounds=settings.BCRYPT_ROUNDS,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return verify_password_hash(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return hash_password(password, settings.BCRYPT_ROUNDS)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -116,4 +197,12 @@ def authenticate_user(db, email: str, password: str):
     user = users.get_user_by_email(db, email)
     if not user or not verify_password(password, user.password_hash):
         return False
-    return user
\ No newline at end of file
+    return user
+
+async def authenticate_user_async(db, email: str, password: str):
+    from ..crud import users
+    user = await users.get_user_by_email_async(db, email)
+    # bcrypt is CPU-bound; it runs in the password hasher's worker processes
+    if not user or not await password_hasher.verify(password, user.password_hash):
+        return False
+    return user
@@ -2,3 +2,9 @@
 from . import users
 from . import applications
 from . import jobpostings
+from . import generation_jobs
+from ..core.metrics import observe_db_calls
+
+# Time every crud function per name; callers importing them directly get the timed version too.
+for _module in (users, applications, jobpostings, generation_jobs):
+    observe_db_calls(_module)
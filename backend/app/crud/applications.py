@@ -1,15 +1,25 @@
 # In backend/app/crud/applications.py
+from datetime import datetime
+import uuid
+from typing import List, Optional, Tuple
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from .. import models, schemas
+from .jobpostings import job_posting_filters
 
-def create_application(db: Session, application: schemas.ApplicationCreate):
-    db_application = models.Application(
+def _build_application(application: schemas.ApplicationCreate, generation_fingerprint: Optional[str]) -> models.Application:
+    return models.Application(
         user_id=application.user_id,
         job_posting_id=application.job_posting_id,
         generated_resume_text=application.generated_resume_text,
         generated_cover_letter_text=application.generated_cover_letter_text,
         generated_email_template=application.generated_email_template,
+        generation_fingerprint=generation_fingerprint,
     )
+
+def create_application(db: Session, application: schemas.ApplicationCreate, generation_fingerprint: Optional[str] = None):
+    db_application = _build_application(application, generation_fingerprint)
     db.add(db_application)
     db.commit()
     db.refresh(db_application)
@@ -20,4 +30,157 @@ def get_application(db: Session, application_id: int):
 
 # 🆕 New function to get application by job posting ID
 def get_application_by_job_id(db: Session, job_posting_id: int):
-    return db.query(models.Application).filter(models.Application.job_posting_id == job_posting_id).first()
\ No newline at end of file
+    return db.query(models.Application).filter(models.Application.job_posting_id == job_posting_id).first()
+
+def _fingerprint_filter(user_id: uuid.UUID, fingerprint: str, newer_than: datetime):
+    return (
+        models.Application.user_id == user_id,
+        models.Application.generation_fingerprint == fingerprint,
+        models.Application.generated_at >= newer_than
+    )
+
+def get_application_by_fingerprint(db: Session, user_id: uuid.UUID, fingerprint: str, newer_than: datetime):
+    return (
+        db.query(models.Application)
+        .filter(*_fingerprint_filter(user_id, fingerprint, newer_than))
+        .order_by(models.Application.generated_at.desc())
+        .first()
+    )
+
+# --- Async versions, for endpoints running on the event loop ---
+
+async def create_application_async(db: AsyncSession, application: schemas.ApplicationCreate, generation_fingerprint: Optional[str] = None):
+    db_application = _build_application(application, generation_fingerprint)
+    db.add(db_application)
+    await db.commit()
+    await db.refresh(db_application)
+    return db_application
+
+async def create_applications_bulk_async(
+    db: AsyncSession,
+    applications: List[Tuple[schemas.ApplicationCreate, Optional[str]]]
+):
+    """Inserts (application, generation_fingerprint) pairs in a single INSERT ... RETURNING."""
+    if not applications:
+        return []
+    rows = [
+        {
+            "user_id": application.user_id,
+            "job_posting_id": application.job_posting_id,
+            "generated_resume_text": application.generated_resume_text,
+            "generated_cover_letter_text": application.generated_cover_letter_text,
+            "generated_email_template": application.generated_email_template,
+            "generation_fingerprint": generation_fingerprint,
+        }
+        for application, generation_fingerprint in applications
+    ]
+    stmt = insert(models.Application).values(rows).returning(models.Application)
+    result = await db.execute(select(models.Application).from_statement(stmt))
+    created = result.scalars().all()
+    await db.commit()
+    return created
+
+async def get_application_async(db: AsyncSession, application_id: int):
+    result = await db.execute(select(models.Application).filter(models.Application.id == application_id))
+    return result.scalars().first()
+
+async def get_application_by_job_id_async(db: AsyncSession, job_posting_id: int):
+    result = await db.execute(
+        select(models.Application).filter(models.Application.job_posting_id == job_posting_id).limit(1)
+    )
+    return result.scalars().first()
+
+async def get_application_by_fingerprint_async(db: AsyncSession, user_id: uuid.UUID, fingerprint: str, newer_than: datetime):
+    result = await db.execute(
+        select(models.Application)
+        .filter(*_fingerprint_filter(user_id, fingerprint, newer_than))
+        .order_by(models.Application.generated_at.desc())
+        .limit(1)
+    )
+    return result.scalars().first()
+
+async def list_user_applications_async(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    limit: int,
+    before: Optional[Tuple[datetime, int]] = None,
+    company: Optional[str] = None,
+    location: Optional[str] = None,
+    generated_from: Optional[datetime] = None,
+    generated_to: Optional[datetime] = None,
+    include_text: bool = False
+):
+    """
+    Newest-first page of a user's applications, keyset-paginated on
+    (generated_at, id): pass the last row's pair as `before`. Without
+    `include_text` the generated documents are not read; rows are mappings
+    of the application's ids and date plus its posting's headline.
+    """
+    if include_text:
+        query = select(models.Application)
+    else:
+        query = select(
+            models.Application.id,
+            models.Application.job_posting_id,
+            models.Application.generated_at,
+            models.JobPosting.job_title,
+            models.JobPosting.company_name,
+            models.JobPosting.location,
+        )
+    query = query.join(models.JobPosting, models.Application.job_posting_id == models.JobPosting.id).filter(
+        models.Application.user_id == user_id,
+        *job_posting_filters(company, location)
+    )
+    if before is not None:
+        query = query.filter(tuple_(models.Application.generated_at, models.Application.id) < tuple_(*before))
+    if generated_from is not None:
+        query = query.filter(models.Application.generated_at >= generated_from)
+    if generated_to is not None:
+        query = query.filter(models.Application.generated_at < generated_to)
+    query = query.order_by(models.Application.generated_at.desc(), models.Application.id.desc()).limit(limit)
+
+    result = await db.execute(query)
+    return result.scalars().all() if include_text else result.mappings().all()
+
+async def replace_application_section_async(
+    db: AsyncSession,
+    application_id: int,
+    column: str,
+    section: str,
+    text: str,
+    instructions: Optional[str] = None,
+    model: Optional[str] = None
+):
+    """
+    Overwrites one generated column in place and records the text it held in
+    application_revisions. The row is locked first, so concurrent
+    regenerations of the same application each archive what they replaced.
+    """
+    # populate_existing: the session may already hold this row from before the lock was taken
+    result = await db.execute(
+        select(models.Application)
+        .filter(models.Application.id == application_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    application = result.scalars().one()
+    db.add(models.ApplicationRevision(
+        application_id=application_id,
+        section=section,
+        previous_text=getattr(application, column),
+        instructions=instructions,
+        model=model,
+    ))
+    setattr(application, column, text)
+    await db.commit()
+    await db.refresh(application)
+    return application
+
+async def list_application_revisions_async(db: AsyncSession, application_id: int, limit: int):
+    result = await db.execute(
+        select(models.ApplicationRevision)
+        .filter(models.ApplicationRevision.application_id == application_id)
+        .order_by(models.ApplicationRevision.created_at.desc(), models.ApplicationRevision.id.desc())
+        .limit(limit)
+    )
+    return result.scalars().all()
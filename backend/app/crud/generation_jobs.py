@@ -0,0 +1,118 @@
+# In backend/app/crud/generation_jobs.py
+
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from .. import models
+
+def create_generation_job(db: Session, user_id: uuid.UUID, job_posting_id: int, force_regenerate: bool = False):
+    db_job = models.GenerationJob(
+        user_id=user_id, job_posting_id=job_posting_id, status="queued", force_regenerate=force_regenerate
+    )
+    db.add(db_job)
+    db.commit()
+    db.refresh(db_job)
+    return db_job
+
+def get_generation_job(db: Session, job_id: uuid.UUID):
+    return db.query(models.GenerationJob).filter(models.GenerationJob.id == job_id).first()
+
+def claim_next_generation_job(db: Session, lease_seconds: int, max_attempts: int) -> Optional[models.GenerationJob]:
+    """
+    Atomically claims the oldest runnable job. FOR UPDATE SKIP LOCKED lets any
+    number of workers poll the same table without handing out a job twice.
+    Jobs left 'running' past their lease (e.g. a worker crashed) are reclaimed
+    while they have attempts left, and marked failed once they have none, so
+    a job that kills its worker cannot take down workers forever.
+    """
+    now = datetime.utcnow()
+    lease_expired_before = now - timedelta(seconds=lease_seconds)
+    db.execute(
+        update(models.GenerationJob)
+        .where(
+            models.GenerationJob.status == "running",
+            models.GenerationJob.started_at < lease_expired_before,
+            models.GenerationJob.attempts >= max_attempts
+        )
+        .values(status="failed", error="Generation did not finish within its lease.", finished_at=now)
+    )
+    db_job = (
+        db.query(models.GenerationJob)
+        .filter(
+            or_(
+                models.GenerationJob.status == "queued",
+                and_(
+                    models.GenerationJob.status == "running",
+                    models.GenerationJob.started_at < lease_expired_before,
+                    models.GenerationJob.attempts < max_attempts
+                )
+            )
+        )
+        .order_by(models.GenerationJob.created_at)
+        .with_for_update(skip_locked=True)
+        .first()
+    )
+    if db_job is None:
+        db.commit()
+        return None
+    db_job.status = "running"
+    db_job.started_at = now
+    db_job.attempts = (db_job.attempts or 0) + 1
+    db.commit()
+    db.refresh(db_job)
+    return db_job
+
+def renew_generation_job_lease(db: Session, job_id: uuid.UUID, attempt: int) -> bool:
+    """
+    Pushes a running job's lease forward. Matching on the attempt keeps a
+    worker that lost its job to a reclaim from renewing the new owner's lease.
+    """
+    result = db.execute(
+        update(models.GenerationJob)
+        .where(
+            models.GenerationJob.id == job_id,
+            models.GenerationJob.status == "running",
+            models.GenerationJob.attempts == attempt
+        )
+        .values(started_at=datetime.utcnow())
+    )
+    db.commit()
+    return result.rowcount == 1
+
+def _finish_generation_attempt(db: Session, job_id: uuid.UUID, attempt: int, **values) -> bool:
+    # Fenced like lease renewal: a worker whose job was reclaimed must not overwrite the new owner's outcome
+    result = db.execute(
+        update(models.GenerationJob)
+        .where(
+            models.GenerationJob.id == job_id,
+            models.GenerationJob.status == "running",
+            models.GenerationJob.attempts == attempt
+        )
+        .values(**values)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+def mark_generation_job_succeeded(db: Session, job_id: uuid.UUID, attempt: int, application_id: int) -> bool:
+    """Records the result of `attempt`. Returns False if the job has since been reclaimed."""
+    return _finish_generation_attempt(
+        db, job_id, attempt,
+        status="succeeded", application_id=application_id, error=None, finished_at=datetime.utcnow()
+    )
+
+def mark_generation_job_failed(db: Session, job_id: uuid.UUID, attempt: int, error: str, retry: bool) -> bool:
+    """
+    Retryable failures go back on the queue; the worker decides based on
+    attempts. Returns False if the job has since been reclaimed.
+    """
+    return _finish_generation_attempt(
+        db, job_id, attempt,
+        status="queued" if retry else "failed", error=error, finished_at=None if retry else datetime.utcnow()
+    )
+
+async def get_generation_job_async(db: AsyncSession, job_id: uuid.UUID):
+    result = await db.execute(select(models.GenerationJob).filter(models.GenerationJob.id == job_id))
+    return result.scalars().first()
@@ -1,17 +1,30 @@
 # In backend/app/crud/jobpostings.py
 
-from sqlalchemy.orm import Session
+import uuid
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only, with_expression
 from .. import models, schemas
 
-def create_job_posting(db: Session, job_posting: schemas.JobPostingCreate):
-    db_job_posting = models.JobPosting(
+# Length of the description snippet returned by listings
+JOB_DESCRIPTION_PREVIEW_CHARS = 300
+
+def _build_job_posting(job_posting: schemas.JobPostingCreate) -> models.JobPosting:
+    return models.JobPosting(
         user_id=job_posting.user_id,
         url=str(job_posting.url),
         job_title=job_posting.job_title,
         company_name=job_posting.company_name,
         location=job_posting.location,
         job_description=job_posting.job_description,
+        job_description_compact=job_posting.job_description_compact,
     )
+
+def create_job_posting(db: Session, job_posting: schemas.JobPostingCreate):
+    db_job_posting = _build_job_posting(job_posting)
     db.add(db_job_posting)
     db.commit()
     db.refresh(db_job_posting)
@@ -21,4 +34,147 @@ def get_job_posting(db: Session, job_posting_id: int):
     return db.query(models.JobPosting).filter(models.JobPosting.id == job_posting_id).first()
 
 def get_job_posting_by_url(db: Session, url: str):
-    return db.query(models.JobPosting).filter(models.JobPosting.url == url).first()
\ No newline at end of file
+    return db.query(models.JobPosting).filter(models.JobPosting.url == url).first()
+
+def get_user_job_posting_by_url(db: Session, user_id: uuid.UUID, url: str):
+    return (
+        db.query(models.JobPosting)
+        .filter(models.JobPosting.user_id == user_id, models.JobPosting.url == url)
+        .first()
+    )
+
+# --- Async versions, for endpoints running on the event loop ---
+
+async def create_job_posting_async(db: AsyncSession, job_posting: schemas.JobPostingCreate):
+    db_job_posting = _build_job_posting(job_posting)
+    db.add(db_job_posting)
+    await db.commit()
+    await db.refresh(db_job_posting)
+    return db_job_posting
+
+async def get_job_posting_async(db: AsyncSession, job_posting_id: int):
+    result = await db.execute(select(models.JobPosting).filter(models.JobPosting.id == job_posting_id))
+    return result.scalars().first()
+
+async def get_user_job_postings_by_ids_async(db: AsyncSession, user_id: uuid.UUID, job_posting_ids: List[int]):
+    if not job_posting_ids:
+        return []
+    result = await db.execute(
+        select(models.JobPosting).filter(
+            models.JobPosting.user_id == user_id,
+            models.JobPosting.id.in_(job_posting_ids)
+        )
+    )
+    return result.scalars().all()
+
+async def get_job_posting_by_url_async(db: AsyncSession, url: str):
+    result = await db.execute(select(models.JobPosting).filter(models.JobPosting.url == url).limit(1))
+    return result.scalars().first()
+
+async def get_user_job_posting_by_url_async(db: AsyncSession, user_id: uuid.UUID, url: str):
+    result = await db.execute(
+        select(models.JobPosting)
+        .filter(models.JobPosting.user_id == user_id, models.JobPosting.url == url)
+    )
+    return result.scalars().first()
+
+async def get_user_job_postings_by_urls_async(db: AsyncSession, user_id: uuid.UUID, urls: List[str]):
+    result = await db.execute(
+        select(models.JobPosting)
+        .filter(models.JobPosting.user_id == user_id, models.JobPosting.url.in_(urls))
+    )
+    return result.scalars().all()
+
+async def get_job_postings_by_urls_async(db: AsyncSession, urls: List[str]):
+    # One stored copy per URL is enough to reuse its scraped fields
+    result = await db.execute(
+        select(models.JobPosting)
+        .filter(models.JobPosting.url.in_(urls))
+        .distinct(models.JobPosting.url)
+        .order_by(models.JobPosting.url, models.JobPosting.id)
+    )
+    return result.scalars().all()
+
+async def create_job_postings_bulk_async(db: AsyncSession, job_postings: List[schemas.JobPostingCreate]):
+    """
+    Inserts many postings in a single INSERT ... RETURNING. Rows that collide
+    with a posting the user already saved are skipped rather than failing the batch.
+    """
+    if not job_postings:
+        return []
+    rows = [
+        {
+            "user_id": job_posting.user_id,
+            "url": str(job_posting.url),
+            "job_title": job_posting.job_title,
+            "company_name": job_posting.company_name,
+            "location": job_posting.location,
+            "job_description": job_posting.job_description,
+            "job_description_compact": job_posting.job_description_compact,
+        }
+        for job_posting in job_postings
+    ]
+    stmt = (
+        pg_insert(models.JobPosting)
+        .values(rows)
+        .on_conflict_do_nothing(constraint="uq_job_postings_user_id_url")
+        .returning(models.JobPosting)
+    )
+    result = await db.execute(select(models.JobPosting).from_statement(stmt))
+    created = result.scalars().all()
+    await db.commit()
+    return created
+
+def job_posting_filters(company: Optional[str] = None, location: Optional[str] = None):
+    """Case-insensitive substring filters shared by the posting and application listings."""
+    filters = []
+    if company:
+        filters.append(models.JobPosting.company_name.icontains(company, autoescape=True))
+    if location:
+        filters.append(models.JobPosting.location.icontains(location, autoescape=True))
+    return filters
+
+async def list_user_job_postings_async(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    limit: int,
+    before_id: Optional[int] = None,
+    company: Optional[str] = None,
+    location: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    include_description: bool = False
+):
+    """
+    Newest-first page of a user's postings, keyset-paginated on id: pass the
+    last id of the previous page as `before_id`. Without `include_description`
+    only listing columns and a SQL-side preview of the description are read.
+    """
+    query = select(models.JobPosting).filter(
+        models.JobPosting.user_id == user_id,
+        *job_posting_filters(company, location)
+    )
+    if before_id is not None:
+        query = query.filter(models.JobPosting.id < before_id)
+    if created_from is not None:
+        query = query.filter(models.JobPosting.created_at >= created_from)
+    if created_to is not None:
+        query = query.filter(models.JobPosting.created_at < created_to)
+    if not include_description:
+        query = query.options(
+            load_only(
+                models.JobPosting.id,
+                models.JobPosting.url,
+                models.JobPosting.job_title,
+                models.JobPosting.company_name,
+                models.JobPosting.location,
+                models.JobPosting.applied_at,
+                models.JobPosting.created_at,
+            ),
+            with_expression(
+                models.JobPosting.description_preview,
+                func.left(models.JobPosting.job_description, JOB_DESCRIPTION_PREVIEW_CHARS),
+            ),
+        )
+    result = await db.execute(query.order_by(models.JobPosting.id.desc()).limit(limit))
+    return result.scalars().all()
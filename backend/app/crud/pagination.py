@@ -0,0 +1,25 @@
+# In backend/app/crud/pagination.py
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor this API did not issue."""
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """Opaque, URL-safe cursor for the last row of a page."""
+    payload = {k: v.isoformat() if isinstance(v, datetime) else v for k, v in values.items()}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *keys: str) -> Dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return {key: payload[key] for key in keys}
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursor("Invalid pagination cursor.") from e
@@ -1,17 +1,18 @@
 # In backend/app/crud/users.py
 
 import uuid
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only, selectinload, with_expression
 from .. import models, schemas
-from ..core.security import get_password_hash
+from ..core.security import get_password_hash, password_hasher
+from .jobpostings import JOB_DESCRIPTION_PREVIEW_CHARS
 
 def get_user_by_email(db: Session, email: str):
     return db.query(models.User).filter(models.User.email == email).first()
 
-def create_user(db: Session, user: schemas.UserCreate):
-    # Hash the password before creating the user
-    hashed_password = get_password_hash(user.password)
-    db_user = models.User(
+def _build_user(user: schemas.UserCreate, hashed_password: str) -> models.User:
+    return models.User(
         email=user.email,
         password_hash=hashed_password,
         name=user.name,
@@ -21,9 +22,8 @@ def create_user(db: Session, user: schemas.UserCreate):
         personal_website_url=str(user.personal_website_url) if user.personal_website_url else None,
         professional_summary=user.professional_summary
     )
-    db.add(db_user)
-    db.flush() 
 
+def _add_user_relations(db, db_user: models.User, user: schemas.UserCreate) -> None:
     for exp in user.experiences:
         db_exp = models.Experience(**exp.dict(), user_id=db_user.id)
         db.add(db_exp)
@@ -45,6 +45,15 @@ def create_user(db: Session, user: schemas.UserCreate):
     for skill in user.skills:
         db_skill = models.Skill(**skill.dict(), user_id=db_user.id)
         db.add(db_skill)
+
+def create_user(db: Session, user: schemas.UserCreate):
+    # Hash the password before creating the user
+    hashed_password = get_password_hash(user.password)
+    db_user = _build_user(user, hashed_password)
+    db.add(db_user)
+    db.flush() 
+
+    _add_user_relations(db, db_user, user)
     
     db.commit()
     db.refresh(db_user)
@@ -53,16 +62,40 @@ def create_user(db: Session, user: schemas.UserCreate):
 def get_user(db: Session, user_id: uuid.UUID):
     return db.query(models.User).filter(models.User.id == user_id).first()
 
+def _profile_section_options():
+    # One SELECT ... WHERE user_id IN (...) per section instead of a joined
+    # cartesian product. Job postings and applications are not loaded.
+    return (
+        selectinload(models.User.experiences),
+        selectinload(models.User.educations),
+        selectinload(models.User.skills),
+        selectinload(models.User.projects),
+    )
+
+def _job_posting_summary_options():
+    # Only the listing columns, with a SQL-side snippet of the description
+    return selectinload(models.User.job_postings).options(
+        load_only(
+            models.JobPosting.id,
+            models.JobPosting.url,
+            models.JobPosting.job_title,
+            models.JobPosting.company_name,
+            models.JobPosting.location,
+            models.JobPosting.applied_at,
+            models.JobPosting.created_at,
+        ),
+        with_expression(
+            models.JobPosting.description_preview,
+            func.left(models.JobPosting.job_description, JOB_DESCRIPTION_PREVIEW_CHARS),
+        ),
+    )
+
 def get_user_with_relations(db: Session, user_id: uuid.UUID):
+    """The user plus the profile sections used for generation."""
     return (
         db.query(models.User)
         .filter(models.User.id == user_id)
-        .options(
-            joinedload(models.User.experiences),
-            joinedload(models.User.educations),
-            joinedload(models.User.skills),
-            joinedload(models.User.projects)
-        )
+        .options(*_profile_section_options())
         .first()
     )
 
@@ -71,4 +104,61 @@ def get_users(db: Session, skip: int = 0, limit: int = 100):
 
 # New function for authentication
 def get_user_by_email_with_password(db: Session, email: str):
-    return db.query(models.User).filter(models.User.email == email).first()
\ No newline at end of file
+    return db.query(models.User).filter(models.User.email == email).first()
+
+# --- Async versions, for endpoints running on the event loop ---
+
+async def get_user_by_email_async(db: AsyncSession, email: str):
+    result = await db.execute(select(models.User).filter(models.User.email == email))
+    return result.scalars().first()
+
+async def create_user_async(db: AsyncSession, user: schemas.UserCreate):
+    # bcrypt is CPU-bound; it runs in the password hasher's worker processes
+    hashed_password = await password_hasher.hash(user.password)
+    db_user = _build_user(user, hashed_password)
+    db.add(db_user)
+    await db.flush()
+
+    _add_user_relations(db, db_user, user)
+
+    await db.commit()
+    # Reload with relationships eagerly, since lazy loads are not allowed under asyncio
+    return await get_user_profile_async(db, db_user.id)
+
+async def get_user_async(db: AsyncSession, user_id: uuid.UUID):
+    result = await db.execute(select(models.User).filter(models.User.id == user_id))
+    return result.scalars().first()
+
+async def get_user_identity_async(db: AsyncSession, user_id: uuid.UUID):
+    """Only the columns auth needs; the password hash and profile text stay in the database."""
+    result = await db.execute(
+        select(models.User.id, models.User.email, models.User.name).where(models.User.id == user_id)
+    )
+    return result.first()
+
+async def get_user_with_relations_async(db: AsyncSession, user_id: uuid.UUID):
+    """The user plus the profile sections used for generation."""
+    result = await db.execute(
+        select(models.User)
+        .filter(models.User.id == user_id)
+        .options(*_profile_section_options())
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().first()
+
+async def get_user_profile_async(db: AsyncSession, user_id: uuid.UUID):
+    """Everything schemas.UserProfile serializes, in a fixed six queries."""
+    result = await db.execute(
+        select(models.User)
+        .filter(models.User.id == user_id)
+        .options(*_profile_section_options(), _job_posting_summary_options())
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().first()
+
+async def get_users_async(db: AsyncSession, skip: int = 0, limit: int = 100):
+    result = await db.execute(select(models.User).offset(skip).limit(limit))
+    return result.scalars().all()
+
+async def get_user_by_email_with_password_async(db: AsyncSession, email: str):
+    return await get_user_by_email_async(db, email)
@@ -1,25 +1,22 @@
 # In backend/app/db/create_tables.py
+"""
+Brings the database schema up to date by running the Alembic migrations.
+Kept so `python -m app.db.create_tables` still works; it is equivalent to
+`alembic upgrade head` run from backend/.
+"""
 import os
-from sqlalchemy import create_engine
-from ..models import Base
 
-# This line is crucial for loading your environment variables
-from dotenv import load_dotenv
-load_dotenv(os.path.join(os.path.dirname(os.path.dirname(__file__)), '..', '.env'))
+from alembic import command
+from alembic.config import Config
 
-# Use the DATABASE_URL from your .env file
-DATABASE_URL = os.getenv("DATABASE_URL")
-
-# Make sure the URL is not None before proceeding
-if DATABASE_URL is None:
-    raise ValueError("DATABASE_URL environment variable is not set.")
-
-engine = create_engine(DATABASE_URL)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 def create_tables():
-    print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
-    print("Tables created successfully!")
+    print("Applying database migrations...")
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    command.upgrade(config, "head")
+    print("Database is up to date!")
 
 if __name__ == "__main__":
-    create_tables()
\ No newline at end of file
+    create_tables()
@@ -2,9 +2,13 @@
 
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from ..core.config import settings
+
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(os.path.dirname(__file__)), '..', '.env'))
@@ -12,18 +16,52 @@ load_dotenv(os.path.join(os.path.dirname(os.path.dirname(__file__)), '..', '.env
 # Get the database URL from the environment variables
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# Same database through the asyncpg driver, for the async session
+ASYNC_DATABASE_URL = make_url(DATABASE_URL).set(drivername="postgresql+asyncpg")
+
+# Pool settings shared by both engines
+pool_options = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+)
+
 # Create a SQLAlchemy engine
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL, **pool_options)
 
 # Create a session local class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine and session used by the async endpoints
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **pool_options)
+
+# expire_on_commit=False so returned rows can still be serialized after commit
+# without an implicit (and, under asyncio, forbidden) lazy refresh.
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
+def pool_stats(db_engine) -> dict:
+    """Connection pool occupancy, for the metrics endpoint."""
+    pool = db_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
+
 # Dependency to get a database session
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# Dependency to get an async database session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
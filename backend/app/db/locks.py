@@ -0,0 +1,72 @@
+# In backend/app/db/locks.py
+
+import asyncio
+import hashlib
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+from sqlalchemy import text
+
+from ..core.config import settings
+from .database import engine, async_engine
+
+_POLL_INTERVAL_SECONDS = 0.2
+
+
+class AdvisoryLockTimeout(Exception):
+    """Raised when another process holds the advisory lock for too long."""
+
+
+def advisory_lock_id(key: str) -> int:
+    """Maps a string key onto the signed 64-bit key space of pg_advisory_lock."""
+    return int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest()[:8], "big", signed=True)
+
+
+def _try_lock(connection, lock_id: int) -> bool:
+    acquired = bool(connection.execute(text("SELECT pg_try_advisory_lock(:lock_id)"), {"lock_id": lock_id}).scalar())
+    # Session-level locks survive commit; committing avoids idling in a transaction.
+    connection.commit()
+    return acquired
+
+
+def _unlock(connection, lock_id: int) -> None:
+    connection.execute(text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": lock_id})
+    connection.commit()
+
+
+@contextmanager
+def advisory_lock(key: str, timeout: float = settings.ADVISORY_LOCK_TIMEOUT_SECONDS):
+    """
+    Holds a Postgres session-level advisory lock for `key` across processes.
+
+    The lock lives on a dedicated connection rather than the caller's Session,
+    because a Session hands its connection back to the pool on commit and the
+    lock would then leak with it.
+    """
+    lock_id = advisory_lock_id(key)
+    deadline = time.monotonic() + timeout
+    with engine.connect() as connection:
+        while not _try_lock(connection, lock_id):
+            if time.monotonic() >= deadline:
+                raise AdvisoryLockTimeout(f"Timed out waiting for advisory lock {key!r}")
+            time.sleep(_POLL_INTERVAL_SECONDS)
+        try:
+            yield
+        finally:
+            _unlock(connection, lock_id)
+
+
+@asynccontextmanager
+async def async_advisory_lock(key: str, timeout: float = settings.ADVISORY_LOCK_TIMEOUT_SECONDS):
+    """advisory_lock for async endpoints, on a connection from the async engine."""
+    lock_id = advisory_lock_id(key)
+    deadline = time.monotonic() + timeout
+    async with async_engine.connect() as connection:
+        while not await connection.run_sync(_try_lock, lock_id):
+            if time.monotonic() >= deadline:
+                raise AdvisoryLockTimeout(f"Timed out waiting for advisory lock {key!r}")
+            await asyncio.sleep(_POLL_INTERVAL_SECONDS)
+        try:
+            yield
+        finally:
+            await connection.run_sync(_unlock, lock_id)
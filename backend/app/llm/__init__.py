@@ -0,0 +1,21 @@
+# In backend/app/llm/__init__.py
+from .base import LLMProvider, LLMResponse, LLMError, LLMTimeout, LLMUnavailable
+from .client import LLMClient
+from .resilience import CircuitBreaker
+from ..core.config import settings
+
+
+def create_provider() -> LLMProvider:
+    """The provider named by LLM_PROVIDER: "gemini" (the default) or "stub"."""
+    if settings.LLM_PROVIDER == "stub":
+        from .stub import StubProvider
+        return StubProvider(latency_seconds=settings.LLM_STUB_LATENCY_MS / 1000)
+    if settings.LLM_PROVIDER == "gemini":
+        from .gemini import GeminiProvider
+        return GeminiProvider(
+            api_key=settings.GEMINI_API_KEY,
+            base_url=settings.LLM_BASE_URL,
+            max_connections=settings.LLM_MAX_CONNECTIONS,
+            connect_timeout=settings.LLM_CONNECT_TIMEOUT_SECONDS,
+        )
+    raise ValueError(f"Unknown LLM_PROVIDER: {settings.LLM_PROVIDER!r}")
@@ -0,0 +1,59 @@
+# In backend/app/llm/base.py
+
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+
+@dataclass
+class LLMResponse:
+    """A completion, or one streamed chunk of it. Token counts are None when the provider did not report them."""
+    text: str
+    model: str
+    prompt_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    finish_reason: Optional[str] = None
+
+
+class LLMError(Exception):
+    """A failed LLM call. `retryable` marks upstream failures worth another attempt."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retryable: bool = False, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+class LLMTimeout(LLMError):
+    def __init__(self, message: str = "LLM call exceeded its deadline"):
+        super().__init__(message, retryable=True)
+
+
+class LLMUnavailable(LLMError):
+    """Raised without calling the provider while the circuit breaker is open."""
+
+    def __init__(self, retry_after: Optional[float] = None):
+        super().__init__("LLM provider is unavailable (circuit open)", status_code=503, retry_after=retry_after)
+
+
+class LLMProvider:
+    """
+    One LLM backend. Implementations make a single attempt per call and raise
+    LLMError on failure; deadlines, retries, hedging and the circuit breaker
+    are handled by LLMClient.
+    """
+
+    name = "base"
+
+    async def generate(
+        self, prompt: str, model: str, max_output_tokens: Optional[int] = None, response_schema: Optional[dict] = None,
+    ) -> LLMResponse:
+        raise NotImplementedError
+
+    def stream(
+        self, prompt: str, model: str, max_output_tokens: Optional[int] = None, response_schema: Optional[dict] = None,
+    ) -> AsyncIterator[LLMResponse]:
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        pass
@@ -0,0 +1,345 @@
+# In backend/app/llm/client.py
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import AsyncIterator, Callable, Optional
+
+from .base import LLMError, LLMProvider, LLMResponse, LLMTimeout, LLMUnavailable
+from .resilience import CircuitBreaker, backoff_delay
+from ..core.metrics import LLM_REQUEST_SECONDS
+from ..core.ratelimit import AsyncTokenBucket
+from ..logging_config import api_logger
+
+_END_OF_STREAM = object()
+
+
+class LLMClient:
+    """
+    Process-wide LLM client. Every call, from async handlers, sync handlers
+    or the generation worker, runs on one background event loop that owns
+    the provider, so they all share its connection pool, the rate limiter
+    and the circuit breaker.
+
+    Each call gets a deadline covering all of its attempts. Retryable
+    failures (timeouts, 429, 5xx, connection errors) are retried with
+    jittered exponential backoff while the deadline allows. With
+    `hedge_after` set, a second identical request is sent when the first
+    has not answered in that time and the first answer wins.
+    """
+
+    def __init__(
+        self,
+        provider_factory: Callable[[], LLMProvider],
+        default_model: str,
+        rate_limiter: AsyncTokenBucket,
+        breaker: CircuitBreaker,
+        timeout: float,
+        attempt_timeout: float,
+        max_retries: int,
+        backoff_base: float,
+        backoff_max: float,
+        hedge_after: float = 0.0,
+    ):
+        self.provider_factory = provider_factory
+        self.default_model = default_model
+        self.rate_limiter = rate_limiter
+        self.breaker = breaker
+        self.timeout = timeout
+        self.attempt_timeout = attempt_timeout
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.hedge_after = hedge_after
+
+        self._provider: Optional[LLMProvider] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        self.calls = 0
+        self.attempts = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    # Lifecycle
+
+    def start(self) -> None:
+        """Starts the client's event loop thread; called lazily by the first request."""
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            self._provider = self.provider_factory()
+            loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=loop.run_forever, name="llm-client", daemon=True)
+            self._thread.start()
+            self._loop = loop
+            api_logger.info({"message": "LLM client started", "provider": self._provider.name, "model": self.default_model})
+
+    async def aclose(self) -> None:
+        with self._start_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._provider.aclose(), loop))
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=5)
+        loop.close()
+
+    def _submit(self, coroutine) -> Future:
+        if self._loop is None:
+            self.start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    # Public API
+
+    async def generate(
+        self, prompt: str, model: Optional[str] = None, max_output_tokens: Optional[int] = None,
+        timeout: Optional[float] = None, mode: str = "async", response_schema: Optional[dict] = None,
+    ) -> LLMResponse:
+        return await asyncio.wrap_future(
+            self._submit(self._generate(prompt, model or self.default_model, max_output_tokens, response_schema, timeout, mode))
+        )
+
+    def generate_sync(
+        self, prompt: str, model: Optional[str] = None, max_output_tokens: Optional[int] = None,
+        timeout: Optional[float] = None, response_schema: Optional[dict] = None,
+    ) -> LLMResponse:
+        """Blocking generate() for sync callers (threadpool handlers, the generation worker)."""
+        return self.submit(prompt, model, max_output_tokens, timeout, response_schema).result()
+
+    def submit(
+        self, prompt: str, model: Optional[str] = None, max_output_tokens: Optional[int] = None,
+        timeout: Optional[float] = None, response_schema: Optional[dict] = None,
+    ) -> Future:
+        """Starts a call without waiting for it, so sync callers can run several at once."""
+        return self._submit(self._generate(prompt, model or self.default_model, max_output_tokens, response_schema, timeout, "sync"))
+
+    async def stream(
+        self, prompt: str, model: Optional[str] = None, max_output_tokens: Optional[int] = None,
+        timeout: Optional[float] = None, response_schema: Optional[dict] = None,
+    ) -> AsyncIterator[LLMResponse]:
+        """
+        Streams chunks back to the caller's event loop. A failure before the
+        first chunk is retried like generate(); once text has been delivered
+        errors are raised to the caller.
+        """
+        caller_loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+
+        def put(item):
+            caller_loop.call_soon_threadsafe(chunks.put_nowait, item)
+
+        async def produce():
+            try:
+                async for chunk in self._stream(prompt, model or self.default_model, max_output_tokens, response_schema, timeout):
+                    put(chunk)
+                put(_END_OF_STREAM)
+            except Exception as e:
+                put(e)
+
+        future = self._submit(produce())
+        try:
+            while True:
+                item = await chunks.get()
+                if item is _END_OF_STREAM:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Stops the upstream request when the consumer goes away early
+            future.cancel()
+
+    def stats(self) -> dict:
+        return {
+            "provider": self._provider.name if self._provider else None,
+            "calls": self.calls,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            **{f"breaker_{key}": value for key, value in self.breaker.stats().items()},
+        }
+
+    # Running on the client's loop
+
+    def _remaining(self, deadline: float) -> float:
+        return deadline - time.monotonic()
+
+    async def _generate(self, prompt, model, max_output_tokens, response_schema, timeout, mode) -> LLMResponse:
+        self.calls += 1
+        deadline = time.monotonic() + (timeout or self.timeout)
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            attempt = 0
+            while True:
+                self._check_breaker()
+                try:
+                    response = await self._attempt_with_hedge(prompt, model, max_output_tokens, response_schema, deadline)
+                except LLMError as e:
+                    delay = self._after_failure(e, attempt, deadline, model, mode)
+                    if delay is None:
+                        outcome = "timeout" if isinstance(e, LLMTimeout) else "error"
+                        raise
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                    continue
+                except asyncio.CancelledError:
+                    self.breaker.cancel_trial()
+                    raise
+                except Exception:
+                    # A bug or unexpected payload still has to free a half-open trial
+                    self.breaker.record_failure()
+                    self.failures += 1
+                    raise
+                self.breaker.record_success()
+                outcome = "ok"
+                return response
+        except LLMUnavailable:
+            outcome = "circuit_open"
+            raise
+        finally:
+            LLM_REQUEST_SECONDS.labels(model, mode, outcome).observe(time.perf_counter() - started)
+
+    async def _stream(self, prompt, model, max_output_tokens, response_schema, timeout) -> AsyncIterator[LLMResponse]:
+        self.calls += 1
+        deadline = time.monotonic() + (timeout or self.timeout)
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            attempt = 0
+            while True:
+                self._check_breaker()
+                delivered = False
+                try:
+                    await self._acquire(deadline)
+                    self.attempts += 1
+                    chunks = self.provider.stream(prompt, model, max_output_tokens, response_schema).__aiter__()
+                    try:
+                        while True:
+                            try:
+                                chunk = await asyncio.wait_for(chunks.__anext__(), self._remaining(deadline))
+                            except StopAsyncIteration:
+                                break
+                            except asyncio.TimeoutError:
+                                self.timeouts += 1
+                                raise LLMTimeout()
+                            delivered = True
+                            yield chunk
+                    finally:
+                        await chunks.aclose()
+                except LLMError as e:
+                    # Text that already reached the caller cannot be taken back, so no retry then
+                    delay = self._after_failure(e, attempt, deadline, model, "stream", can_retry=not delivered)
+                    if delay is None:
+                        outcome = "timeout" if isinstance(e, LLMTimeout) else "error"
+                        raise
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                    continue
+                except (asyncio.CancelledError, GeneratorExit):
+                    self.breaker.cancel_trial()
+                    raise
+                except Exception:
+                    self.breaker.record_failure()
+                    self.failures += 1
+                    raise
+                self.breaker.record_success()
+                outcome = "ok"
+                return
+        except LLMUnavailable:
+            outcome = "circuit_open"
+            raise
+        finally:
+            # Includes the time the consumer spends between chunks
+            LLM_REQUEST_SECONDS.labels(model, "stream", outcome).observe(time.perf_counter() - started)
+
+    @property
+    def provider(self) -> LLMProvider:
+        return self._provider
+
+    def _check_breaker(self) -> None:
+        if not self.breaker.allow():
+            raise LLMUnavailable(retry_after=self.breaker.retry_after())
+
+    def _after_failure(
+        self, error: LLMError, attempt: int, deadline: float, model: str, mode: str, can_retry: bool = True,
+    ) -> Optional[float]:
+        """Records a failed attempt; returns the backoff before the next one, or None to give up."""
+        if error.retryable:
+            self.breaker.record_failure()
+        else:
+            # The upstream answered; the request itself was the problem
+            self.breaker.record_success()
+        delay = backoff_delay(attempt, self.backoff_base, self.backoff_max, error.retry_after)
+        if not (can_retry and error.retryable) or attempt >= self.max_retries or delay >= self._remaining(deadline):
+            self.failures += 1
+            return None
+        self.retries += 1
+        api_logger.warning({
+            "message": "Retrying LLM call",
+            "model": model,
+            "mode": mode,
+            "attempt": attempt + 1,
+            "status_code": error.status_code,
+            "error": str(error),
+            "backoff_seconds": round(delay, 3),
+        })
+        return delay
+
+    async def _acquire(self, deadline: float) -> None:
+        try:
+            await asyncio.wait_for(self.rate_limiter.acquire(), max(0.0, self._remaining(deadline)))
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise LLMTimeout("LLM call deadline passed while waiting for the rate limiter")
+
+    async def _attempt(self, prompt, model, max_output_tokens, response_schema, deadline) -> LLMResponse:
+        await self._acquire(deadline)
+        remaining = min(self.attempt_timeout, self._remaining(deadline))
+        if remaining <= 0:
+            raise LLMTimeout()
+        self.attempts += 1
+        try:
+            return await asyncio.wait_for(self.provider.generate(prompt, model, max_output_tokens, response_schema), remaining)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise LLMTimeout()
+
+    async def _attempt_with_hedge(self, prompt, model, max_output_tokens, response_schema, deadline) -> LLMResponse:
+        # Hedging doubles load, so it is skipped while the upstream is already failing
+        if not self.hedge_after or self.breaker.state != CircuitBreaker.CLOSED:
+            return await self._attempt(prompt, model, max_output_tokens, response_schema, deadline)
+
+        primary = asyncio.ensure_future(self._attempt(prompt, model, max_output_tokens, response_schema, deadline))
+        pending = {primary}
+        error = None
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.hedge_after)
+            if done:
+                return primary.result()
+
+            self.hedges += 1
+            hedge = asyncio.ensure_future(self._attempt(prompt, model, max_output_tokens, response_schema, deadline))
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                results = [(task, task.exception()) for task in done]
+                for task, exception in results:
+                    if exception is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = exception
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
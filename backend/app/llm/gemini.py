@@ -0,0 +1,126 @@
+# In backend/app/llm/gemini.py
+
+import json
+from typing import AsyncIterator, Optional
+
+import httpx
+
+from .base import LLMError, LLMProvider, LLMResponse
+
+# Statuses that mean "try again later" rather than "this request is wrong"
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class GeminiProvider(LLMProvider):
+    """
+    Gemini over its REST API (generateContent / streamGenerateContent) on one
+    pooled httpx client, so calls reuse TLS connections instead of building
+    a GenerativeModel per request. `base_url` can point at a stub server.
+    """
+
+    name = "gemini"
+
+    def __init__(self, api_key: str, base_url: str, max_connections: int, connect_timeout: float):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self._client = httpx.AsyncClient(
+            headers={"x-goog-api-key": api_key, "Content-Type": "application/json"},
+            # Per-call deadlines are enforced by LLMClient; only connecting has its own limit
+            timeout=httpx.Timeout(None, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    def _body(self, prompt: str, max_output_tokens: Optional[int], response_schema: Optional[dict]) -> dict:
+        body = {"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
+        generation_config = {}
+        if max_output_tokens:
+            generation_config["maxOutputTokens"] = max_output_tokens
+        if response_schema:
+            # Constrained decoding: the reply is JSON matching the schema, never prose or fences
+            generation_config["responseMimeType"] = "application/json"
+            generation_config["responseSchema"] = response_schema
+        if generation_config:
+            body["generationConfig"] = generation_config
+        return body
+
+    async def generate(
+        self, prompt: str, model: str, max_output_tokens: Optional[int] = None, response_schema: Optional[dict] = None,
+    ) -> LLMResponse:
+        try:
+            response = await self._client.post(
+                f"{self.base_url}/v1beta/models/{model}:generateContent",
+                json=self._body(prompt, max_output_tokens, response_schema),
+            )
+        except httpx.HTTPError as e:
+            raise LLMError(f"Gemini request failed: {e!r}", retryable=True) from e
+        _raise_for_status(response)
+        try:
+            return _to_response(response.json(), model, require_text=True)
+        except LLMError:
+            raise
+        except (ValueError, TypeError, AttributeError, KeyError, IndexError) as e:
+            raise _unreadable(e) from e
+
+    async def stream(
+        self, prompt: str, model: str, max_output_tokens: Optional[int] = None, response_schema: Optional[dict] = None,
+    ) -> AsyncIterator[LLMResponse]:
+        try:
+            async with self._client.stream(
+                "POST",
+                f"{self.base_url}/v1beta/models/{model}:streamGenerateContent",
+                params={"alt": "sse"},
+                json=self._body(prompt, max_output_tokens, response_schema),
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    _raise_for_status(response)
+                async for line in response.aiter_lines():
+                    if line.startswith("data:"):
+                        try:
+                            chunk = _to_response(json.loads(line[5:]), model, require_text=False)
+                        except (ValueError, TypeError, AttributeError, KeyError, IndexError) as e:
+                            raise _unreadable(e) from e
+                        yield chunk
+        except httpx.HTTPError as e:
+            raise LLMError(f"Gemini stream failed: {e!r}", retryable=True) from e
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def _unreadable(error: Exception) -> LLMError:
+    # A 200 whose body is not the expected JSON, e.g. an error page from a proxy in between
+    return LLMError(f"Gemini returned an unreadable response: {error!r}", retryable=True)
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    if response.status_code == 200:
+        return
+    retry_after = response.headers.get("Retry-After")
+    try:
+        message = response.json()["error"]["message"]
+    except Exception:
+        message = response.text[:200]
+    raise LLMError(
+        f"Gemini returned {response.status_code}: {message}",
+        status_code=response.status_code,
+        retryable=response.status_code in RETRYABLE_STATUS_CODES,
+        retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+    )
+
+
+def _to_response(payload: dict, model: str, require_text: bool) -> LLMResponse:
+    candidates = payload.get("candidates") or []
+    parts = (candidates[0].get("content") or {}).get("parts", []) if candidates else []
+    text = "".join(part.get("text", "") for part in parts)
+    if require_text and not candidates:
+        # Blocked prompts come back as 200 with promptFeedback and no candidates
+        raise LLMError(f"Gemini returned no candidates: {payload.get('promptFeedback')}")
+    usage = payload.get("usageMetadata") or {}
+    return LLMResponse(
+        text=text,
+        model=model,
+        prompt_tokens=usage.get("promptTokenCount"),
+        output_tokens=usage.get("candidatesTokenCount"),
+        finish_reason=candidates[0].get("finishReason") if candidates else None,
+    )
@@ -0,0 +1,79 @@
+# In backend/app/llm/resilience.py
+
+import random
+import time
+from typing import Optional
+
+
+def backoff_delay(attempt: int, base: float, cap: float, retry_after: Optional[float] = None) -> float:
+    """
+    Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)],
+    so callers that failed together do not retry together. A provider's
+    Retry-After is honoured as a lower bound.
+    """
+    delay = random.uniform(0, min(cap, base * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive upstream failures and rejects
+    calls for `reset_timeout` seconds. After that one trial call is let
+    through (half-open): success closes the circuit, failure reopens it.
+    Only used from the LLM client's event loop, so it needs no locking.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.opened = 0
+        self.rejected = 0
+
+    def retry_after(self) -> float:
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN and self.retry_after() == 0:
+            self.state = self.HALF_OPEN
+        if self.state == self.CLOSED or (self.state == self.HALF_OPEN and not self._trial_in_flight):
+            if self.state == self.HALF_OPEN:
+                self._trial_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.opened += 1
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def cancel_trial(self) -> None:
+        """Frees the half-open slot when the trial call was abandoned before it finished."""
+        self._trial_in_flight = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
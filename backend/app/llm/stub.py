@@ -0,0 +1,63 @@
+# In backend/app/llm/stub.py
+
+import asyncio
+import json
+from typing import AsyncIterator, Optional
+
+from .base import LLMProvider, LLMResponse
+from ..services.prompt_payload import estimate_tokens
+
+
+# Canned sections sized roughly like real ones (~800, ~400 and ~80 tokens)
+STUB_SECTIONS = {
+    "resume": "Summary\n\n" + "Experienced engineer with a record of shipping reliable services. " * 50,
+    "cover_letter": "Dear Hiring Manager,\n\n" + "I am excited to apply for this role. " * 40 + "\n\nSincerely,",
+    "generated_email_template": "Hello,\n\n" + "Please find my resume and cover letter attached for your consideration. " * 4 + "\n\nBest regards,",
+}
+
+# How the section prompts in services/sections.py end
+_SECTION_PROMPT_MARKERS = {
+    "Return only the resume text": "resume",
+    "Return only the cover letter text": "cover_letter",
+    "Return only the email text": "generated_email_template",
+}
+
+
+def stub_application_text(prompt: str) -> str:
+    """Plain text for a single-section prompt, otherwise the whole application as JSON."""
+    for marker, section in _SECTION_PROMPT_MARKERS.items():
+        if marker in prompt:
+            return STUB_SECTIONS[section]
+    return json.dumps(STUB_SECTIONS)
+
+
+class StubProvider(LLMProvider):
+    """
+    In-process stand-in for local development and tests: answers every prompt
+    with a canned application after `latency_seconds`, without network access.
+    """
+
+    name = "stub"
+
+    def __init__(self, latency_seconds: float = 0.0, chunk_size: int = 200):
+        self.latency_seconds = latency_seconds
+        self.chunk_size = chunk_size
+
+    async def generate(
+        self, prompt: str, model: str, max_output_tokens: Optional[int] = None, response_schema: Optional[dict] = None,
+    ) -> LLMResponse:
+        await asyncio.sleep(self.latency_seconds)
+        text = stub_application_text(prompt)
+        return LLMResponse(text, model, estimate_tokens(prompt), estimate_tokens(text), "STOP")
+
+    async def stream(
+        self, prompt: str, model: str, max_output_tokens: Optional[int] = None, response_schema: Optional[dict] = None,
+    ) -> AsyncIterator[LLMResponse]:
+        text = stub_application_text(prompt)
+        chunks = [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)]
+        for index, chunk in enumerate(chunks):
+            await asyncio.sleep(self.latency_seconds / len(chunks))
+            if index == len(chunks) - 1:
+                yield LLMResponse(chunk, model, estimate_tokens(prompt), estimate_tokens(text), "STOP")
+            else:
+                yield LLMResponse(chunk, model)
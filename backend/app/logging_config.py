@@ -1,7 +1,103 @@
 # backend/app/logging_config.py
+import atexit
+import copy
 import logging
-from pythonjsonlogger import jsonlogger
+import logging.handlers
 import os
+import queue
+import random
+import threading
+from pythonjsonlogger import jsonlogger
+
+from .core.config import settings
+
+
+class BatchingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that buffers formatted records and writes them in one
+    call once `batch_size` records are waiting or `flush_interval` seconds
+    have passed, rotating between batches when the file would outgrow
+    `maxBytes`.
+    """
+
+    def __init__(self, filename, max_bytes, backup_count, batch_size, flush_interval):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self.batch_size = max(1, batch_size)
+        self._buffer = []
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, args=(flush_interval,), daemon=True)
+        self._flusher.start()
+
+    def emit(self, record):
+        try:
+            self._buffer.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+        if len(self._buffer) >= self.batch_size:
+            self._write_batch()
+
+    def _write_batch(self):
+        if not self._buffer:
+            return
+        data = "".join(self._buffer)
+        self._buffer.clear()
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.stream.tell() > 0 and self.stream.tell() + len(data) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(data)
+            self.stream.flush()
+        except Exception:
+            self.handleError(None)
+
+    def _flush_periodically(self, interval):
+        while not self._stop_flushing.wait(interval):
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            self._write_batch()
+
+    def close(self):
+        self._stop_flushing.set()
+        self.flush()
+        super().close()
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that never blocks the caller: when the queue is full the
+    record is dropped and counted. Dict messages are passed through as-is
+    so the JSON formatter on the listener side still sees their fields.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        return copy.copy(record)
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def stats(self) -> dict:
+        return {"queued": self.queue.qsize(), "max_queued": self.queue.maxsize, "dropped": self.dropped}
+
+
+class DrainingQueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() waits for room in a full queue instead of failing."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
 
 def setup_logging():
     # Define the log file path
@@ -13,27 +109,58 @@ def setup_logging():
     # Set up the logger
     logger = logging.getLogger('api_logger')
     logger.setLevel(logging.INFO)
+    if logger.handlers:
+        return logger
 
-    # Create a handler to write logs to a file
-    file_handler = logging.FileHandler(log_file_path)
-
-    # Use a custom formatter for JSON output
-    formatter = jsonlogger.JsonFormatter(
-        '%(asctime)s %(levelname)s %(name)s %(message)s'
+    # File output: JSON lines, batched and rotated by size
+    file_handler = BatchingRotatingFileHandler(
+        log_file_path,
+        max_bytes=settings.LOG_FILE_MAX_BYTES,
+        backup_count=settings.LOG_FILE_BACKUP_COUNT,
+        batch_size=settings.LOG_BATCH_SIZE,
+        flush_interval=settings.LOG_FLUSH_INTERVAL_SECONDS,
     )
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(jsonlogger.JsonFormatter(
+        '%(asctime)s %(levelname)s %(name)s %(message)s'
+    ))
+    handlers = [file_handler]
 
-    # Add the handler to the logger
-    if not logger.handlers:
-        logger.addHandler(file_handler)
-    
     # Optional: Also log to console for development
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-    if not any(isinstance(h, logging.StreamHandler) for h in logger.handlers):
-        logger.addHandler(console_handler)
+    if settings.LOG_CONSOLE:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        handlers.append(console_handler)
+
+    # Callers only enqueue; formatting and disk writes happen on the listener thread
+    log_queue = queue.Queue(maxsize=settings.LOG_QUEUE_MAX_SIZE)
+    logger.addHandler(NonBlockingQueueHandler(log_queue))
+    listener = DrainingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    def stop_listener():
+        # Drain the queue, then write out whatever the file handler still buffers
+        listener.stop()
+        for handler in handlers:
+            handler.close()
+
+    atexit.register(stop_listener)
 
     return logger
 
+
+def sample_access_log(status_code: int, process_time_ms: int) -> bool:
+    """Whether to write the access log line for a request: errors and slow requests always are."""
+    if status_code >= 400 or process_time_ms >= settings.LOG_ACCESS_SLOW_MS:
+        return True
+    return random.random() < settings.LOG_ACCESS_SAMPLE_RATE
+
+
+def log_queue_stats() -> dict:
+    for handler in api_logger.handlers:
+        if isinstance(handler, NonBlockingQueueHandler):
+            return handler.stats()
+    return {}
+
+
 # Create a logger instance that can be imported and used
-api_logger = setup_logging()
\ No newline at end of file
+api_logger = setup_logging()
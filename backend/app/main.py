@@ -1,11 +1,52 @@
 # In backend/app/main.py
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from .api.endpoints import api_router
-from .logging_config import api_logger  # Import the logger
+from .logging_config import api_logger, sample_access_log, log_queue_stats  # Import the logger
+from .scraping.browser_pool import BrowserPool
+from .scraping.http_client import create_http_client
+from .core.security import password_hasher, gemini_rate_limiter, llm_client
+from .core.metrics import HTTP_REQUEST_SECONDS, route_label, stats_collector
+from .core.principal_cache import principal_cache
+from .db.database import engine, async_engine, pool_stats
+from .scraping.cache import scrape_cache
+from .services.generation_cache import generation_cache
+from .services.structured_output import structured_output_stats
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from contextlib import asynccontextmanager
 import time
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One browser pool for the whole process instead of a Chromium launch per scrape
+    browser_pool = BrowserPool()
+    await browser_pool.start()
+    app.state.browser_pool = browser_pool
+    app.state.http_client = create_http_client()
+    await password_hasher.start()
+    stats_collector.register("browser_pool", browser_pool.stats)
+    try:
+        yield
+    finally:
+        stats_collector.unregister("browser_pool")
+        await password_hasher.stop()
+        await llm_client.aclose()
+        await app.state.http_client.aclose()
+        await browser_pool.stop()
+
+app = FastAPI(lifespan=lifespan)
+
+# Process-wide stats exported as gauges on /metrics
+stats_collector.register("db_pool", lambda: pool_stats(engine))
+stats_collector.register("db_async_pool", lambda: pool_stats(async_engine))
+stats_collector.register("scrape_cache", scrape_cache.stats)
+stats_collector.register("generation_cache", generation_cache.stats)
+stats_collector.register("principal_cache", principal_cache.stats)
+stats_collector.register("password_hasher", password_hasher.stats)
+stats_collector.register("gemini_rate_limiter", gemini_rate_limiter.stats)
+stats_collector.register("llm_client", llm_client.stats)
+stats_collector.register("structured_output", structured_output_stats.stats)
+stats_collector.register("log_queue", log_queue_stats)
 
 # Configure CORS middleware
 origins = [
@@ -28,18 +69,23 @@ async def log_requests(request: Request, call_next):
     try:
         response = await call_next(request)
         process_time = time.time() - start_time
-        api_logger.info(
-            {
-                "message": "API Request Handled",
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "process_time_ms": int(process_time * 1000)
-            }
-        )
+        process_time_ms = int(process_time * 1000)
+        # The route template, not the raw path, keeps label cardinality bounded
+        HTTP_REQUEST_SECONDS.labels(request.method, route_label(request.scope), str(response.status_code)).observe(process_time)
+        if sample_access_log(response.status_code, process_time_ms):
+            api_logger.info(
+                {
+                    "message": "API Request Handled",
+                    "method": request.method,
+                    "path": request.url.path,
+                    "status_code": response.status_code,
+                    "process_time_ms": process_time_ms
+                }
+            )
         return response
     except Exception as e:
         process_time = time.time() - start_time
+        HTTP_REQUEST_SECONDS.labels(request.method, route_label(request.scope), "500").observe(process_time)
         api_logger.error(
             {
                 "message": "API Request Failed",
@@ -54,6 +100,11 @@ async def log_requests(request: Request, call_next):
 # Add the main API router
 app.include_router(api_router, prefix="/api")
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus text exposition of this process's metrics."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
 @app.get("/")
 def read_root():
     return {"Hello": "World"}
\ No newline at end of file
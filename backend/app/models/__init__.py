@@ -6,4 +6,6 @@ from .educations import Education
 from .projects import Project
 from .skills import Skill
 from .job_postings import JobPosting
-from .application import Application
\ No newline at end of file
+from .application import Application
+from .generation_job import GenerationJob
+from .application_revision import ApplicationRevision
@@ -1,6 +1,6 @@
 # In backend/app/models/application.py
 from datetime import datetime
-from sqlalchemy import UUID, Column, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import UUID, Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from .base import Base
 
@@ -9,11 +9,18 @@ class Application(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
-    job_posting_id = Column(Integer, ForeignKey("job_postings.id"))
+    job_posting_id = Column(Integer, ForeignKey("job_postings.id"), index=True)
     generated_resume_text = Column(Text)
     generated_cover_letter_text = Column(Text)
     generated_email_template = Column(Text)
     generated_at = Column(DateTime, default=datetime.utcnow)
+    # SHA-256 of the normalized generation inputs, used by the generation cache
+    generation_fingerprint = Column(String(64), index=True)
 
     user = relationship("User", back_populates="applications")
-    job_posting = relationship("JobPosting", back_populates="applications")
\ No newline at end of file
+    job_posting = relationship("JobPosting", back_populates="applications")
+
+    __table_args__ = (
+        # A user's applications, newest first (keyset pagination on generated_at, id)
+        Index("ix_applications_user_id_generated_at_id", "user_id", "generated_at", "id"),
+    )
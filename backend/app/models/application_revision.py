@@ -0,0 +1,21 @@
+# In backend/app/models/application_revision.py
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from .base import Base
+
+class ApplicationRevision(Base):
+    """The text a section held before it was regenerated in place."""
+    __tablename__ = "application_revisions"
+
+    id = Column(Integer, primary_key=True)
+    application_id = Column(Integer, ForeignKey("applications.id"), nullable=False)
+    # resume | cover_letter | email
+    section = Column(String(32), nullable=False)
+    previous_text = Column(Text)
+    # What the user asked to change, if anything, and the model that wrote the replacement
+    instructions = Column(Text)
+    model = Column(String)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # An application's history, newest first
+    __table_args__ = (Index("ix_application_revisions_application_id_created_at", "application_id", "created_at"),)
@@ -6,7 +6,7 @@ from .base import Base
 class Education(Base):
     __tablename__ = "educations"
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True)
     institution_name = Column(String)
     degree = Column(String)
     field_of_study = Column(String)
@@ -6,7 +6,7 @@ from .base import Base
 class Experience(Base):
     __tablename__ = "experiences"
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True)
     company_name = Column(String)
     title = Column(String)
     start_date = Column(Date)
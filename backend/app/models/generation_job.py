@@ -0,0 +1,24 @@
+# In backend/app/models/generation_job.py
+from datetime import datetime
+import uuid
+from sqlalchemy import UUID, Boolean, Column, Integer, String, Text, DateTime, ForeignKey, Index
+from .base import Base
+
+class GenerationJob(Base):
+    __tablename__ = "generation_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    job_posting_id = Column(Integer, ForeignKey("job_postings.id"), nullable=False)
+    # queued -> running -> succeeded | failed
+    status = Column(String, nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    force_regenerate = Column(Boolean, nullable=False, default=False)
+    application_id = Column(Integer, ForeignKey("applications.id"))
+    error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+    # Workers claim the oldest queued job, so keep that lookup on an index.
+    __table_args__ = (Index("ix_generation_jobs_status_created_at", "status", "created_at"),)
@@ -1,17 +1,34 @@
 # In backend/app/models/job_postings.py
-from sqlalchemy import UUID, Column, Integer, String, Text, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from sqlalchemy import UUID, Column, Integer, String, Text, DateTime, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, query_expression
 from .base import Base
 
 class JobPosting(Base):
     __tablename__ = "job_postings"
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
-    url = Column(String, unique=True)
+    # Canonical posting URL (see scraping.urls); unique per user, not globally,
+    # so several users can save the same posting.
+    url = Column(String, index=True)
     job_title = Column(String)
     company_name = Column(String)
     location = Column(String)
     job_description = Column(Text)
+    # The description without boilerplate, as summary/responsibilities/requirements lists
+    # (scraping.description), built once at scrape time and sent to the LLM instead
+    job_description_compact = Column(JSONB)
     applied_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    # Filled only by queries that ask for it (see crud.users.get_user_profile_async),
+    # so listings can show a snippet without loading the full description.
+    description_preview = query_expression()
     user = relationship("User", back_populates="job_postings")
-    applications = relationship("Application", back_populates="job_posting")
\ No newline at end of file
+    applications = relationship("Application", back_populates="job_posting")
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "url", name="uq_job_postings_user_id_url"),
+        # A user's postings, newest first (keyset pagination on id)
+        Index("ix_job_postings_user_id_id", "user_id", "id"),
+    )
\ No newline at end of file
@@ -6,7 +6,7 @@ from .base import Base
 class Project(Base):
     __tablename__ = "projects"
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True)
     name = Column(String)
     description = Column(Text)
     github_url = Column(String)
@@ -6,7 +6,7 @@ from .base import Base
 class Skill(Base):
     __tablename__ = "skills"
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True)
     name = Column(String)
     category = Column(String)
     user = relationship("User", back_populates="skills")
\ No newline at end of file
@@ -10,7 +10,8 @@ from .base import Base
 class User(Base):
     __tablename__ = "users"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    # No separate unique=True: Postgres folds UNIQUE(id) into the primary key anyway
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     email = Column(String, unique=True, index=True, nullable=False)
     password_hash = Column(String, nullable=False) # New field for storing the hashed password
     name = Column(String)
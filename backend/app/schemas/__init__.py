@@ -1,8 +1,9 @@
 # In backend/app/schemas/__init__.py
-from .user import UserBase, UserCreate, UserUpdate, UserInDB, User, Token
-from .application import ApplicationCreate, ApplicationInDB, CoverLetterRequest
+from .user import UserBase, UserCreate, UserUpdate, UserInDB, User, UserProfile, Token
+from .application import ApplicationCreate, ApplicationInDB, ApplicationSummary, ApplicationPage, CoverLetterRequest, ApplicationBatchGenerateRequest, ApplicationGenerateResult, ApplicationBatchGenerateResponse, ApplicationRegenerateRequest, ApplicationRevisionInDB
 from .educations import EducationBase, EducationInDB, EducationCreate
 from .projects import ProjectBase, ProjectInDB, ProjectCreate
 from .skills import SkillBase, SkillInDB, SkillCreate
-from .job_postings import JobPostingBase, JobPostingCreate, JobPostingInDB, JobScrapeRequest, JobPosting
-from .experiences import ExperienceBase, ExperienceCreate, ExperienceInDB
\ No newline at end of file
+from .job_postings import JobPostingBase, JobPostingCreate, JobPostingInDB, JobScrapeRequest, JobPosting, JobPostingSummary, JobPostingPage, JobBatchScrapeRequest, JobScrapeResult, JobBatchScrapeResponse
+from .experiences import ExperienceBase, ExperienceCreate, ExperienceInDB
+from .generation_job import GenerationJobInDB
\ No newline at end of file
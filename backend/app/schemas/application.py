@@ -1,7 +1,8 @@
 # In backend/app/schemas/application.py
 
 from datetime import datetime
-from pydantic import BaseModel, HttpUrl
+from typing import List, Literal, Optional, Union
+from pydantic import BaseModel, Field, HttpUrl
 import uuid
 
 class ApplicationBase(BaseModel):
@@ -21,5 +22,53 @@ class ApplicationInDB(ApplicationBase):
     class Config:
         from_attributes = True # Change this from orm_mode = True
 
+class ApplicationSummary(BaseModel):
+    """An application listed without its generated text, with its posting's headline."""
+    id: int
+    job_posting_id: int
+    generated_at: datetime
+    job_title: Optional[str] = None
+    company_name: Optional[str] = None
+    location: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+class ApplicationPage(BaseModel):
+    items: List[Union[ApplicationInDB, ApplicationSummary]]
+    next_cursor: Optional[str] = None
+
 class CoverLetterRequest(BaseModel):
-    job_url: str
\ No newline at end of file
+    job_url: str
+
+class ApplicationBatchGenerateRequest(BaseModel):
+    job_posting_ids: List[int] = Field(..., min_length=1)
+    force_regenerate: bool = False
+
+class ApplicationGenerateResult(BaseModel):
+    job_posting_id: int
+    status: Literal["generated", "cached", "failed"]
+    application: Optional[ApplicationInDB] = None
+    error: Optional[str] = None
+
+class ApplicationBatchGenerateResponse(BaseModel):
+    results: List[ApplicationGenerateResult]
+    generated: int
+    cached: int
+    failed: int
+
+class ApplicationRegenerateRequest(BaseModel):
+    """Optional guidance for the regenerated section, e.g. "shorter, mention Kubernetes"."""
+    instructions: Optional[str] = Field(None, max_length=2000)
+
+class ApplicationRevisionInDB(BaseModel):
+    id: int
+    application_id: int
+    section: str
+    previous_text: Optional[str] = None
+    instructions: Optional[str] = None
+    model: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,22 @@
+# In backend/app/schemas/generation_job.py
+
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+import uuid
+
+class GenerationJobInDB(BaseModel):
+    id: uuid.UUID
+    user_id: uuid.UUID
+    job_posting_id: int
+    status: str
+    attempts: int
+    force_regenerate: bool = False
+    application_id: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,7 +1,7 @@
 # In backend/app/schemas/job_postings.py
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, HttpUrl
+from typing import Any, Dict, List, Literal, Optional, Union
+from pydantic import BaseModel, Field, HttpUrl
 import uuid
 
 class JobPostingBase(BaseModel):
@@ -14,10 +14,11 @@ class JobPostingBase(BaseModel):
     applied_at: Optional[datetime] = None
 
 class JobPostingCreate(JobPostingBase):
-    pass
+    job_description_compact: Optional[Dict[str, Any]] = None
 
 class JobPostingInDB(JobPostingBase):
     id: int
+    created_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True # Change this from orm_mode = True
@@ -27,4 +28,40 @@ class JobScrapeRequest(BaseModel):
     
 class JobPosting(JobPostingInDB):
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class JobPostingSummary(BaseModel):
+    """A saved posting as listed on the profile: the description is cut to a preview."""
+    id: int
+    url: Optional[HttpUrl] = None
+    job_title: Optional[str] = None
+    company_name: Optional[str] = None
+    location: Optional[str] = None
+    job_description: Optional[str] = Field(default=None, validation_alias="description_preview")
+    applied_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class JobBatchScrapeRequest(BaseModel):
+    urls: List[HttpUrl] = Field(..., min_length=1)
+
+class JobScrapeResult(BaseModel):
+    url: str
+    canonical_url: Optional[str] = None
+    # created: newly scraped and saved, existing: the user already had it
+    status: Literal["created", "existing", "failed"]
+    job_posting: Optional[JobPostingInDB] = None
+    error: Optional[str] = None
+
+class JobBatchScrapeResponse(BaseModel):
+    results: List[JobScrapeResult]
+    created: int
+    existing: int
+    failed: int
+
+class JobPostingPage(BaseModel):
+    # JobPostingSummary items unless the full posting was requested
+    items: List[Union[JobPostingInDB, JobPostingSummary]]
+    next_cursor: Optional[str] = None
@@ -10,7 +10,7 @@ from .experiences import ExperienceCreate, ExperienceInDB
 from .projects import ProjectCreate, ProjectInDB
 from .skills import SkillCreate, SkillInDB
 from .application import ApplicationInDB
-from .job_postings import JobPostingInDB
+from .job_postings import JobPostingInDB, JobPostingSummary
 
 # --- User Schemas ---
 
@@ -54,6 +54,24 @@ class User(UserInDB):
     class Config:
         from_attributes = True
 
+class UserProfile(UserBase):
+    """
+    What /users/profile and signup return: the profile sections plus a
+    summary of saved postings. Generated applications and the password hash
+    are left out, so the payload doesn't grow with application history.
+    """
+    id: uuid.UUID
+    created_at: datetime
+    updated_at: datetime
+    experiences: List[ExperienceInDB] = []
+    educations: List[EducationInDB] = []
+    projects: List[ProjectInDB] = []
+    skills: List[SkillInDB] = []
+    job_postings: List[JobPostingSummary] = []
+
+    class Config:
+        from_attributes = True
+
 class Token(BaseModel):
     access_token: str
     token_type: str
\ No newline at end of file
@@ -0,0 +1,227 @@
+# In backend/app/scraping/browser_pool.py
+
+import asyncio
+import itertools
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional
+
+from fastapi import Request
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+from ..core.config import settings
+from ..logging_config import api_logger
+
+CHROMIUM_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--no-first-run',
+    '--no-zygote',
+    '--disable-gpu'
+]
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+EXTRA_HTTP_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+class BrowserPoolTimeout(Exception):
+    """Raised when no scraping slot frees up within the acquire timeout."""
+
+
+@dataclass
+class _PooledContext:
+    context: BrowserContext
+    browser_index: int
+    generation: int
+    uses: int = 0
+
+
+class BrowserPool:
+    """
+    Keeps a fixed number of warm Chromium instances for the lifetime of the app
+    and hands out reusable browser contexts, bounded by a concurrency limit.
+    """
+
+    def __init__(
+        self,
+        size: int = settings.BROWSER_POOL_SIZE,
+        max_concurrency: int = settings.SCRAPER_MAX_CONCURRENCY,
+        context_max_uses: int = settings.BROWSER_CONTEXT_MAX_USES,
+        acquire_timeout: float = settings.SCRAPER_ACQUIRE_TIMEOUT_SECONDS,
+    ):
+        self.size = max(1, size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.context_max_uses = max(1, context_max_uses)
+        self.acquire_timeout = acquire_timeout
+
+        self._playwright: Optional[Playwright] = None
+        self._browsers: List[Optional[Browser]] = [None] * self.size
+        # Bumped every time a browser slot is relaunched so contexts that
+        # belonged to a dead browser are never handed out again.
+        self._generations: List[int] = [0] * self.size
+        self._browser_locks = [asyncio.Lock() for _ in range(self.size)]
+        self._round_robin = itertools.cycle(range(self.size))
+        self._idle: List[_PooledContext] = []
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._in_use = 0
+        self._closed = False
+
+        self.hits = 0
+        self.misses = 0
+        self.restarts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    async def start(self) -> None:
+        self._playwright = await async_playwright().start()
+        for index in range(self.size):
+            try:
+                await self._ensure_browser(index)
+            except Exception as e:
+                # A browser that fails to launch at startup is retried lazily on acquire.
+                api_logger.error({"message": "Failed to launch pooled browser", "browser_index": index, "error": str(e)})
+        api_logger.info({"message": "Browser pool started", "size": self.size, "max_concurrency": self.max_concurrency})
+
+    async def stop(self) -> None:
+        self._closed = True
+        for pooled in self._idle:
+            await self._close_context(pooled)
+        self._idle.clear()
+        for index, browser in enumerate(self._browsers):
+            if browser is not None:
+                try:
+                    await browser.close()
+                except Exception as e:
+                    api_logger.warning({"message": "Error closing pooled browser", "browser_index": index, "error": str(e)})
+                self._browsers[index] = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        api_logger.info({"message": "Browser pool stopped", **self.stats()})
+
+    @asynccontextmanager
+    async def context(self) -> AsyncIterator[BrowserContext]:
+        """Borrow a browser context; it is returned to the pool (or recycled) on exit."""
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+
+        wait_start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise BrowserPoolTimeout(f"No scraping slot available after {self.acquire_timeout}s")
+        waited = time.perf_counter() - wait_start
+        self.total_wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+        self._in_use += 1
+        pooled = None
+        healthy = True
+        try:
+            pooled = await self._checkout()
+            yield pooled.context
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            if pooled is not None:
+                await self._checkin(pooled, healthy)
+            self._in_use -= 1
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        acquisitions = self.hits + self.misses
+        return {
+            "size": self.size,
+            "max_concurrency": self.max_concurrency,
+            "connected_browsers": sum(1 for b in self._browsers if b is not None and b.is_connected()),
+            "idle_contexts": len(self._idle),
+            "in_use": self._in_use,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / acquisitions, 4) if acquisitions else 0.0,
+            "restarts": self.restarts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait_seconds / acquisitions * 1000, 2) if acquisitions else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+        }
+
+    async def _checkout(self) -> _PooledContext:
+        while self._idle:
+            pooled = self._idle.pop()
+            if self._is_live(pooled):
+                self.hits += 1
+                pooled.uses += 1
+                return pooled
+            await self._close_context(pooled)
+
+        self.misses += 1
+        index = next(self._round_robin)
+        browser = await self._ensure_browser(index)
+        context = await browser.new_context(
+            user_agent=USER_AGENT,
+            viewport={'width': 1920, 'height': 1080},
+            extra_http_headers=EXTRA_HTTP_HEADERS,
+        )
+        await context.route("**/*.{png,jpg,jpeg,webp}", lambda route: route.abort())
+        await context.route("**/*.css", lambda route: route.abort())
+        return _PooledContext(context=context, browser_index=index, generation=self._generations[index], uses=1)
+
+    async def _checkin(self, pooled: _PooledContext, healthy: bool) -> None:
+        if self._closed or not healthy or pooled.uses >= self.context_max_uses or not self._is_live(pooled):
+            await self._close_context(pooled)
+            return
+        # Drop pages left behind by the borrower so the next one starts clean.
+        for page in list(pooled.context.pages):
+            try:
+                await page.close()
+            except Exception:
+                pass
+        self._idle.append(pooled)
+
+    async def _ensure_browser(self, index: int) -> Browser:
+        async with self._browser_locks[index]:
+            browser = self._browsers[index]
+            if browser is not None and browser.is_connected():
+                return browser
+            if browser is not None:
+                self.restarts += 1
+                api_logger.warning({"message": "Relaunching crashed pooled browser", "browser_index": index})
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            browser = await self._playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+            self._browsers[index] = browser
+            self._generations[index] += 1
+            return browser
+
+    def _is_live(self, pooled: _PooledContext) -> bool:
+        browser = self._browsers[pooled.browser_index]
+        return (
+            browser is not None
+            and browser.is_connected()
+            and pooled.generation == self._generations[pooled.browser_index]
+        )
+
+    async def _close_context(self, pooled: _PooledContext) -> None:
+        try:
+            await pooled.context.close()
+        except Exception:
+            # The owning browser may already be gone; nothing left to release.
+            pass
+
+
+def get_browser_pool(request: Request) -> BrowserPool:
+    return request.app.state.browser_pool
@@ -0,0 +1,66 @@
+# In backend/app/scraping/cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from ..core.config import settings
+
+
+class ScrapeCache:
+    """
+    TTL + LRU cache of scraped job payloads keyed by canonical posting URL,
+    so repeat scrapes of the same posting skip the browser entirely.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = settings.SCRAPE_CACHE_TTL_SECONDS,
+        max_entries: int = settings.SCRAPE_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[Dict, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, canonical_url: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(canonical_url)
+            if entry is not None and time.monotonic() - entry[1] > self.ttl_seconds:
+                del self._entries[canonical_url]
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(canonical_url)
+            self.hits += 1
+            return dict(entry[0])
+
+    def set(self, canonical_url: str, job_data: Dict) -> None:
+        with self._lock:
+            self._entries[canonical_url] = (dict(job_data), time.monotonic())
+            self._entries.move_to_end(canonical_url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+scrape_cache = ScrapeCache()
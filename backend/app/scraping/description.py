@@ -0,0 +1,120 @@
+# In backend/app/scraping/description.py
+
+import re
+from typing import Dict, List, Optional
+
+# Bump when the rules below change; stored forms from older versions are rebuilt on use.
+DESCRIPTION_PREPROCESSOR_VERSION = 2
+
+# Section headings, matched in order against the lower-cased heading text. The
+# specific kinds come first so "About the role" or "About you" are not taken for "About us".
+_SECTION_PATTERNS = [
+    # "plus" only as "a plus", "pluses" or a heading of its own, not "Compensation plus benefits"
+    ("preferred", re.compile(r"nice to have|nice-to-have|preferred|bonus|desired|good to have|\ba plus\b|\bpluses\b|^plus\b")),
+    ("requirements", re.compile(
+        r"requirement|qualification|what you('ll| will)? (bring|need|have)|what we('re| are) looking for"
+        r"|who you are|must.have|skills|about you|you have|your profile|your background|experience"
+    )),
+    ("responsibilities", re.compile(
+        r"responsibilit|what you('ll| will) do|what you('ll| will) be doing|the role|your role|role overview"
+        r"|duties|day.to.day|in this role|your (impact|mission)|key (tasks|accountabilities)|the job"
+    )),
+    ("boilerplate", re.compile(
+        r"^about\b|who we are|our (company|mission|story|values|culture)"
+        r"|benefits|perks|what we offer|why (join|work)|compensation|salary|pay (range|transparency)"
+        r"|equal (opportunit|employment)|\beeo\b|diversity|accommodation|privacy|how to apply|life at"
+    )),
+]
+
+# Paragraphs dropped wherever they appear, e.g. an EEO statement with no heading of its own
+_BOILERPLATE_PARAGRAPH = re.compile(
+    r"equal opportunity employer|without regard to|regardless of (race|gender|age)|reasonable accommodation"
+    r"|protected veteran|e-verify|sexual orientation|gender identity|national origin|applicants with disabilities"
+    r"|privacy (notice|policy)|recruitment agenc|we do not accept unsolicited",
+    re.IGNORECASE,
+)
+
+_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_BARE_URL = re.compile(r"<?https?://\S+>?")
+_EMPHASIS = re.compile(r"\*{1,4}|_{2,}")
+_ESCAPE = re.compile(r"\\([\\`*_{}\[\]()#+\-.!|>~])")
+_BULLET = re.compile(r"^\s*(?:[-*+•·▪●]|\d{1,2}[.)])\s+")
+_HEADING = re.compile(r"^\s*#{1,6}\s*")
+_SPACES = re.compile(r"[ \t ]+")
+
+# A line is treated as a heading if it is short and either marked up as one or ends with a colon
+_MAX_HEADING_CHARS = 80
+
+
+def _clean_inline(text: str) -> str:
+    text = _IMAGE.sub("", text)
+    text = _LINK.sub(r"\1", text)
+    text = _BARE_URL.sub("", text)
+    text = _ESCAPE.sub(r"\1", text)
+    text = _EMPHASIS.sub("", text)
+    return _SPACES.sub(" ", text).strip()
+
+
+def _heading_text(line: str) -> Optional[str]:
+    stripped = line.strip()
+    if not stripped or len(stripped) > _MAX_HEADING_CHARS or _BULLET.match(stripped):
+        return None
+    marked = bool(_HEADING.match(stripped)) or (stripped.startswith("**") and stripped.rstrip(":").endswith("**"))
+    text = _clean_inline(_HEADING.sub("", stripped))
+    if marked or (text.endswith(":") and len(text.split()) <= 8):
+        return text.rstrip(":").strip()
+    return None
+
+
+def _classify(heading: str) -> str:
+    lowered = heading.lower()
+    for kind, pattern in _SECTION_PATTERNS:
+        if pattern.search(lowered):
+            return kind
+    return "details"
+
+
+def _split_sections(markdown: str) -> List[tuple]:
+    """(kind, items) per section, in order; text before the first heading is the summary."""
+    sections = [("summary", [])]
+    for line in markdown.splitlines():
+        heading = _heading_text(line)
+        if heading is not None:
+            sections.append((_classify(heading), []))
+            continue
+        item = _clean_inline(_BULLET.sub("", line))
+        if item:
+            sections[-1][1].append(item)
+    return sections
+
+
+def condense_job_description(markdown: Optional[str]) -> Optional[Dict]:
+    """
+    Reduces a scraped description to what the generation prompt needs.
+
+    Link and markup noise from markdownify is removed, then the text is split
+    at its headings. "About us", benefits, EEO and similar sections are
+    dropped, as are boilerplate paragraphs anywhere else. Bullets and
+    paragraphs under responsibility, requirement and nice-to-have headings
+    become lists. Text before the first heading is kept as the summary, and
+    other sections as details. Returns None when nothing is left.
+    """
+    if not markdown:
+        return None
+    compact: Dict[str, object] = {}
+    seen = set()
+    for kind, items in _split_sections(markdown):
+        if kind == "boilerplate":
+            continue
+        for item in items:
+            if _BOILERPLATE_PARAGRAPH.search(item) or item.lower() in seen:
+                continue
+            seen.add(item.lower())
+            compact.setdefault(kind, []).append(item)
+    if not compact:
+        return None
+    if "summary" in compact:
+        compact["summary"] = " ".join(compact["summary"])
+    compact["version"] = DESCRIPTION_PREPROCESSOR_VERSION
+    return compact
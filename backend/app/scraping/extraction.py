@@ -0,0 +1,128 @@
+# In backend/app/scraping/extraction.py
+
+from typing import Dict, Optional
+
+import lxml.html
+from lxml.cssselect import CSSSelector
+from lxml.etree import ParserError
+
+import markdownify
+
+# Tried in order per field; the first selector with a match wins. These cover
+# the guest, logged-in and older LinkedIn job page layouts.
+FIELD_SELECTORS = {
+    "title": [
+        'h1',
+        '[data-test-job-details-title]',
+        '.job-title',
+        '.top-card-layout__title',
+        '.jobs-details-top-card__job-title',
+    ],
+    "company": [
+        '[data-test-job-details-company]',
+        '.employer-name',
+        '.topcard__org-name-link',
+        '.jobs-details-top-card__company-url',
+        '.jobs-company-name',
+    ],
+    "location": [
+        '[data-test-job-details-location]',
+        '.location',
+        '.topcard__flavor--bullet',
+        '.jobs-details-top-card__exact-location',
+        '.jobs-unified-top-card__bullet',
+    ],
+    "description": [
+        '.jobs-description__content',
+        '.description__text',
+        '[data-test-job-details-description]',
+        '.jobs-box__html-content',
+        '.show-more-less-html__markup',
+    ],
+}
+
+# Compiled to XPath once at import instead of on every page
+_COMPILED_SELECTORS = {
+    field: [CSSSelector(selector) for selector in selectors]
+    for field, selectors in FIELD_SELECTORS.items()
+}
+
+# Same lookup run inside the browser, so only the matched nodes cross the
+# Playwright connection instead of the serialized page.
+IN_PAGE_EXTRACT_JS = """
+(fieldSelectors) => {
+    const first = (selectors) => {
+        for (const selector of selectors) {
+            const element = document.querySelector(selector);
+            if (element) return element;
+        }
+        return null;
+    };
+    const text = (element) => {
+        if (!element) return "";
+        const walker = document.createTreeWalker(element, NodeFilter.SHOW_TEXT);
+        const parts = [];
+        while (walker.nextNode()) {
+            const part = walker.currentNode.nodeValue.trim();
+            if (part) parts.push(part);
+        }
+        return parts.join("");
+    };
+    const description = first(fieldSelectors.description);
+    return {
+        title: text(first(fieldSelectors.title)),
+        company: text(first(fieldSelectors.company)),
+        location: text(first(fieldSelectors.location)),
+        description_html: description ? description.outerHTML : null,
+    };
+}
+"""
+
+
+def _first_match(document, field: str):
+    for selector in _COMPILED_SELECTORS[field]:
+        matches = selector(document)
+        if matches:
+            return matches[0]
+    return None
+
+
+def _text(element) -> str:
+    # Matches BeautifulSoup's get_text(strip=True): stripped text nodes joined without separators
+    if element is None:
+        return ""
+    return "".join(part.strip() for part in element.itertext() if part.strip())
+
+
+def _parse_document(html: str):
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # lxml refuses str input that carries an XML encoding declaration
+        return lxml.html.document_fromstring(html.encode("utf-8"))
+
+
+def extract_fields(html: str) -> Dict[str, Optional[str]]:
+    """
+    Title, company and location text plus the description element's HTML,
+    parsed with libxml2 instead of BeautifulSoup's pure-Python parser.
+    """
+    try:
+        document = _parse_document(html)
+    except ParserError:
+        return {"title": "", "company": "", "location": "", "description_html": None}
+    description = _first_match(document, "description")
+    return {
+        "title": _text(_first_match(document, "title")),
+        "company": _text(_first_match(document, "company")),
+        "location": _text(_first_match(document, "location")),
+        "description_html": lxml.html.tostring(description, encoding="unicode", with_tail=False) if description is not None else None,
+    }
+
+
+def description_to_markdown(html_content: str) -> str:
+    # Convert HTML to Markdown to preserve formatting
+    markdown_text = markdownify.markdownify(html_content, heading_style="ATX", strong_em_symbol="**")
+    # Clean up any leftover text like "Show more" or "Show less"
+    # This handles cases where the button text is outside the main content block
+    return markdown_text.replace('Show more', '').replace('Show less', '').strip()
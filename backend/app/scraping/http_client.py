@@ -0,0 +1,31 @@
+# In backend/app/scraping/http_client.py
+
+import httpx
+from fastapi import Request
+
+from ..core.config import settings
+from .browser_pool import USER_AGENT, EXTRA_HTTP_HEADERS
+
+# httpx negotiates compression itself (brotli only when installed), and
+# manages keep-alive through its connection pool.
+HTTP_HEADERS = {
+    "User-Agent": USER_AGENT,
+    **{k: v for k, v in EXTRA_HTTP_HEADERS.items() if k not in ("Accept-Encoding", "Connection")},
+}
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """One pooled client per process so fast-path scrapes reuse TLS connections."""
+    return httpx.AsyncClient(
+        headers=HTTP_HEADERS,
+        follow_redirects=True,
+        timeout=httpx.Timeout(settings.SCRAPER_HTTP_TIMEOUT_SECONDS),
+        limits=httpx.Limits(
+            max_connections=settings.SCRAPER_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SCRAPER_HTTP_MAX_CONNECTIONS,
+        ),
+    )
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    return request.app.state.http_client
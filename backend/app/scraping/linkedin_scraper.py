@@ -1,163 +1,153 @@
 # In backend/app/scraping/linkedin_scraper.py
 
-import markdownify
-from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
-import asyncio
+import httpx
+import time
+from collections import Counter
 from typing import Optional, Dict
 import logging
 
+from ..core.config import settings
+from ..core.metrics import SCRAPE_PHASE_SECONDS, SCRAPE_SECONDS
+from .browser_pool import BrowserPool
+from .description import condense_job_description
+from .extraction import FIELD_SELECTORS, IN_PAGE_EXTRACT_JS, description_to_markdown, extract_fields
+
 logger = logging.getLogger(__name__)
 
-class LinkedInScraper:
+# A fast-path result missing any of these is re-scraped with Playwright.
+REQUIRED_FIELDS = ('title', 'company', 'description')
+
+
+class ScrapePathStats:
+    """Counts which path served each scrape and why the HTTP fast path fell back."""
+
     def __init__(self):
+        self.paths = Counter()
+        self.fallback_reasons = Counter()
+        self._elapsed_ms = Counter()
+
+    def record(self, path: str, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        self.paths[path] += 1
+        self._elapsed_ms[path] += elapsed * 1000
+        SCRAPE_SECONDS.labels(path).observe(elapsed)
+
+    def record_fallback(self, reason: str) -> None:
+        self.fallback_reasons[reason] += 1
+
+    def stats(self) -> dict:
+        attempted = self.paths["http"] + self.paths["browser_fallback"]
+        return {
+            "paths": dict(self.paths),
+            "avg_ms": {path: round(self._elapsed_ms[path] / count, 1) for path, count in self.paths.items()},
+            "fallback_reasons": dict(self.fallback_reasons),
+            "fallback_rate": round(self.paths["browser_fallback"] / attempted, 4) if attempted else 0.0,
+        }
+
+
+scrape_path_stats = ScrapePathStats()
+
+
+class LinkedInScraper:
+    def __init__(self, pool: BrowserPool, http_client: Optional[httpx.AsyncClient] = None):
+        self.pool = pool
+        self.http_client = http_client
         self.timeout = 60000
 
     async def scrape_job_posting(self, url: str) -> Optional[Dict]:
         if "jobs/search" in url:
             logger.error("Please provide a direct link to a job posting, not a search results page")
             return None
-        
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--no-first-run',
-                    '--no-zygote',
-                    '--disable-gpu'
-                ]
-            )
-            
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                viewport={'width': 1920, 'height': 1080},
-                extra_http_headers={
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                }
-            )
-            
-            await context.route("**/*.{png,jpg,jpeg,webp}", lambda route: route.abort())
-            await context.route("**/*.css", lambda route: route.abort())
-            
+
+        started = time.perf_counter()
+        if self.http_client is None or not settings.SCRAPER_HTTP_FAST_PATH:
+            job_data = await self._scrape_with_browser(url)
+            scrape_path_stats.record("browser", started)
+            return job_data
+
+        job_data = await self._scrape_with_http(url)
+        if job_data is not None:
+            scrape_path_stats.record("http", started)
+            return job_data
+
+        job_data = await self._scrape_with_browser(url)
+        scrape_path_stats.record("browser_fallback", started)
+        return job_data
+
+    async def _scrape_with_http(self, url: str) -> Optional[Dict]:
+        """
+        Fetches the server-rendered page without a browser. Returns None when
+        the page can't be used as-is (blocked, login wall, fields missing), so
+        the caller escalates to Playwright.
+        """
+        try:
+            with SCRAPE_PHASE_SECONDS.labels("http_fetch").time():
+                response = await self.http_client.get(url)
+        except httpx.HTTPError as e:
+            logger.info(f"HTTP fast path failed for {url}: {e!r}")
+            scrape_path_stats.record_fallback("http_error")
+            return None
+
+        if response.status_code != 200:
+            scrape_path_stats.record_fallback(f"status_{response.status_code}")
+            return None
+        if "authwall" in str(response.url) or "/login" in response.url.path:
+            scrape_path_stats.record_fallback("authwall")
+            return None
+
+        job_data = self._parse(response.text)
+        if not all(job_data[field] for field in REQUIRED_FIELDS):
+            scrape_path_stats.record_fallback("missing_fields")
+            return None
+        return job_data
+
+    async def _scrape_with_browser(self, url: str) -> Optional[Dict]:
+        async with self.pool.context() as context:
             page = await context.new_page()
             
             try:
                 logger.info(f"Navigating to URL: {url}")
-                await page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
+                with SCRAPE_PHASE_SECONDS.labels("navigation").time():
+                    await page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
                 
                 # Wait for the "Show more" button to appear and click it if it exists.
                 # This ensures you get the full job description.
-                show_more_button = await page.query_selector("button.show-more-less-html__button")
-                if show_more_button:
-                    await show_more_button.click()
-                    await page.wait_for_timeout(1000) # Give it a moment to expand
-                
-                await page.wait_for_selector('h1, [data-test-job-details-title]', timeout=self.timeout)
-                
-                content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-
-                job_data = {
-                    'title': self._extract_title(soup),
-                    'company': self._extract_company(soup),
-                    'location': self._extract_location(soup),
-                    'description': self._extract_description(soup)
-                }
-                
-                await browser.close()
-                return job_data
+                with SCRAPE_PHASE_SECONDS.labels("show_more").time():
+                    show_more_button = await page.query_selector("button.show-more-less-html__button")
+                    if show_more_button:
+                        await show_more_button.click()
+                        await page.wait_for_timeout(1000) # Give it a moment to expand
                 
+                with SCRAPE_PHASE_SECONDS.labels("selector_wait").time():
+                    await page.wait_for_selector('h1, [data-test-job-details-title]', timeout=self.timeout)
             except Exception as e:
+                # Still extract whatever did load
                 logger.error(f"Error scraping LinkedIn: {str(e)}")
-                try:
-                    content = await page.content()
-                    soup = BeautifulSoup(content, 'html.parser')
-                    job_data = {
-                        'title': self._extract_title(soup),
-                        'company': self._extract_company(soup),
-                        'location': self._extract_location(soup),
-                        'description': self._extract_description(soup)
-                    }
-                    await browser.close()
-                    return job_data
-                except Exception:
-                    await browser.close()
-                    return None
-
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        selectors = [
-            'h1',
-            '[data-test-job-details-title]',
-            '.job-title',
-            '.top-card-layout__title',
-            '.jobs-details-top-card__job-title'
-        ]
-        
-        for selector in selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                return elem.get_text(strip=True)
-        return ""
-
-    def _extract_company(self, soup: BeautifulSoup) -> str:
-        selectors = [
-            '[data-test-job-details-company]',
-            '.employer-name',
-            '.topcard__org-name-link',
-            '.jobs-details-top-card__company-url',
-            '.jobs-company-name'
-        ]
-        
-        for selector in selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                return elem.get_text(strip=True)
-        return ""
-
-    def _extract_location(self, soup: BeautifulSoup) -> str:
-        selectors = [
-            '[data-test-job-details-location]',
-            '.location',
-            '.topcard__flavor--bullet',
-            '.jobs-details-top-card__exact-location',
-            '.jobs-unified-top-card__bullet'
-        ]
-        
-        for selector in selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                return elem.get_text(strip=True)
-        return ""
-
-    def _extract_description(self, soup: BeautifulSoup) -> str:
-        selectors = [
-            '.jobs-description__content',
-            '.description__text',
-            '[data-test-job-details-description]',
-            '.jobs-box__html-content',
-            '.show-more-less-html__markup'
-        ]
-        
-        for selector in selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                # Get the inner HTML content of the description element
-                html_content = str(elem)
-                # Convert HTML to Markdown to preserve formatting
-                # The 'strip_tags' parameter is useful for removing unwanted elements like the 'Show less' button.
-                # However, it's often easier to first click the button in Playwright, and then just process the final content.
-                markdown_text = markdownify.markdownify(html_content, heading_style="ATX", strong_em_symbol="**")
-                # Clean up any leftover text like "Show more" or "Show less"
-                # This handles cases where the button text is outside the main content block
-                markdown_text = markdown_text.replace('Show more', '').replace('Show less', '').strip()
-                return markdown_text
-        return ""
\ No newline at end of file
+
+            try:
+                with SCRAPE_PHASE_SECONDS.labels("parse").time():
+                    fields = await page.evaluate(IN_PAGE_EXTRACT_JS, FIELD_SELECTORS)
+                return self._to_job_data(fields)
+            except Exception as e:
+                logger.error(f"Error extracting job fields: {str(e)}")
+                return None
+            finally:
+                await page.close()
+
+    def _parse(self, content: str) -> Dict:
+        with SCRAPE_PHASE_SECONDS.labels("parse").time():
+            fields = extract_fields(content)
+        return self._to_job_data(fields)
+
+    def _to_job_data(self, fields: Dict) -> Dict:
+        with SCRAPE_PHASE_SECONDS.labels("markdownify").time():
+            description = description_to_markdown(fields["description_html"]) if fields.get("description_html") else ""
+        with SCRAPE_PHASE_SECONDS.labels("preprocess").time():
+            description_compact = condense_job_description(description)
+        return {
+            'title': fields.get("title") or "",
+            'company': fields.get("company") or "",
+            'location': fields.get("location") or "",
+            'description': description,
+            'description_compact': description_compact,
+        }
@@ -0,0 +1,56 @@
+# In backend/app/scraping/urls.py
+
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+# /jobs/view/4298980303/ and /jobs/view/front-end-engineer-at-acme-4298980303/
+_JOB_VIEW_PATH = re.compile(r"/jobs/view/(?:[^/]*?-)?(\d+)/?")
+
+# Query parameters LinkedIn appends for tracking and UI state; they never
+# change which posting a URL points at.
+TRACKING_PARAMS = {
+    "refid",
+    "trackingid",
+    "currentjobid",
+    "trk",
+    "trkinfo",
+    "lipi",
+    "lici",
+    "eblinkid",
+    "position",
+    "pagenum",
+    "originalsubdomain",
+    "utm_source",
+    "utm_medium",
+    "utm_campaign",
+    "utm_term",
+    "utm_content",
+}
+
+def extract_linkedin_job_id(url: str) -> Optional[str]:
+    """Returns LinkedIn's numeric job ID for a job posting URL, if it has one."""
+    parsed = urlparse(url)
+    if not parsed.netloc.lower().endswith("linkedin.com"):
+        return None
+    match = _JOB_VIEW_PATH.search(parsed.path)
+    if match:
+        return match.group(1)
+    # Search and collection pages carry the selected posting as ?currentJobId=
+    for key, value in parse_qsl(parsed.query):
+        if key.lower() == "currentjobid" and value.isdigit():
+            return value
+    return None
+
+def canonicalize_job_url(url: str) -> str:
+    """
+    Maps every URL variant of a LinkedIn posting to one canonical form,
+    https://www.linkedin.com/jobs/view/<job_id>/, so repeat scrapes dedupe.
+    URLs without a job ID just lose their tracking parameters and fragment.
+    """
+    job_id = extract_linkedin_job_id(url)
+    if job_id:
+        return f"https://www.linkedin.com/jobs/view/{job_id}/"
+    parsed = urlparse(url)
+    query = urlencode([(k, v) for k, v in parse_qsl(parsed.query) if k.lower() not in TRACKING_PARAMS])
+    return urlunparse(parsed._replace(query=query, fragment=""))
@@ -0,0 +1,312 @@
+# In backend/app/services/generation.py
+
+import asyncio
+import uuid
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .. import schemas, crud, models
+from ..core.config import settings
+from ..core.singleflight import SingleFlight
+from ..db.locks import advisory_lock
+from ..core.security import (
+    generate_resume_and_cover_letter,
+    generate_resume_and_cover_letter_async,
+    PROMPT_TEMPLATE_VERSION,
+)
+from ..logging_config import api_logger
+from .generation_cache import generation_cache, compute_generation_fingerprint
+from .prompt_payload import CompactProfile, compact_job_posting, description_token_savings
+from .sections import (
+    HEADLINE_JOB_FIELDS,
+    SECTION_PROMPT_VERSION,
+    SECTIONS_BY_KEY,
+    SectionSpec,
+    generate_sections,
+    generate_sections_async,
+    regenerate_section_async,
+    sections_model_key,
+)
+from .structured_output import APPLICATION_TEXT_FIELDS, MalformedOutputError, missing_sections, structured_output_stats
+
+def select_profile_for_job(profile: CompactProfile, job_posting: models.JobPosting) -> Tuple[dict, dict]:
+    """Projects the posting and trims the profile to the parts most relevant to it."""
+    job_data = compact_job_posting(job_posting)
+    user_data = profile.select(job_data)
+    api_logger.info({
+        "message": "Prompt payload built",
+        "job_posting_id": job_posting.id,
+        **profile.selection_stats(user_data),
+        **description_token_savings(job_posting, job_data),
+    })
+    return user_data, job_data
+
+def build_generation_inputs(user_with_relations: models.User, job_posting: models.JobPosting) -> Tuple[dict, dict]:
+    """Serializes the profile and posting into the JSON-safe dicts sent to the LLM."""
+    return select_profile_for_job(CompactProfile(user_with_relations), job_posting)
+
+def get_generation_fingerprint(user_data: dict, job_data: dict) -> str:
+    if settings.GENERATION_MODE == "sectioned":
+        return compute_generation_fingerprint(user_data, job_data, f"sectioned-{SECTION_PROMPT_VERSION}", sections_model_key())
+    return compute_generation_fingerprint(user_data, job_data, PROMPT_TEMPLATE_VERSION, settings.GEMINI_MODEL)
+
+def generate_application_content(user_data: dict, job_data: dict) -> dict:
+    """
+    Resume, cover letter and email template, from one LLM call or one per
+    section (GENERATION_MODE). Sections a single call failed to deliver,
+    e.g. when its reply was cut off, are written by their own section call
+    rather than by repeating the whole generation.
+    """
+    if settings.GENERATION_MODE == "sectioned":
+        return generate_sections(user_data, job_data)
+    generated_data = generate_resume_and_cover_letter(user_data, job_data)
+    missing = missing_section_specs(generated_data)
+    if missing:
+        generated_data.update(generate_sections(user_data, job_data, missing))
+    return generated_data
+
+async def generate_application_content_async(user_data: dict, job_data: dict) -> dict:
+    if settings.GENERATION_MODE == "sectioned":
+        return await generate_sections_async(user_data, job_data)
+    generated_data = await generate_resume_and_cover_letter_async(user_data, job_data)
+    missing = missing_section_specs(generated_data)
+    if missing:
+        generated_data.update(await generate_sections_async(user_data, job_data, missing))
+    return generated_data
+
+def missing_section_specs(generated_data: dict) -> List[SectionSpec]:
+    missing = [SECTIONS_BY_KEY[section] for section in missing_sections(generated_data)]
+    if missing:
+        structured_output_stats.record(sections_refilled=len(missing))
+        api_logger.info({"message": "Generating sections missing from the LLM output", "sections": [spec.key for spec in missing]})
+    return missing
+
+def get_cached_application(
+    db: Session,
+    user_id: uuid.UUID,
+    fingerprint: str,
+    force_regenerate: bool = False
+) -> Optional[models.Application]:
+    if force_regenerate:
+        generation_cache.record_bypass()
+        return None
+    cached_application = generation_cache.lookup(db, user_id, fingerprint)
+    if cached_application is not None:
+        api_logger.info({"message": "Generation cache hit", "application_id": cached_application.id, "job_posting_id": cached_application.job_posting_id})
+    return cached_application
+
+async def get_cached_application_async(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    fingerprint: str,
+    force_regenerate: bool = False
+) -> Optional[models.Application]:
+    if force_regenerate:
+        generation_cache.record_bypass()
+        return None
+    cached_application = await generation_cache.lookup_async(db, user_id, fingerprint)
+    if cached_application is not None:
+        api_logger.info({"message": "Generation cache hit", "application_id": cached_application.id, "job_posting_id": cached_application.job_posting_id})
+    return cached_application
+
+def build_application_create(user_id: uuid.UUID, job_posting_id: int, generated_data: dict) -> schemas.ApplicationCreate:
+    # Both generation modes return plain text per section; nested output is flattened while parsing
+    return schemas.ApplicationCreate(
+        user_id=user_id,
+        job_posting_id=job_posting_id,
+        **{field: generated_data.get(section, "") for section, field in APPLICATION_TEXT_FIELDS.items()}
+    )
+
+def store_application(db: Session, application: schemas.ApplicationCreate, fingerprint: str) -> models.Application:
+    db_application = crud.applications.create_application(
+        db=db,
+        application=application,
+        generation_fingerprint=fingerprint
+    )
+    generation_cache.store(fingerprint, db_application)
+    return db_application
+
+async def store_application_async(db: AsyncSession, application: schemas.ApplicationCreate, fingerprint: str) -> models.Application:
+    db_application = await crud.applications.create_application_async(
+        db=db,
+        application=application,
+        generation_fingerprint=fingerprint
+    )
+    generation_cache.store(fingerprint, db_application)
+    return db_application
+
+def generate_and_store_application(
+    db: Session,
+    user_with_relations: models.User,
+    job_posting: models.JobPosting,
+    force_regenerate: bool = False
+) -> Tuple[schemas.ApplicationCreate, models.Application]:
+    """
+    Runs the LLM generation for a user/job pair and persists the result.
+    Shared by the synchronous endpoint and the background generation worker.
+
+    An Application generated earlier from identical inputs is returned as-is
+    unless `force_regenerate` is set.
+    """
+    user_data, job_data = build_generation_inputs(user_with_relations, job_posting)
+
+    fingerprint = get_generation_fingerprint(user_data, job_data)
+    cached_application = get_cached_application(db, user_with_relations.id, fingerprint, force_regenerate)
+    if cached_application is not None:
+        return schemas.ApplicationCreate.model_validate(cached_application, from_attributes=True), cached_application
+
+    generated_data = generate_application_content(user_data, job_data)
+
+    application_create_schema = build_application_create(user_with_relations.id, job_posting.id, generated_data)
+    db_application = store_application(db, application_create_schema, fingerprint)
+    return application_create_schema, db_application
+
+# Concurrent generate requests for the same user and posting share one LLM call.
+generation_flights = SingleFlight("generate")
+
+def generation_lock(user_id: uuid.UUID, job_posting_id: int):
+    """Cross-process lock around one user/posting generation, when enabled."""
+    if settings.SINGLE_FLIGHT_ADVISORY_LOCKS:
+        return advisory_lock(f"generate:{user_id}:{job_posting_id}")
+    return nullcontext()
+
+def generate_application_coalesced(
+    db: Session,
+    user_with_relations: models.User,
+    job_posting: models.JobPosting,
+    force_regenerate: bool = False
+) -> schemas.ApplicationCreate:
+    """
+    generate_and_store_application for request handlers: identical requests
+    already in flight in this process are joined rather than repeated, and
+    with advisory locks enabled a caller that waited on another process
+    picks up its result from the generation cache.
+    """
+    # A forced request must not join a normal flight that may answer from the cache
+    key = (user_with_relations.id, job_posting.id, force_regenerate)
+
+    def run() -> schemas.ApplicationCreate:
+        with generation_lock(user_with_relations.id, job_posting.id):
+            application_create_schema, _ = generate_and_store_application(
+                db, user_with_relations, job_posting, force_regenerate=force_regenerate
+            )
+            return application_create_schema
+
+    return generation_flights.do(key, run)
+
+async def generate_applications_batch(
+    db: AsyncSession,
+    user_with_relations: models.User,
+    job_posting_ids: List[int],
+    force_regenerate: bool = False,
+    concurrency: int = settings.GENERATION_BATCH_CONCURRENCY
+) -> schemas.ApplicationBatchGenerateResponse:
+    """
+    Generates applications for many of the user's postings at once.
+
+    The profile is serialized a single time and trimmed per posting, the
+    postings are loaded with one query, cache misses are sent to Gemini with
+    at most `concurrency` calls in flight (paced by the shared rate limiter),
+    and the new Application rows are saved with one bulk insert.
+    """
+    user_id = user_with_relations.id
+    profile = CompactProfile(user_with_relations)
+    job_posting_ids = list(dict.fromkeys(job_posting_ids))
+    job_postings = {
+        job_posting.id: job_posting
+        for job_posting in await crud.jobpostings.get_user_job_postings_by_ids_async(db, user_id, job_posting_ids)
+    }
+
+    results: Dict[int, schemas.ApplicationGenerateResult] = {}
+    pending = []
+    for job_posting_id in job_posting_ids:
+        job_posting = job_postings.get(job_posting_id)
+        if job_posting is None:
+            results[job_posting_id] = schemas.ApplicationGenerateResult(
+                job_posting_id=job_posting_id, status="failed", error="Job posting not found."
+            )
+            continue
+        user_data, job_data = select_profile_for_job(profile, job_posting)
+        fingerprint = get_generation_fingerprint(user_data, job_data)
+        cached_application = await get_cached_application_async(db, user_id, fingerprint, force_regenerate)
+        if cached_application is not None:
+            results[job_posting_id] = schemas.ApplicationGenerateResult(
+                job_posting_id=job_posting_id, status="cached",
+                application=schemas.ApplicationInDB.model_validate(cached_application)
+            )
+        else:
+            pending.append((job_posting_id, user_data, job_data, fingerprint))
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def generate_one(job_posting_id: int, user_data: dict, job_data: dict, fingerprint: str):
+        async with semaphore:
+            try:
+                generated_data = await generate_application_content_async(user_data, job_data)
+            except MalformedOutputError:
+                return job_posting_id, fingerprint, None, "Failed to parse LLM response. The generated content may be malformed."
+            except Exception as e:
+                return job_posting_id, fingerprint, None, f"An unexpected error occurred: {str(e)}"
+        return job_posting_id, fingerprint, build_application_create(user_id, job_posting_id, generated_data), None
+
+    outcomes = await asyncio.gather(*(generate_one(*item) for item in pending))
+
+    to_store = []
+    for job_posting_id, fingerprint, application_create_schema, error in outcomes:
+        if application_create_schema is None:
+            results[job_posting_id] = schemas.ApplicationGenerateResult(
+                job_posting_id=job_posting_id, status="failed", error=error
+            )
+        else:
+            to_store.append((application_create_schema, fingerprint))
+
+    for db_application in await crud.applications.create_applications_bulk_async(db, to_store):
+        generation_cache.store(db_application.generation_fingerprint, db_application)
+        results[db_application.job_posting_id] = schemas.ApplicationGenerateResult(
+            job_posting_id=db_application.job_posting_id, status="generated",
+            application=schemas.ApplicationInDB.model_validate(db_application)
+        )
+
+    ordered = [results[job_posting_id] for job_posting_id in job_posting_ids]
+    return schemas.ApplicationBatchGenerateResponse(
+        results=ordered,
+        generated=sum(1 for r in ordered if r.status == "generated"),
+        cached=sum(1 for r in ordered if r.status == "cached"),
+        failed=sum(1 for r in ordered if r.status == "failed"),
+    )
+
+async def regenerate_application_section(
+    db: AsyncSession,
+    application: models.Application,
+    spec: SectionSpec,
+    instructions: Optional[str] = None
+) -> models.Application:
+    """
+    Rewrites one section of a saved application with a single LLM call and
+    updates that column in place, keeping the replaced text as a revision.
+
+    The prompt carries only what the section is written from: the trimmed
+    profile and posting for the resume and cover letter, and just the user's
+    name, the job title and the company for the email.
+    """
+    job_posting = await crud.jobpostings.get_job_posting_async(db, application.job_posting_id)
+    if job_posting is None:
+        raise ValueError("Job posting not found.")
+
+    if spec.needs_profile:
+        user_with_relations = await crud.users.get_user_with_relations_async(db, application.user_id)
+        user_data, job_data = select_profile_for_job(CompactProfile(user_with_relations), job_posting)
+    else:
+        identity = await crud.users.get_user_identity_async(db, application.user_id)
+        user_data = {"name": identity.name}
+        job_data = {field: getattr(job_posting, field) for field in HEADLINE_JOB_FIELDS}
+    current_text = getattr(application, spec.column) or ""
+    # End the read transaction so the session's connection goes back to the pool during the LLM call
+    await db.commit()
+
+    text, _ = await regenerate_section_async(spec, user_data, job_data, current_text, instructions)
+    return await crud.applications.replace_application_section_async(
+        db, application.id, spec.column, spec.name, text, instructions=instructions, model=spec.model
+    )
@@ -0,0 +1,174 @@
+# In backend/app/services/generation_cache.py
+
+import hashlib
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .. import crud, models
+from ..core.config import settings
+
+# Fields that change without changing what the model should write, e.g. the
+# user's own application history or row timestamps. They are left out of the
+# fingerprint so an unchanged profile keeps hitting the cache.
+VOLATILE_KEYS = {
+    "applications",
+    "job_postings",
+    "password_hash",
+    "created_at",
+    "updated_at",
+    "applied_at",
+    "generated_at",
+}
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in sorted(value.items()) if k not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        # Related rows come back in no guaranteed order; sort by content.
+        items = [_normalize(item) for item in value]
+        return sorted(items, key=lambda item: json.dumps(item, sort_keys=True, default=str))
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+def compute_generation_fingerprint(user_data: dict, job_data: dict, prompt_version: str, model_name: str) -> str:
+    """Stable SHA-256 over the normalized generation inputs."""
+    payload = {
+        "user": _normalize(user_data),
+        "job": _normalize(job_data),
+        "prompt_version": prompt_version,
+        "model": model_name,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class GenerationCache:
+    """
+    Maps generation fingerprints to stored Application rows.
+
+    An in-process LRU with a TTL sits in front of a lookup on
+    applications.generation_fingerprint, so API processes and queue workers
+    share hits through the database.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = settings.GENERATION_CACHE_TTL_SECONDS,
+        max_entries: int = settings.GENERATION_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypasses = 0
+
+    def lookup(self, db: Session, user_id: uuid.UUID, fingerprint: str) -> Optional[models.Application]:
+        application = None
+        application_id = self._get_local(fingerprint)
+        if application_id is not None:
+            application = self._owned_or_discard(
+                fingerprint, user_id, crud.applications.get_application(db, application_id)
+            )
+
+        if application is None:
+            application = crud.applications.get_application_by_fingerprint(
+                db, user_id=user_id, fingerprint=fingerprint, newer_than=self._oldest_valid()
+            )
+            if application is not None:
+                self.store(fingerprint, application)
+
+        self._count(application)
+        return application
+
+    async def lookup_async(self, db: AsyncSession, user_id: uuid.UUID, fingerprint: str) -> Optional[models.Application]:
+        application = None
+        application_id = self._get_local(fingerprint)
+        if application_id is not None:
+            application = self._owned_or_discard(
+                fingerprint, user_id, await crud.applications.get_application_async(db, application_id)
+            )
+
+        if application is None:
+            application = await crud.applications.get_application_by_fingerprint_async(
+                db, user_id=user_id, fingerprint=fingerprint, newer_than=self._oldest_valid()
+            )
+            if application is not None:
+                self.store(fingerprint, application)
+
+        self._count(application)
+        return application
+
+    def store(self, fingerprint: str, application: models.Application) -> None:
+        with self._lock:
+            self._entries[fingerprint] = (application.id, time.monotonic())
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def record_bypass(self) -> None:
+        with self._lock:
+            self.bypasses += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "bypasses": self.bypasses,
+            }
+
+    def _oldest_valid(self) -> datetime:
+        return datetime.utcnow() - timedelta(seconds=self.ttl_seconds)
+
+    def _owned_or_discard(self, fingerprint: str, user_id: uuid.UUID, application: Optional[models.Application]):
+        # The row may have been deleted, or the fingerprint reused by another user.
+        if application is None or application.user_id != user_id:
+            self._discard(fingerprint)
+            return None
+        return application
+
+    def _count(self, application: Optional[models.Application]) -> None:
+        with self._lock:
+            if application is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+    def _get_local(self, fingerprint: str) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None:
+                return None
+            application_id, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[fingerprint]
+                self.evictions += 1
+                return None
+            self._entries.move_to_end(fingerprint)
+            return application_id
+
+    def _discard(self, fingerprint: str) -> None:
+        with self._lock:
+            self._entries.pop(fingerprint, None)
+
+
+generation_cache = GenerationCache()
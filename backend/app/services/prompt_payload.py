@@ -0,0 +1,232 @@
+# In backend/app/services/prompt_payload.py
+
+import json
+import math
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, FrozenSet, List, Optional
+
+from .. import models
+from ..core.config import settings
+from ..scraping.description import DESCRIPTION_PREPROCESSOR_VERSION, condense_job_description
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#.\-]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could did do does
+doing for from further had has have having he her here hers him his how i if in into is it its itself
+just more most my no nor not of off on once only or other our ours out over own same she should so
+some such than that the their theirs them then there these they this those through to too under until
+up very was we were what when where which while who whom why will with would you your yours
+able ability across etc including within work working team role job company position candidate
+experience years year strong good excellent skills skill looking join us new well using use
+""".split())
+
+# Always sent, whatever the budget: who the user is and where they studied.
+PROFILE_FIELDS = ("name", "email", "phone_number", "location", "linkedin_url", "personal_website_url", "professional_summary")
+EDUCATION_FIELDS = ("institution_name", "degree", "field_of_study", "start_date", "end_date")
+EXPERIENCE_FIELDS = ("title", "company_name", "start_date", "end_date", "is_current", "description")
+PROJECT_FIELDS = ("name", "description", "github_url", "live_url")
+JOB_FIELDS = ("job_title", "company_name", "location")
+# Parts of the preprocessed description, admitted in this order until the budget runs out
+DESCRIPTION_SECTIONS = ("responsibilities", "requirements", "preferred", "summary", "details")
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token for English prose and JSON)."""
+    return max(1, math.ceil(len(text) / 4)) if text else 0
+
+
+def _terms(text: str) -> FrozenSet[str]:
+    return frozenset(term for term in _WORD.findall(text.lower()) if term not in STOPWORDS)
+
+
+def _project(row, fields) -> Dict:
+    """Copies the non-empty fields of a row as JSON-ready values."""
+    projected = {}
+    for field in fields:
+        value = getattr(row, field, None)
+        if value in (None, "", False):
+            continue
+        if isinstance(value, date):
+            value = value.isoformat()
+        elif not isinstance(value, (str, bool, int)):
+            value = str(value)  # HttpUrl and friends
+        projected[field] = value
+    return projected
+
+
+@dataclass
+class _Candidate:
+    section: str
+    order: int
+    item: Dict
+    terms: FrozenSet[str]
+    tokens: int
+    recency: str
+
+
+class CompactProfile:
+    """
+    The parts of a user's profile worth sending to the model, serialized once
+    and then trimmed per job posting by select().
+
+    Experiences, projects and skills are ranked by term overlap with the
+    posting and admitted greedily until the token budget runs out. Identity
+    fields and education are always included.
+    """
+
+    def __init__(self, user: models.User):
+        self.basics = _project(user, PROFILE_FIELDS)
+        self.educations = [_project(education, EDUCATION_FIELDS) for education in user.educations]
+        self.candidates: List[_Candidate] = []
+        for section, rows, fields in (
+            ("experiences", user.experiences, EXPERIENCE_FIELDS),
+            ("projects", user.projects, PROJECT_FIELDS),
+        ):
+            for order, row in enumerate(rows):
+                item = _project(row, fields)
+                self._add_candidate(section, order, item, " ".join(str(v) for v in item.values()), self._recency(row))
+        for order, skill in enumerate(user.skills):
+            item = _project(skill, ("name", "category"))
+            if item.get("name"):
+                self._add_candidate("skills", order, item, item["name"], "")
+
+    def _add_candidate(self, section: str, order: int, item: Dict, text: str, recency: str) -> None:
+        self.candidates.append(_Candidate(
+            section=section,
+            order=order,
+            item=item,
+            terms=_terms(text),
+            tokens=estimate_tokens(json.dumps(item, separators=(",", ":"))),
+            recency=recency,
+        ))
+
+    @staticmethod
+    def _recency(row) -> str:
+        if getattr(row, "is_current", False):
+            return "9999-12-31"
+        end_date = getattr(row, "end_date", None) or getattr(row, "start_date", None)
+        return end_date.isoformat() if end_date else ""
+
+    def select(self, job_data: Dict, token_budget: Optional[int] = None) -> Dict:
+        """Returns the prompt's user_profile payload for one job posting."""
+        if token_budget is None:
+            token_budget = settings.PROMPT_PROFILE_TOKEN_BUDGET
+        job_terms = _terms(_job_text(job_data))
+
+        def score(candidate: _Candidate) -> float:
+            if not candidate.terms:
+                return 0.0
+            # Damp the advantage long descriptions get from matching more terms.
+            return len(candidate.terms & job_terms) / math.sqrt(len(candidate.terms))
+
+        ranked = _newest_first(self.candidates)
+        ranked.sort(key=score, reverse=True)
+        remaining = token_budget
+        chosen: Dict[str, List[_Candidate]] = {"experiences": [], "projects": [], "skills": []}
+        for candidate in ranked:
+            if candidate.tokens <= remaining:
+                chosen[candidate.section].append(candidate)
+                remaining -= candidate.tokens
+
+        payload = dict(self.basics)
+        if self.educations:
+            payload["educations"] = self.educations
+        if chosen["experiences"]:
+            # Relevance decides what goes in; the resume still reads newest first.
+            payload["experiences"] = [c.item for c in _newest_first(chosen["experiences"])]
+        if chosen["projects"]:
+            payload["projects"] = [c.item for c in chosen["projects"]]
+        if chosen["skills"]:
+            skills: Dict[str, List[str]] = {}
+            for c in chosen["skills"]:
+                skills.setdefault(c.item.get("category") or "Other", []).append(c.item["name"])
+            payload["skills"] = skills
+        return payload
+
+    def selection_stats(self, payload: Dict) -> Dict:
+        """Kept/total counts per ranked section, for logging."""
+        totals = {section: 0 for section in ("experiences", "projects", "skills")}
+        for candidate in self.candidates:
+            totals[candidate.section] += 1
+        kept_skills = sum(len(names) for names in payload.get("skills", {}).values())
+        return {
+            "experiences": f"{len(payload.get('experiences', []))}/{totals['experiences']}",
+            "projects": f"{len(payload.get('projects', []))}/{totals['projects']}",
+            "skills": f"{kept_skills}/{totals['skills']}",
+        }
+
+
+def _newest_first(candidates: List[_Candidate]) -> List[_Candidate]:
+    # Two stable sorts: newest first, original profile order among equals.
+    ordered = sorted(candidates, key=lambda c: c.order)
+    ordered.sort(key=lambda c: c.recency, reverse=True)
+    return ordered
+
+
+def _job_text(job_data: Dict) -> str:
+    parts = [str(job_data.get("job_title", "")), str(job_data.get("job_description", ""))]
+    for section in DESCRIPTION_SECTIONS:
+        value = job_data.get(section)
+        if value:
+            parts.extend(value if isinstance(value, list) else [value])
+    return " ".join(parts)
+
+
+def job_description_form(job_posting: models.JobPosting) -> Optional[Dict]:
+    """The stored preprocessed description, rebuilt when missing or made by an older preprocessor."""
+    compact = job_posting.job_description_compact
+    if compact and compact.get("version") == DESCRIPTION_PREPROCESSOR_VERSION:
+        return compact
+    return condense_job_description(job_posting.job_description)
+
+
+def _fit_description(compact: Dict, token_budget: int) -> Dict:
+    fitted: Dict = {}
+    remaining = token_budget
+    for section in DESCRIPTION_SECTIONS:
+        value = compact.get(section)
+        if not value:
+            continue
+        for item in (value if isinstance(value, list) else [value]):
+            tokens = estimate_tokens(item)
+            if tokens > remaining:
+                continue
+            remaining -= tokens
+            if isinstance(value, list):
+                fitted.setdefault(section, []).append(item)
+            else:
+                fitted[section] = item
+    return fitted
+
+
+def compact_job_posting(job_posting: models.JobPosting, token_budget: Optional[int] = None) -> Dict:
+    """
+    Only the posting fields the prompt uses; ids, URLs and timestamps are left
+    out. The description goes in its preprocessed form, trimmed to the token
+    budget, or as scraped when nothing could be extracted from it.
+    """
+    if token_budget is None:
+        token_budget = settings.PROMPT_JOB_DESCRIPTION_TOKEN_BUDGET
+    job_data = _project(job_posting, JOB_FIELDS)
+    compact = job_description_form(job_posting)
+    if compact is None:
+        if job_posting.job_description:
+            job_data["job_description"] = job_posting.job_description
+    else:
+        job_data.update(_fit_description(compact, token_budget))
+    return job_data
+
+
+def description_token_savings(job_posting: models.JobPosting, job_data: Dict) -> Dict:
+    """Estimated description tokens as scraped and as sent, for logging."""
+    sent = {key: job_data[key] for key in ("job_description",) + DESCRIPTION_SECTIONS if key in job_data}
+    raw_tokens = estimate_tokens(job_posting.job_description or "")
+    sent_tokens = estimate_tokens(json.dumps(sent, separators=(",", ":"))) if sent else 0
+    return {
+        "description_tokens_raw": raw_tokens,
+        "description_tokens_sent": sent_tokens,
+        "description_tokens_saved": raw_tokens - sent_tokens,
+    }
@@ -0,0 +1,193 @@
+# In backend/app/services/scraping.py
+
+import asyncio
+import uuid
+from contextlib import nullcontext
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import crud, models, schemas
+from ..core.config import settings
+from ..core.singleflight import AsyncSingleFlight
+from ..db.locks import async_advisory_lock
+from ..logging_config import api_logger
+from ..scraping.cache import scrape_cache
+from ..scraping.browser_pool import BrowserPoolTimeout
+from ..scraping.description import condense_job_description
+from ..scraping.linkedin_scraper import LinkedInScraper
+from ..scraping.urls import canonicalize_job_url
+
+# Concurrent scrapes of the same canonical URL share one browser visit.
+scrape_flights = AsyncSingleFlight("scrape")
+
+def scrape_lock(canonical_url: str):
+    """Cross-process lock around resolving and storing one posting, when enabled."""
+    if settings.SINGLE_FLIGHT_ADVISORY_LOCKS:
+        return async_advisory_lock(f"scrape:{canonical_url}")
+    return nullcontext()
+
+async def get_job_payload(db: AsyncSession, canonical_url: str, scraper: LinkedInScraper) -> Optional[Dict]:
+    """
+    Returns the scraped fields for a canonical posting URL, trying the
+    cheapest source first: the in-process scrape cache, then a copy already
+    stored by any user, and only then a Playwright scrape.
+    """
+    job_data = scrape_cache.get(canonical_url)
+    if job_data is not None:
+        api_logger.info({"message": "Scrape cache hit", "url": canonical_url})
+        return job_data
+
+    stored_posting = await crud.jobpostings.get_job_posting_by_url_async(db, canonical_url)
+    if stored_posting is not None and stored_posting.job_title:
+        api_logger.info({"message": "Reused stored job posting instead of scraping", "url": canonical_url})
+        return cache_stored_posting(stored_posting)
+
+    return await scrape_job_payload(canonical_url, scraper)
+
+def cache_stored_posting(stored_posting) -> Dict:
+    """Seeds the scrape cache from a posting row and returns its payload."""
+    job_data = {
+        'title': stored_posting.job_title,
+        'company': stored_posting.company_name,
+        'location': stored_posting.location,
+        'description': stored_posting.job_description,
+        # Rows saved before preprocessing existed get their compact form here
+        'description_compact': stored_posting.job_description_compact or condense_job_description(stored_posting.job_description),
+    }
+    scrape_cache.set(stored_posting.url, job_data)
+    return job_data
+
+async def scrape_job_payload(canonical_url: str, scraper: LinkedInScraper) -> Optional[Dict]:
+    """Cache-or-browser half of get_job_payload; needs no database session."""
+    job_data = scrape_cache.get(canonical_url)
+    if job_data is not None:
+        return job_data
+    job_data = await scrape_flights.do(canonical_url, lambda: _scrape_and_cache(canonical_url, scraper))
+    # Every waiter gets its own copy to mutate.
+    return dict(job_data) if job_data else job_data
+
+async def _scrape_and_cache(canonical_url: str, scraper: LinkedInScraper) -> Optional[Dict]:
+    job_data = await scraper.scrape_job_posting(canonical_url)
+    # Partial results from a failed page load are returned but not cached.
+    if job_data and job_data.get('title'):
+        scrape_cache.set(canonical_url, job_data)
+    return job_data
+
+# --- Batch scraping ---
+
+INVALID_URL_ERROR = "Please provide a direct link to a job posting, not a search results page."
+
+async def prepare_batch(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    urls: List[str]
+) -> Tuple[List[Tuple[str, str]], Dict[str, models.JobPosting]]:
+    """
+    Canonicalizes the submitted URLs and does the batch's only pre-scrape
+    queries: postings the user already has, and copies stored by other
+    users, which are pushed into the scrape cache so they skip the browser.
+    Returns (submitted, canonical) URL pairs and the user's existing postings.
+    """
+    pairs = [(url, canonicalize_job_url(url)) for url in urls]
+    canonical_urls = list(dict.fromkeys(canonical for _, canonical in pairs if "jobs/search" not in canonical))
+
+    existing = {
+        posting.url: posting
+        for posting in await crud.jobpostings.get_user_job_postings_by_urls_async(db, user_id, canonical_urls)
+    }
+    missing = [url for url in canonical_urls if url not in existing and scrape_cache.get(url) is None]
+    if missing:
+        for stored_posting in await crud.jobpostings.get_job_postings_by_urls_async(db, missing):
+            if stored_posting.job_title:
+                cache_stored_posting(stored_posting)
+    return pairs, existing
+
+async def iter_scrape_payloads(
+    canonical_urls: List[str],
+    scraper: LinkedInScraper,
+    concurrency: int = settings.SCRAPE_BATCH_CONCURRENCY
+) -> AsyncIterator[Tuple[str, Optional[Dict], Optional[str]]]:
+    """
+    Scrapes URLs with at most `concurrency` in flight (each borrowing a
+    context from the shared browser pool) and yields
+    (canonical_url, job_data, error) in completion order.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def scrape_one(canonical_url: str):
+        async with semaphore:
+            try:
+                job_data = await scrape_job_payload(canonical_url, scraper)
+            except BrowserPoolTimeout:
+                return canonical_url, None, "The scraper is busy right now. Please try again shortly."
+            except Exception as e:
+                api_logger.error({"message": "Batch scrape failed for URL", "url": canonical_url, "error": str(e)})
+                return canonical_url, None, "An internal error occurred while scraping the job posting."
+        if not job_data:
+            return canonical_url, None, "Failed to scrape job posting."
+        return canonical_url, job_data, None
+
+    tasks = [asyncio.ensure_future(scrape_one(url)) for url in canonical_urls]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # A disconnected client should not leave scrapes running for nobody.
+        for task in tasks:
+            task.cancel()
+
+async def store_batch(
+    db: AsyncSession, user_id: uuid.UUID, payloads: Dict[str, Dict]
+) -> Tuple[Dict[str, models.JobPosting], Dict[str, models.JobPosting]]:
+    """
+    Saves every scraped payload with one bulk insert. Returns the created
+    postings and the ones a concurrent request saved first (skipped by the
+    insert), both keyed by canonical URL.
+    """
+    job_postings = [
+        schemas.JobPostingCreate(
+            user_id=user_id,
+            url=canonical_url,
+            job_title=job_data.get('title', ''),
+            company_name=job_data.get('company', ''),
+            location=job_data.get('location', ''),
+            job_description=job_data.get('description', ''),
+            job_description_compact=job_data.get('description_compact'),
+        )
+        for canonical_url, job_data in payloads.items()
+    ]
+    created = {posting.url: posting for posting in await crud.jobpostings.create_job_postings_bulk_async(db, job_postings)}
+    skipped = [canonical_url for canonical_url in payloads if canonical_url not in created]
+    saved_concurrently = await crud.jobpostings.get_user_job_postings_by_urls_async(db, user_id, skipped) if skipped else []
+    return created, {posting.url: posting for posting in saved_concurrently}
+
+def build_batch_response(
+    pairs: List[Tuple[str, str]],
+    existing: Dict[str, models.JobPosting],
+    created: Dict[str, models.JobPosting],
+    errors: Dict[str, str]
+) -> schemas.JobBatchScrapeResponse:
+    results = []
+    for url, canonical_url in pairs:
+        if "jobs/search" in canonical_url:
+            results.append(schemas.JobScrapeResult(url=url, canonical_url=canonical_url, status="failed", error=INVALID_URL_ERROR))
+        elif canonical_url in created:
+            results.append(schemas.JobScrapeResult(
+                url=url, canonical_url=canonical_url, status="created",
+                job_posting=schemas.JobPostingInDB.model_validate(created[canonical_url])
+            ))
+        elif canonical_url in existing:
+            results.append(schemas.JobScrapeResult(
+                url=url, canonical_url=canonical_url, status="existing",
+                job_posting=schemas.JobPostingInDB.model_validate(existing[canonical_url])
+            ))
+        else:
+            error = errors.get(canonical_url, "Failed to save job posting.")
+            results.append(schemas.JobScrapeResult(url=url, canonical_url=canonical_url, status="failed", error=error))
+
+    return schemas.JobBatchScrapeResponse(
+        results=results,
+        created=sum(1 for r in results if r.status == "created"),
+        existing=sum(1 for r in results if r.status == "existing"),
+        failed=sum(1 for r in results if r.status == "failed"),
+    )
@@ -0,0 +1,251 @@
+# In backend/app/services/sections.py
+
+import asyncio
+import json
+import time
+from concurrent.futures import wait, FIRST_EXCEPTION
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from ..core.config import settings
+from ..core.security import custom_json_serializer, llm_client, log_token_usage
+from ..llm import LLMResponse
+from ..logging_config import api_logger
+
+# Bump whenever the section prompts below change so cached generations are not reused.
+SECTION_PROMPT_VERSION = "1"
+
+
+@dataclass(frozen=True)
+class SectionSpec:
+    """One independently generated part of an application."""
+    key: str  # key in the generated data, as in the single-call JSON output
+    name: str  # as accepted by the regenerate endpoint
+    column: str  # Application column holding the text
+    label: str
+    model: str
+    max_output_tokens: int
+    instructions: str
+    # Whether the section is written from the whole profile, or only the user's name
+    needs_profile: bool = True
+
+
+SECTIONS = (
+    SectionSpec(
+        key="resume",
+        name="resume",
+        column="generated_resume_text",
+        label="resume",
+        model=settings.GENERATION_RESUME_MODEL or settings.GEMINI_MODEL,
+        max_output_tokens=settings.GENERATION_RESUME_MAX_OUTPUT_TOKENS,
+        instructions="Write a resume: a professional summary of the user's skills, experience, and education, tailored to match the keywords and requirements in the job description.",
+    ),
+    SectionSpec(
+        key="cover_letter",
+        name="cover_letter",
+        column="generated_cover_letter_text",
+        label="cover letter",
+        model=settings.GENERATION_COVER_LETTER_MODEL or settings.GEMINI_MODEL,
+        max_output_tokens=settings.GENERATION_COVER_LETTER_MAX_OUTPUT_TOKENS,
+        instructions="Write a cover letter: a formal, one-page document expressing the user's interest and highlighting why they are a good fit for the role based on their profile.",
+    ),
+    SectionSpec(
+        key="generated_email_template",
+        name="email",
+        column="generated_email_template",
+        label="email",
+        model=settings.GENERATION_EMAIL_MODEL,
+        max_output_tokens=settings.GENERATION_EMAIL_MAX_OUTPUT_TOKENS,
+        instructions="Write a brief, professional email to send with the resume and cover letter as attachments.",
+        needs_profile=False,
+    ),
+)
+
+SECTIONS_BY_NAME = {spec.name: spec for spec in SECTIONS}
+SECTIONS_BY_KEY = {spec.key: spec for spec in SECTIONS}
+
+# Posting fields a section written without the profile still needs
+HEADLINE_JOB_FIELDS = ("job_title", "company_name")
+
+
+def sections_model_key() -> str:
+    """Models and output caps of every section, for the generation fingerprint."""
+    return ",".join(f"{spec.key}={spec.model}:{spec.max_output_tokens}" for spec in SECTIONS)
+
+
+def build_generation_context(user_data: dict, job_data: dict) -> str:
+    """The profile and posting, serialized once and shared by every section prompt."""
+    return (
+        "The user's professional profile is:\n"
+        f"<user_profile>\n{json.dumps(user_data, separators=(',', ':'), default=custom_json_serializer)}\n</user_profile>\n\n"
+        "The job posting details are:\n"
+        f"<job_posting>\n{json.dumps(job_data, separators=(',', ':'), default=custom_json_serializer)}\n</job_posting>"
+    )
+
+
+def build_section_prompt(spec: SectionSpec, context: str) -> str:
+    return (
+        "You are an expert career assistant helping with a job application.\n\n"
+        f"{context}\n\n"
+        f"{spec.instructions}\n"
+        f"Return only the {spec.label} text, without a preamble, JSON or code fences."
+    )
+
+
+def build_regeneration_prompt(spec: SectionSpec, context: str, previous_text: str, instructions: Optional[str]) -> str:
+    """
+    Prompt for rewriting one section of an existing application. The current
+    text is only sent along with instructions to revise it; otherwise the
+    section is written afresh from the context.
+    """
+    if not instructions:
+        return build_section_prompt(spec, context)
+    return (
+        "You are an expert career assistant helping with a job application.\n\n"
+        f"{context}\n\n"
+        f"The current {spec.label} is:\n<current>\n{previous_text}\n</current>\n\n"
+        f"{spec.instructions}\nRevise the current {spec.label} as follows: {instructions}\n"
+        f"Return only the {spec.label} text, without a preamble, JSON or code fences."
+    )
+
+
+async def regenerate_section_async(
+    spec: SectionSpec, user_data: dict, job_data: dict, previous_text: str, instructions: Optional[str] = None
+) -> Tuple[str, LLMResponse]:
+    """One LLM call for a single section, with that section's model and output cap."""
+    prompt = build_regeneration_prompt(spec, build_generation_context(user_data, job_data), previous_text, instructions)
+    started = time.perf_counter()
+    response = await llm_client.generate(prompt, model=spec.model, max_output_tokens=spec.max_output_tokens)
+    log_token_usage(prompt, response, section=spec.key)
+    api_logger.info({
+        "message": "Section regenerated",
+        "section": spec.name,
+        "model": spec.model,
+        "process_time_ms": int((time.perf_counter() - started) * 1000),
+    })
+    return _section_text(spec, response), response
+
+
+def _section_text(spec: SectionSpec, response: LLMResponse) -> str:
+    return clean_section_text(spec, response.text, response.finish_reason)
+
+
+def clean_section_text(spec: SectionSpec, text: str, finish_reason: Optional[str] = None) -> str:
+    """A section's text as stored: stripped and unfenced. Raises ValueError when nothing is left."""
+    text = text.strip()
+    # Models occasionally fence plain text anyway
+    if text.startswith("```") and text.endswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        text = text[:-3].strip()
+    if not text:
+        raise ValueError(f"Gemini returned an empty {spec.label} (finish reason {finish_reason}).")
+    return text
+
+
+def _assemble(results: List[Tuple[SectionSpec, str, LLMResponse, float]], started: float) -> Dict[str, str]:
+    generated_data = {}
+    section_ms = {}
+    for spec, prompt, response, elapsed in results:
+        log_token_usage(prompt, response, section=spec.key)
+        generated_data[spec.key] = _section_text(spec, response)
+        section_ms[spec.key] = int(elapsed * 1000)
+    api_logger.info({
+        "message": "Sectioned generation finished",
+        "wall_ms": int((time.perf_counter() - started) * 1000),
+        "sum_of_sections_ms": sum(section_ms.values()),
+        "section_ms": section_ms,
+    })
+    return generated_data
+
+
+async def generate_sections_async(
+    user_data: dict, job_data: dict, specs: Sequence[SectionSpec] = SECTIONS
+) -> Dict[str, str]:
+    """
+    Writes every section in `specs` as its own concurrent LLM call, so wall
+    time tracks the slowest section rather than the sum. Returns the same
+    keys as the single-call JSON output.
+    """
+    context = build_generation_context(user_data, job_data)
+    started = time.perf_counter()
+
+    async def generate(spec: SectionSpec):
+        prompt = build_section_prompt(spec, context)
+        section_started = time.perf_counter()
+        response = await llm_client.generate(prompt, model=spec.model, max_output_tokens=spec.max_output_tokens)
+        return spec, prompt, response, time.perf_counter() - section_started
+
+    tasks = [asyncio.ensure_future(generate(spec)) for spec in specs]
+    try:
+        results = await asyncio.gather(*tasks)
+    finally:
+        # One failed section fails the application; stop paying for the others
+        for task in tasks:
+            task.cancel()
+    return _assemble(results, started)
+
+
+def generate_sections(user_data: dict, job_data: dict, specs: Sequence[SectionSpec] = SECTIONS) -> Dict[str, str]:
+    """Blocking generate_sections_async for sync callers; the calls still run concurrently."""
+    context = build_generation_context(user_data, job_data)
+    started = time.perf_counter()
+    prompts = [build_section_prompt(spec, context) for spec in specs]
+    futures = [
+        llm_client.submit(prompt, model=spec.model, max_output_tokens=spec.max_output_tokens)
+        for spec, prompt in zip(specs, prompts)
+    ]
+    finished_at = {}
+    for future in futures:
+        future.add_done_callback(lambda f: finished_at.setdefault(id(f), time.perf_counter()))
+    wait(futures, return_when=FIRST_EXCEPTION)
+    try:
+        responses = [future.result() for future in futures]
+    finally:
+        for future in futures:
+            future.cancel()
+    return _assemble(
+        [(spec, prompt, response, finished_at[id(future)] - started)
+         for spec, prompt, response, future in zip(specs, prompts, responses, futures)],
+        started,
+    )
+
+
+async def stream_sections(user_data: dict, job_data: dict) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Streams all sections at once as (section, text) deltas, interleaved in
+    the order the chunks arrive.
+    """
+    context = build_generation_context(user_data, job_data)
+    started = time.perf_counter()
+    deltas: asyncio.Queue = asyncio.Queue()
+
+    async def pump(spec: SectionSpec):
+        prompt = build_section_prompt(spec, context)
+        usage = None
+        try:
+            async for chunk in llm_client.stream(prompt, model=spec.model, max_output_tokens=spec.max_output_tokens):
+                # The final chunk carries the token counts for the whole exchange.
+                if chunk.prompt_tokens is not None:
+                    usage = chunk
+                if chunk.text:
+                    await deltas.put((spec.key, chunk.text))
+            log_token_usage(prompt, usage, section=spec.key)
+            await deltas.put((spec.key, None))
+        except Exception as e:
+            await deltas.put((spec.key, e))
+
+    tasks = [asyncio.ensure_future(pump(spec)) for spec in SECTIONS]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            section, item = await deltas.get()
+            if item is None:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield section, item
+        api_logger.info({"message": "Sectioned generation streamed", "wall_ms": int((time.perf_counter() - started) * 1000)})
+    finally:
+        for task in tasks:
+            task.cancel()
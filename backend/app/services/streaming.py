@@ -0,0 +1,162 @@
+# In backend/app/services/streaming.py
+
+import json
+from typing import Dict, List, Optional, Set, Tuple
+
+APPLICATION_SECTIONS = ("resume", "cover_letter", "generated_email_template")
+
+_END_OF_STRING = object()
+
+_SIMPLE_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+
+
+class SectionStreamParser:
+    """
+    Incrementally scans the model's JSON output as it streams in and yields
+    the decoded text of each top-level section as soon as it arrives.
+
+    Only string contents are emitted. When a section comes back as a nested
+    object (the model sometimes structures the resume), the strings inside it
+    are emitted in order, separated by blank lines.
+
+    The same scan recovers output that is not valid JSON as a whole: text is
+    collected per section, and a section counts as complete once its value
+    has closed, so a reply cut off mid-way still yields the sections before
+    the cut.
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._string_is_key = False
+        self._escape = False
+        self._unicode_digits: Optional[str] = None
+        self._expect_key = False
+        self._key_buffer: List[str] = []
+        self._last_key: Optional[str] = None
+        self._section: Optional[str] = None
+        self._section_has_text = False
+        # Open brackets below the top-level object, innermost last.
+        self._containers: List[str] = []
+        self._texts: Dict[str, List[str]] = {}
+        self.complete_sections: Set[str] = set()
+        self.started = False
+        self.closed = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        """Consume a chunk of raw model output; returns (section, text) deltas."""
+        deltas: List[Tuple[str, str]] = []
+        pending: List[str] = []
+
+        def flush():
+            if pending and self._section is not None:
+                text = "".join(pending)
+                deltas.append((self._section, text))
+                self._texts[self._section].append(text)
+            pending.clear()
+
+        for char in chunk:
+            if self._in_string:
+                decoded = self._decode_string_char(char)
+                if decoded is None:
+                    continue
+                if decoded is _END_OF_STRING:
+                    self._in_string = False
+                    if self._string_is_key:
+                        self._last_key = "".join(self._key_buffer)
+                        self._key_buffer.clear()
+                    elif self._depth == 1:
+                        self._end_section()
+                    continue
+                if self._string_is_key:
+                    self._key_buffer.append(decoded)
+                elif self._section is not None:
+                    pending.append(decoded)
+                continue
+
+            if self._depth == 0:
+                # Skip anything before the opening brace, e.g. a ```json fence, and after the closing one.
+                if char == '{' and not self.started:
+                    self._depth = 1
+                    self._expect_key = True
+                    self.started = True
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_is_key = self._expect_key
+                if not self._string_is_key and self._section is not None:
+                    if self._section_has_text:
+                        pending.append("\n\n")
+                    self._section_has_text = True
+            elif char == ':':
+                self._expect_key = False
+                if self._depth == 1:
+                    flush()
+                    self._section = self._last_key if self._last_key in APPLICATION_SECTIONS else None
+                    self._section_has_text = False
+                    if self._section is not None:
+                        self._texts[self._section] = []
+                        self.complete_sections.discard(self._section)
+            elif char == ',':
+                # Inside an object the next string is a key; inside arrays it is a value.
+                self._expect_key = self._container_is_object()
+            elif char in '{[':
+                self._depth += 1
+                self._containers.append(char)
+                self._expect_key = char == '{'
+            elif char in '}]':
+                self._depth -= 1
+                if self._containers:
+                    self._containers.pop()
+                if self._depth == 1:
+                    self._expect_key = False
+                    self._end_section()
+                elif self._depth == 0:
+                    flush()
+                    self.closed = True
+
+        flush()
+        return deltas
+
+    def sections(self, complete_only: bool = True) -> Dict[str, str]:
+        """Text collected so far per section; by default only sections whose value has closed."""
+        return {
+            section: "".join(parts)
+            for section, parts in self._texts.items()
+            if not complete_only or section in self.complete_sections
+        }
+
+    def _end_section(self) -> None:
+        if self._section is not None:
+            self.complete_sections.add(self._section)
+
+    def _container_is_object(self) -> bool:
+        return not self._containers or self._containers[-1] == '{'
+
+    def _decode_string_char(self, char: str):
+        if self._unicode_digits is not None:
+            self._unicode_digits += char
+            if len(self._unicode_digits) < 4:
+                return None
+            digits, self._unicode_digits = self._unicode_digits, None
+            try:
+                return chr(int(digits, 16))
+            except ValueError:
+                return ""
+        if self._escape:
+            self._escape = False
+            if char == 'u':
+                self._unicode_digits = ""
+                return None
+            return _SIMPLE_ESCAPES.get(char, char)
+        if char == '\\':
+            self._escape = True
+            return None
+        if char == '"':
+            return _END_OF_STRING
+        return char
+
+
+def format_sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
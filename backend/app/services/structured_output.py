@@ -0,0 +1,125 @@
+# In backend/app/services/structured_output.py
+
+import json
+import threading
+from typing import Dict
+
+from .. import schemas
+from ..logging_config import api_logger
+from .streaming import APPLICATION_SECTIONS, SectionStreamParser
+
+# Keys of the single-call JSON output and the ApplicationCreate fields they fill
+APPLICATION_TEXT_FIELDS = {
+    "resume": "generated_resume_text",
+    "cover_letter": "generated_cover_letter_text",
+    "generated_email_template": "generated_email_template",
+}
+
+
+def build_application_response_schema() -> dict:
+    """
+    Gemini response schema for the single-call prompt: one string per
+    ApplicationCreate text field, in the order the sections are written, so
+    a reply cut short loses the email before the resume.
+    """
+    properties = {}
+    for key in APPLICATION_SECTIONS:
+        field = schemas.ApplicationCreate.model_fields[APPLICATION_TEXT_FIELDS[key]]
+        if field.annotation is not str:
+            raise TypeError(f"ApplicationCreate.{APPLICATION_TEXT_FIELDS[key]} is no longer a string field.")
+        properties[key] = {"type": "STRING", "description": f"Plain text for {APPLICATION_TEXT_FIELDS[key]}."}
+    return {
+        "type": "OBJECT",
+        "properties": properties,
+        "required": list(APPLICATION_SECTIONS),
+        "propertyOrdering": list(APPLICATION_SECTIONS),
+    }
+
+
+APPLICATION_RESPONSE_SCHEMA = build_application_response_schema()
+
+
+class MalformedOutputError(ValueError):
+    """Nothing usable could be recovered from the model's output."""
+
+
+class StructuredOutputStats:
+    """How often the single-call output parsed cleanly, needed repair, or was unusable."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.parsed = 0
+        self.repaired = 0
+        self.failed = 0
+        self.truncated = 0
+        self.sections_recovered = 0
+        self.sections_missing = 0
+        self.sections_refilled = 0
+
+    def record(self, **counts: int) -> None:
+        with self._lock:
+            for name, count in counts.items():
+                setattr(self, name, getattr(self, name) + count)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "parsed": self.parsed,
+                "repaired": self.repaired,
+                "failed": self.failed,
+                "truncated": self.truncated,
+                "sections_recovered": self.sections_recovered,
+                "sections_missing": self.sections_missing,
+                "sections_refilled": self.sections_refilled,
+            }
+
+
+structured_output_stats = StructuredOutputStats()
+
+
+def parse_application_output(text: str) -> Dict[str, str]:
+    """
+    Parses the single-call JSON output into {section: text}.
+
+    Well-formed output with a string per section goes through json.loads.
+    Anything else (fences, nested objects, a reply cut off mid-way) is
+    scanned by the tolerant SectionStreamParser, which flattens nested
+    sections and keeps every section whose value closed. Sections that could
+    not be recovered are left out for the caller to generate separately;
+    MalformedOutputError is raised only when none could be.
+    """
+    stripped = text.strip()
+    if stripped.startswith("```json") and stripped.endswith("```"):
+        stripped = stripped[7:-3].strip()
+    try:
+        data = json.loads(stripped)
+    except ValueError:
+        data = None
+    if isinstance(data, dict) and all(isinstance(data.get(key), str) and data[key].strip() for key in APPLICATION_SECTIONS):
+        structured_output_stats.record(parsed=1)
+        return {key: data[key] for key in APPLICATION_SECTIONS}
+
+    parser = SectionStreamParser()
+    parser.feed(stripped)
+    recovered = {section: value.strip() for section, value in parser.sections().items() if value.strip()}
+    missing = [section for section in APPLICATION_SECTIONS if section not in recovered]
+    truncated = parser.started and not parser.closed
+    if not recovered:
+        structured_output_stats.record(failed=1, truncated=int(truncated))
+        api_logger.error({"message": "LLM output could not be parsed", "length": len(text), "head": text[:200]})
+        raise MalformedOutputError("Failed to parse LLM response. The generated content may be malformed.")
+
+    structured_output_stats.record(
+        repaired=1, truncated=int(truncated), sections_recovered=len(recovered), sections_missing=len(missing)
+    )
+    api_logger.warning({
+        "message": "Repaired malformed LLM output",
+        "truncated": truncated,
+        "recovered_sections": sorted(recovered),
+        "missing_sections": missing,
+    })
+    return recovered
+
+
+def missing_sections(generated_data: Dict[str, str]) -> list:
+    return [section for section in APPLICATION_SECTIONS if section not in generated_data]
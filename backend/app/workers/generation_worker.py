@@ -0,0 +1,142 @@
+# In backend/app/workers/generation_worker.py
+"""
+Drains the generation_jobs queue. Run one or more of these alongside the API:
+
+    python -m app.workers.generation_worker
+"""
+
+import signal
+import threading
+import time
+from contextlib import contextmanager
+
+from .. import crud
+from ..core.config import settings
+from ..db.database import SessionLocal
+from ..logging_config import api_logger
+from ..services.generation import generate_and_store_application, generation_lock
+
+
+class GenerationWorker:
+    def __init__(
+        self,
+        poll_interval: float = settings.GENERATION_WORKER_POLL_INTERVAL_SECONDS,
+        lease_seconds: int = settings.GENERATION_JOB_LEASE_SECONDS,
+        max_attempts: int = settings.GENERATION_JOB_MAX_ATTEMPTS,
+    ):
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._stopping = False
+
+    def stop(self, *_):
+        # Finish the job in hand, then exit the loop.
+        self._stopping = True
+
+    def run(self):
+        api_logger.info({"message": "Generation worker started", "poll_interval": self.poll_interval})
+        while not self._stopping:
+            if not self.run_once():
+                time.sleep(self.poll_interval)
+        api_logger.info({"message": "Generation worker stopped"})
+
+    @contextmanager
+    def lease_heartbeat(self, generation_job):
+        """
+        Renews the job's lease every third of GENERATION_JOB_LEASE_SECONDS while
+        it is generated, so a slow generation (a long single call followed by a
+        section refill) is not reclaimed by another worker mid-way. Renewals use
+        their own session because the job's session is busy on this thread.
+        """
+        job_id, attempt = generation_job.id, generation_job.attempts
+        stopped = threading.Event()
+
+        def renew():
+            while not stopped.wait(self.lease_seconds / 3):
+                db = SessionLocal()
+                try:
+                    if not crud.generation_jobs.renew_generation_job_lease(db, job_id, attempt):
+                        return
+                except Exception as e:
+                    api_logger.warning({"message": "Generation job lease renewal failed", "job_id": str(job_id), "error": str(e)})
+                finally:
+                    db.close()
+
+        heartbeat = threading.Thread(target=renew, name=f"lease-{job_id}", daemon=True)
+        heartbeat.start()
+        try:
+            yield
+        finally:
+            stopped.set()
+            heartbeat.join()
+
+    def log_reclaimed(self, job_id: str, attempt: int):
+        api_logger.warning({
+            "message": "Generation job was reclaimed by another worker; dropping this attempt's outcome",
+            "job_id": job_id,
+            "attempt": attempt,
+        })
+
+    def run_once(self) -> bool:
+        """Processes at most one job. Returns False when the queue was empty."""
+        db = SessionLocal()
+        try:
+            generation_job = crud.generation_jobs.claim_next_generation_job(
+                db, lease_seconds=self.lease_seconds, max_attempts=self.max_attempts
+            )
+            if generation_job is None:
+                return False
+
+            job_id = str(generation_job.id)
+            # Read before any rollback expires the row; completion is fenced on this attempt
+            job_uuid, attempt = generation_job.id, generation_job.attempts
+            started = time.time()
+
+            user_with_relations = crud.users.get_user_with_relations(db, user_id=generation_job.user_id)
+            job_posting = crud.jobpostings.get_job_posting(db, generation_job.job_posting_id)
+            if not user_with_relations or not job_posting:
+                if crud.generation_jobs.mark_generation_job_failed(
+                    db, job_uuid, attempt, error="User profile or job posting not found.", retry=False
+                ):
+                    api_logger.warning({"message": "Generation job references missing data", "job_id": job_id})
+                else:
+                    self.log_reclaimed(job_id, attempt)
+                return True
+
+            try:
+                with self.lease_heartbeat(generation_job), generation_lock(user_with_relations.id, job_posting.id):
+                    _, db_application = generate_and_store_application(
+                        db, user_with_relations, job_posting, force_regenerate=generation_job.force_regenerate
+                    )
+            except Exception as e:
+                db.rollback()
+                retry = attempt < self.max_attempts
+                if not crud.generation_jobs.mark_generation_job_failed(db, job_uuid, attempt, error=str(e), retry=retry):
+                    self.log_reclaimed(job_id, attempt)
+                    return True
+                api_logger.error(
+                    {"message": "Generation job failed", "job_id": job_id, "attempts": attempt, "will_retry": retry, "error": str(e)},
+                    exc_info=True
+                )
+                return True
+
+            if not crud.generation_jobs.mark_generation_job_succeeded(db, job_uuid, attempt, application_id=db_application.id):
+                self.log_reclaimed(job_id, attempt)
+                return True
+            api_logger.info(
+                {"message": "Generation job succeeded", "job_id": job_id, "application_id": db_application.id, "process_time_ms": int((time.time() - started) * 1000)}
+            )
+            return True
+        finally:
+            db.close()
+
+
+def main():
+    worker = GenerationWorker()
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run()
+
+
+if __name__ == "__main__":
+    main()
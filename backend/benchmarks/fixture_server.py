@@ -0,0 +1,93 @@
+# In backend/benchmarks/fixture_server.py
+"""
+Local stand-in for LinkedIn job pages: serves the saved pages listed in
+benchmarks/fixtures/linkedin/manifest.json at /jobs/view/<job_id>/.
+
+    cd backend
+    python -m benchmarks.fixture_server --port 8800 --latency-ms 150
+
+Also used in-process by benchmarks.scraper_fixtures.
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "linkedin")
+
+
+def load_manifest(fixtures_dir: str = FIXTURES_DIR) -> List[Dict]:
+    with open(os.path.join(fixtures_dir, "manifest.json"), encoding="utf-8") as f:
+        return json.load(f)["fixtures"]
+
+
+class FixtureServer:
+    """Threaded HTTP server for the fixture pages, with optional added latency per response."""
+
+    def __init__(self, fixtures_dir: str = FIXTURES_DIR, host: str = "127.0.0.1", port: int = 0, latency_ms: int = 0):
+        self.fixtures = load_manifest(fixtures_dir)
+        pages = {}
+        for fixture in self.fixtures:
+            with open(os.path.join(fixtures_dir, fixture["file"]), "rb") as f:
+                pages[f"/jobs/view/{fixture['job_id']}/"] = f.read()
+        delay = latency_ms / 1000
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if delay:
+                    time.sleep(delay)
+                body = pages.get(self.path.split("?", 1)[0])
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_for(self, fixture: Dict) -> str:
+        return f"{self.base_url}/jobs/view/{fixture['job_id']}/"
+
+    def __enter__(self) -> "FixtureServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--latency-ms", type=int, default=0, help="delay added to every response")
+    args = parser.parse_args()
+
+    with FixtureServer(port=args.port, latency_ms=args.latency_ms) as server:
+        for fixture in server.fixtures:
+            print(f"{server.url_for(fixture)}  {fixture['file']}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# In backend/benchmarks/generation_modes.py
+"""
+Compares single-call generation with sectioned generation (resume, cover
+letter and email written as concurrent calls) against the Gemini stub
+server, which takes time proportional to the tokens it returns.
+
+    cd backend
+    python -m benchmarks.generation_modes --runs 5 --ms-per-output-token 5
+
+Reports the p50 wall time of each mode through the async, sync and
+streaming paths.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# Settings are read at import time, so point the client at the stub first
+STUB_PORT = _free_port()
+os.environ["LLM_PROVIDER"] = "gemini"
+os.environ["LLM_BASE_URL"] = f"http://127.0.0.1:{STUB_PORT}"
+
+from app.core.security import (  # noqa: E402
+    generate_resume_and_cover_letter,
+    generate_resume_and_cover_letter_async,
+    llm_client,
+    stream_resume_and_cover_letter,
+)
+from app.services.sections import generate_sections, generate_sections_async, stream_sections  # noqa: E402
+from benchmarks.llm_stub_server import LLMStubServer  # noqa: E402
+
+USER_DATA = {
+    "name": "Alex Doe",
+    "experiences": [{"title": "Platform Engineer", "company": "Acme", "description": "Ran Kubernetes clusters and CI."}],
+    "skills": ["Python", "Kubernetes", "PostgreSQL"],
+}
+JOB_DATA = {"job_title": "Site Reliability Engineer", "company_name": "Globex", "description": "Operate services at scale."}
+
+
+async def drain(stream):
+    async for _ in stream:
+        pass
+
+
+async def time_async(call, runs):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def time_sync(call, runs):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await asyncio.to_thread(call)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def main_async(args):
+    paths = {
+        "async": (
+            lambda: time_async(lambda: generate_resume_and_cover_letter_async(USER_DATA, JOB_DATA), args.runs),
+            lambda: time_async(lambda: generate_sections_async(USER_DATA, JOB_DATA), args.runs),
+        ),
+        "sync": (
+            lambda: time_sync(lambda: generate_resume_and_cover_letter(USER_DATA, JOB_DATA), args.runs),
+            lambda: time_sync(lambda: generate_sections(USER_DATA, JOB_DATA), args.runs),
+        ),
+        "stream": (
+            lambda: time_async(lambda: drain(stream_resume_and_cover_letter(USER_DATA, JOB_DATA)), args.runs),
+            lambda: time_async(lambda: drain(stream_sections(USER_DATA, JOB_DATA)), args.runs),
+        ),
+    }
+    print(f"stub: {args.latency_ms} ms to first token, {args.ms_per_output_token} ms per output token (half for lite models)")
+    for path, (single, sectioned) in paths.items():
+        single_ms = await single()
+        sectioned_ms = await sectioned()
+        print(f"  {path:<7} single call p50 {single_ms:7.0f} ms   sectioned p50 {sectioned_ms:7.0f} ms   ({single_ms / sectioned_ms:.1f}x)")
+    await llm_client.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--latency-ms", type=int, default=300, help="stub time to first token")
+    parser.add_argument("--ms-per-output-token", type=float, default=5.0)
+    args = parser.parse_args()
+
+    with LLMStubServer(port=STUB_PORT, latency_ms=args.latency_ms, ms_per_output_token=args.ms_per_output_token):
+        asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
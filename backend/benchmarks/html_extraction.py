@@ -0,0 +1,163 @@
+# In backend/benchmarks/html_extraction.py
+"""
+Compares job page extraction engines over the saved pages in
+benchmarks/fixtures/linkedin: the previous BeautifulSoup html.parser
+extractor and the lxml one in app/scraping/extraction.py.
+
+    cd backend
+    python -m benchmarks.html_extraction --runs 50
+
+Reports per page the p50 extraction time (selectors only, and including the
+Markdown conversion), the peak RSS growth and Python heap peak of a single
+extraction measured in a fresh process, and whether both engines produced
+the same fields.
+"""
+
+import argparse
+import glob
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(BACKEND_DIR, "benchmarks", "fixtures", "linkedin")
+sys.path.insert(0, BACKEND_DIR)
+
+from app.scraping.extraction import FIELD_SELECTORS, description_to_markdown, extract_fields  # noqa: E402
+
+
+def extract_with_soup(html: str) -> dict:
+    """The extractor LinkedInScraper used before: full-page html.parser soup and select_one per selector."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+
+    def first(field):
+        for selector in FIELD_SELECTORS[field]:
+            element = soup.select_one(selector)
+            if element:
+                return element
+        return None
+
+    def text(element):
+        return element.get_text(strip=True) if element else ""
+
+    description = first("description")
+    return {
+        "title": text(first("title")),
+        "company": text(first("company")),
+        "location": text(first("location")),
+        "description_html": str(description) if description else None,
+    }
+
+
+ENGINES = {"beautifulsoup": extract_with_soup, "lxml": extract_fields}
+
+
+def to_job_data(fields: dict) -> dict:
+    return {
+        "title": fields["title"],
+        "company": fields["company"],
+        "location": fields["location"],
+        "description": description_to_markdown(fields["description_html"]) if fields["description_html"] else "",
+    }
+
+
+def time_engine(extract, html: str, runs: int):
+    selectors_ms, total_ms = [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fields = extract(html)
+        extracted = time.perf_counter()
+        to_job_data(fields)
+        finished = time.perf_counter()
+        selectors_ms.append((extracted - started) * 1000)
+        total_ms.append((finished - started) * 1000)
+    return statistics.median(selectors_ms), statistics.median(total_ms)
+
+
+def _proc_status_kb(field: str) -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    raise KeyError(field)
+
+
+def measure_memory(engine: str, path: str, kind: str) -> int:
+    """
+    One extraction (without the Markdown step, which both engines share) in a
+    fresh process, so each measurement starts from a clean heap.
+    kind "rss" is peak RSS growth, which includes libxml2's allocations;
+    "heap" is the tracemalloc peak, Python objects only. They are measured
+    in separate processes because tracemalloc itself inflates RSS.
+    """
+    with open(path, encoding="utf-8") as f:
+        html = f.read()
+    # Warm up first so lazy imports and selector caches are not counted
+    to_job_data(ENGINES[engine]('<h1>t</h1><div class="description__text"><p>d</p></div>'))
+    if kind == "heap":
+        tracemalloc.start()
+        ENGINES[engine](html)
+        return tracemalloc.get_traced_memory()[1] // 1024
+    try:
+        # Reset the peak RSS mark so import-time peaks do not hide the parse (Linux only)
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        baseline_kb = _proc_status_kb("VmRSS")
+        ENGINES[engine](html)
+        return _proc_status_kb("VmHWM") - baseline_kb
+    except OSError:
+        baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        ENGINES[engine](html)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_kb
+
+
+def memory_in_child(engine: str, path: str, kind: str) -> int:
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.html_extraction", "--measure-memory", engine, path, kind],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    ).stdout
+    return int(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--fixtures", default=os.path.join(FIXTURES_DIR, "*.html"), help="glob of saved pages")
+    parser.add_argument("--measure-memory", nargs=3, metavar=("ENGINE", "FIXTURE", "KIND"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure_memory:
+        print(measure_memory(*args.measure_memory))
+        return
+
+    totals = {engine: 0.0 for engine in ENGINES}
+    for path in sorted(glob.glob(args.fixtures)):
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        outputs = {engine: to_job_data(extract(html)) for engine, extract in ENGINES.items()}
+        mismatched = [field for field in outputs["lxml"] if outputs["lxml"][field] != outputs["beautifulsoup"][field]]
+
+        print(f"{os.path.basename(path)} ({len(html) // 1024} KB)")
+        for engine, extract in ENGINES.items():
+            selectors_ms, total_ms = time_engine(extract, html, args.runs)
+            totals[engine] += total_ms
+            print(
+                f"  {engine:<14} extract p50 {selectors_ms:7.2f} ms  with markdown {total_ms:7.2f} ms  "
+                f"RSS +{memory_in_child(engine, path, 'rss'):>6} KB  "
+                f"Python heap peak {memory_in_child(engine, path, 'heap'):>6} KB"
+            )
+        print(f"  fields identical: {'yes' if not mismatched else 'no, differs in ' + ', '.join(mismatched)}")
+
+    if totals["lxml"]:
+        print(f"\nTotal p50 time, all pages: beautifulsoup {totals['beautifulsoup']:.1f} ms, "
+              f"lxml {totals['lxml']:.1f} ms ({totals['beautifulsoup'] / totals['lxml']:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# In backend/benchmarks/llm_client.py
+"""
+Exercises LLMClient against the Gemini stub server (benchmarks.llm_stub_server)
+through the real GeminiProvider, without network access or an API key.
+
+    cd backend
+    python -m benchmarks.llm_client --calls 200 --concurrency 10
+
+Scenarios:
+  tail     5% of responses are slow; compares p50/p95/p99 without and with hedging
+  errors   20% of responses are 503; compares success rate without and with retries
+  outage   every response is 503; shows how many requests reach the upstream and
+           how fast callers fail once the circuit breaker opens
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.core.ratelimit import AsyncTokenBucket  # noqa: E402
+from app.llm import CircuitBreaker, LLMClient, LLMError  # noqa: E402
+from app.llm.gemini import GeminiProvider  # noqa: E402
+from benchmarks.llm_stub_server import LLMStubServer  # noqa: E402
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+def make_client(base_url: str, max_retries: int = 0, hedge_after: float = 0.0, breaker_threshold: int = 1000) -> LLMClient:
+    return LLMClient(
+        lambda: GeminiProvider(api_key="stub", base_url=base_url, max_connections=50, connect_timeout=5),
+        default_model="gemini-2.5-flash",
+        rate_limiter=AsyncTokenBucket(rate_per_minute=1_000_000, burst=1000),
+        breaker=CircuitBreaker(breaker_threshold, reset_timeout=30),
+        timeout=30,
+        attempt_timeout=20,
+        max_retries=max_retries,
+        backoff_base=0.05,
+        backoff_max=0.5,
+        hedge_after=hedge_after,
+    )
+
+
+async def run_calls(client: LLMClient, calls: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await client.generate("Write a resume for a platform engineer.")
+                ok = True
+            except LLMError:
+                ok = False
+            return (time.perf_counter() - started) * 1000, ok
+
+    results = await asyncio.gather(*[one() for _ in range(calls)])
+    await client.aclose()
+    return [ms for ms, _ in results], sum(ok for _, ok in results)
+
+
+def report(label, latencies, succeeded, calls, client, server_requests):
+    stats = client.stats()
+    print(
+        f"  {label:<24} p50 {statistics.median(latencies):7.0f} ms  p95 {percentile(latencies, 95):7.0f} ms  "
+        f"p99 {percentile(latencies, 99):7.0f} ms  ok {succeeded}/{calls}  upstream requests {server_requests:>4}  "
+        f"retries {stats['retries']:>3}  hedges {stats['hedges']:>3} (won {stats['hedge_wins']})  "
+        f"short-circuited {stats['breaker_rejected']:>3}"
+    )
+
+
+async def scenario(label, server_options, client_options, calls, concurrency):
+    with LLMStubServer(**server_options) as server:
+        client = make_client(server.base_url, **client_options)
+        latencies, succeeded = await run_calls(client, calls, concurrency)
+        report(label, latencies, succeeded, calls, client, server.requests)
+
+
+async def main_async(args):
+    tail = {"latency_ms": args.latency_ms, "tail_rate": 0.05, "tail_ms": args.latency_ms * 10}
+    print(f"tail latency ({tail['tail_rate']:.0%} of responses take {tail['tail_ms']} ms)")
+    await scenario("no hedging", tail, {}, args.calls, args.concurrency)
+    await scenario(f"hedge after {args.latency_ms * 2} ms", tail, {"hedge_after": args.latency_ms * 2 / 1000}, args.calls, args.concurrency)
+
+    errors = {"latency_ms": args.latency_ms, "error_rate": 0.2}
+    print("transient errors (20% of responses are 503)")
+    await scenario("no retries", errors, {}, args.calls, args.concurrency)
+    await scenario("3 retries with backoff", errors, {"max_retries": 3}, args.calls, args.concurrency)
+
+    outage = {"latency_ms": args.latency_ms, "error_rate": 1.0}
+    print("outage (every response is 503)")
+    await scenario("no circuit breaker", outage, {"max_retries": 3}, args.calls, args.concurrency)
+    await scenario("breaker opens after 5", outage, {"max_retries": 3, "breaker_threshold": 5}, args.calls, args.concurrency)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency-ms", type=int, default=200, help="typical stub response time")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# In backend/benchmarks/llm_stub_server.py
+"""
+Stand-in for the Gemini REST API (generateContent and
+streamGenerateContent?alt=sse) with configurable latency and failures.
+Point the app at it with LLM_BASE_URL:
+
+    cd backend
+    python -m benchmarks.llm_stub_server --port 8900 --latency-ms 800 --tail-rate 0.05 --tail-ms 6000
+    LLM_BASE_URL=http://127.0.0.1:8900 uvicorn app.main:app
+
+Also used in-process by benchmarks.llm_client.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.llm.stub import stub_application_text
+from app.services.prompt_payload import estimate_tokens
+
+
+def malform(text: str, constrained: bool):
+    """One of the ways a model breaks a JSON answer; returns the text and finish reason."""
+    kind = "truncated" if constrained else random.choice(("truncated", "prose", "nested"))
+    if kind == "truncated":
+        # Somewhere after the resume, as when the output token limit is hit
+        cut = random.randint(text.index('"cover_letter"'), len(text) - 2)
+        return text[:cut], "MAX_TOKENS"
+    if kind == "prose":
+        return f"Here is the application you asked for:\n```json\n{text}\n```\nGood luck!", "STOP"
+    data = json.loads(text)
+    data["resume"] = {"summary": data["resume"], "skills": ["Python", "PostgreSQL"]}
+    return json.dumps(data), "STOP"
+
+
+class LLMStubServer:
+    """
+    Every request waits `latency_ms` (or `tail_ms` for a `tail_rate` share of
+    requests) plus `ms_per_output_token` for each token it returns, at half
+    that for "lite" models, and an `error_rate` share answer 503 instead.
+    maxOutputTokens truncates the answer. `down` makes every request fail,
+    to simulate an outage.
+
+    A `malformed_rate` share of whole-application (JSON) answers come back
+    broken: cut off part-way, wrapped in prose, or with the resume as a
+    nested object. Requests with a responseSchema only suffer the cut-off,
+    as constrained decoding rules out the other two.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: int = 0,
+                 tail_rate: float = 0.0, tail_ms: int = 0, error_rate: float = 0.0,
+                 ms_per_output_token: float = 0.0, malformed_rate: float = 0.0):
+        self.latency_ms = latency_ms
+        self.ms_per_output_token = ms_per_output_token
+        self.tail_rate = tail_rate
+        self.tail_ms = tail_ms
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.down = False
+        self.requests = 0
+        self.schema_requests = 0
+        self.output_tokens = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                stub.requests += 1
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                prompt = "".join(part.get("text", "") for content in body.get("contents", []) for part in content.get("parts", []))
+                slow = random.random() < stub.tail_rate
+                time.sleep((stub.tail_ms if slow else stub.latency_ms) / 1000)
+
+                if stub.down or random.random() < stub.error_rate:
+                    self._send_json(503, {"error": {"code": 503, "message": "The model is overloaded.", "status": "UNAVAILABLE"}})
+                    return
+
+                text = stub_application_text(prompt)
+                finish_reason = "STOP"
+                generation_config = body.get("generationConfig", {})
+                if generation_config.get("responseSchema"):
+                    stub.schema_requests += 1
+                if text.startswith("{") and random.random() < stub.malformed_rate:
+                    text, finish_reason = malform(text, constrained=bool(generation_config.get("responseSchema")))
+                max_output_tokens = generation_config.get("maxOutputTokens")
+                if max_output_tokens and estimate_tokens(text) > max_output_tokens:
+                    text, finish_reason = text[:max_output_tokens * 4], "MAX_TOKENS"
+                stub.output_tokens += estimate_tokens(text)
+                model = self.path.split("/models/", 1)[-1].split(":", 1)[0]
+                generation_seconds = estimate_tokens(text) * stub.ms_per_output_token / 1000
+                if "lite" in model:
+                    generation_seconds /= 2
+                usage = {"promptTokenCount": estimate_tokens(prompt), "candidatesTokenCount": estimate_tokens(text)}
+                if ":streamGenerateContent" in self.path:
+                    self._send_stream(text, usage, finish_reason, generation_seconds)
+                elif ":generateContent" in self.path:
+                    time.sleep(generation_seconds)
+                    self._send_json(200, {
+                        "candidates": [{"content": {"role": "model", "parts": [{"text": text}]}, "finishReason": finish_reason}],
+                        "usageMetadata": usage,
+                    })
+                else:
+                    self._send_json(404, {"error": {"code": 404, "message": "Not found"}})
+
+            def handle_one_request(self):
+                try:
+                    super().handle_one_request()
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up on this request, e.g. a hedge that lost the race
+                    self.close_connection = True
+
+            def _send_json(self, status, payload):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _send_stream(self, text, usage, finish_reason, generation_seconds):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                pieces = [text[i:i + 200] for i in range(0, len(text), 200)]
+                for index, piece in enumerate(pieces):
+                    time.sleep(generation_seconds / len(pieces))
+                    event = {"candidates": [{"content": {"role": "model", "parts": [{"text": piece}]}}]}
+                    if index == len(pieces) - 1:
+                        event["candidates"][0]["finishReason"] = finish_reason
+                        event["usageMetadata"] = usage
+                    data = f"data: {json.dumps(event)}\r\n\r\n".encode()
+                    self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.write(b"0\r\n\r\n")
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "LLMStubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=int, default=800)
+    parser.add_argument("--tail-rate", type=float, default=0.0, help="share of requests answered after --tail-ms")
+    parser.add_argument("--tail-ms", type=int, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument("--ms-per-output-token", type=float, default=0.0, help="generation time per returned token")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="share of JSON answers returned broken")
+    args = parser.parse_args()
+
+    with LLMStubServer(port=args.port, latency_ms=args.latency_ms, tail_rate=args.tail_rate, tail_ms=args.tail_ms,
+                       error_rate=args.error_rate, ms_per_output_token=args.ms_per_output_token,
+                       malformed_rate=args.malformed_rate) as server:
+        print(f"Gemini stub listening on {server.base_url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# In backend/benchmarks/login_throughput.py
+"""
+Measures /api/auth/token throughput with bcrypt in the shared threadpool
+(PASSWORD_HASH_WORKERS=0) and in the dedicated process pool, while probing
+a cheap sync endpoint to show how much a login storm delays other requests.
+
+    cd backend
+    python -m benchmarks.login_throughput --logins 200 --concurrency 32
+
+Each mode starts its own uvicorn process against the configured database
+(.env / environment) and signs up a throwaway user.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, int(len(ordered) * fraction) - 1)]
+
+
+async def wait_until_ready(base_url: str, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(base_url + "/")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("API did not start")
+
+
+async def run_storm(base_url: str, logins: int, concurrency: int) -> dict:
+    email = f"bench-{uuid.uuid4().hex[:10]}@example.com"
+    password = "benchmark-password"
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        response = await client.post("/api/auth/signup", json={"name": "Bench", "email": email, "password": password})
+        response.raise_for_status()
+
+        semaphore = asyncio.Semaphore(concurrency)
+        login_ms, statuses = [], {}
+        probe_ms = []
+        storm_done = asyncio.Event()
+
+        async def login():
+            async with semaphore:
+                started = time.perf_counter()
+                r = await client.post("/api/auth/token", data={"username": email, "password": password})
+                login_ms.append((time.perf_counter() - started) * 1000)
+                statuses[r.status_code] = statuses.get(r.status_code, 0) + 1
+
+        async def probe():
+            while not storm_done.is_set():
+                started = time.perf_counter()
+                await client.get("/")
+                probe_ms.append((time.perf_counter() - started) * 1000)
+                await asyncio.sleep(0.05)
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        storm_done.set()
+        await probe_task
+
+    return {
+        "logins_per_second": logins / elapsed,
+        "login_p50_ms": statistics.median(login_ms),
+        "login_p95_ms": percentile(login_ms, 0.95),
+        "probe_p50_ms": statistics.median(probe_ms) if probe_ms else 0.0,
+        "probe_p95_ms": percentile(probe_ms, 0.95) if probe_ms else 0.0,
+        "statuses": statuses,
+    }
+
+
+def run_mode(name: str, workers: int, args) -> dict:
+    env = dict(os.environ, PASSWORD_HASH_WORKERS=str(workers), BCRYPT_ROUNDS=str(args.rounds))
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        asyncio.run(wait_until_ready(base_url))
+        print(f"{name}: {args.logins} logins, concurrency {args.concurrency}, bcrypt rounds {args.rounds}")
+        return asyncio.run(run_storm(base_url, args.logins, args.concurrency))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=12, help="BCRYPT_ROUNDS for the signed-up user")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="process pool size")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    results = {
+        "threadpool": run_mode("threadpool", 0, args),
+        f"process pool ({args.workers})": run_mode("process pool", args.workers, args),
+    }
+    print()
+    for name, r in results.items():
+        print(name)
+        print(f"  logins/s {r['logins_per_second']:7.1f}  login p50 {r['login_p50_ms']:7.0f} ms  p95 {r['login_p95_ms']:7.0f} ms")
+        print(f"  probe GET / p50 {r['probe_p50_ms']:7.1f} ms  p95 {r['probe_p95_ms']:7.1f} ms  statuses {r['statuses']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+# In backend/benchmarks/scraper_fixtures.py
+"""
+Offline benchmark and regression check for LinkedInScraper. Serves the saved
+pages in benchmarks/fixtures/linkedin from a local stand-in server
+(benchmarks.fixture_server) and scrapes each one through the real scraper.
+
+    cd backend
+    python -m benchmarks.scraper_fixtures --path browser --runs 10
+    python -m benchmarks.scraper_fixtures --path http --check
+
+--path picks what is exercised: "browser" (Playwright through BrowserPool),
+"http" (the httpx fast path only) or "auto" (scrape_job_posting, as the API
+calls it). Reports per fixture the p50/p95 scrape latency, the peak RSS of
+this process plus its children (the Chromium processes) while the fixture
+was being scraped, and extraction accuracy against the expected fields in
+manifest.json. With --check the exit status is 1 when any field is wrong
+or a p95 exceeds --max-p95-ms, so it can gate changes in CI.
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import statistics
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.scraping.browser_pool import BrowserPool  # noqa: E402
+from app.scraping.http_client import create_http_client  # noqa: E402
+from app.scraping.linkedin_scraper import LinkedInScraper  # noqa: E402
+from benchmarks.fixture_server import FixtureServer  # noqa: E402
+
+PATHS = ("browser", "http", "auto")
+
+
+def _rss_kb(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _children(pid: int) -> List[int]:
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [int(child) for child in f.read().split()]
+    except OSError:
+        return []
+
+
+def process_tree_rss_kb(pid: int) -> int:
+    """Resident memory of a process and all of its descendants (Linux /proc)."""
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        total += _rss_kb(current)
+        pending.extend(_children(current))
+    return total
+
+
+class PeakRSSSampler:
+    """
+    Polls the RSS of this process tree on a background thread and keeps the
+    peak since the last reset(). Falls back to this process's ru_maxrss
+    where /proc is unavailable, which does not include the browser.
+    """
+
+    def __init__(self, interval: float = 0.02):
+        self.interval = interval
+        self.use_proc = os.path.exists(f"/proc/{os.getpid()}/status")
+        self.peak_kb = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self) -> int:
+        if self.use_proc:
+            return process_tree_rss_kb(os.getpid())
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak_kb = max(self.peak_kb, self._sample())
+
+    def reset(self) -> None:
+        self.peak_kb = self._sample()
+
+    def __enter__(self) -> "PeakRSSSampler":
+        self.reset()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def check_fields(job_data: Optional[Dict], expected: Dict) -> Dict[str, bool]:
+    """Which of the manifest's expectations the scraped fields meet."""
+    job_data = job_data or {}
+    description = job_data.get("description") or ""
+    return {
+        "title": job_data.get("title") == expected["title"],
+        "company": job_data.get("company") == expected["company"],
+        "location": job_data.get("location") == expected["location"],
+        "description": (
+            description.startswith(expected["description_startswith"])
+            and len(description) >= expected["description_min_length"]
+        ),
+    }
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+async def scrape_once(scraper: LinkedInScraper, path: str, url: str) -> Optional[Dict]:
+    if path == "browser":
+        return await scraper._scrape_with_browser(url)
+    if path == "http":
+        return await scraper._scrape_with_http(url)
+    return await scraper.scrape_job_posting(url)
+
+
+async def run_fixture(scraper, path, url, runs, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed():
+        async with semaphore:
+            started = time.perf_counter()
+            job_data = await scrape_once(scraper, path, url)
+            return (time.perf_counter() - started) * 1000, job_data
+
+    return await asyncio.gather(*[timed() for _ in range(runs)])
+
+
+async def run(args) -> bool:
+    pool = BrowserPool() if args.path != "http" else None
+    http_client = create_http_client() if args.path != "browser" else None
+    if pool is not None:
+        await pool.start()
+    scraper = LinkedInScraper(pool, http_client=http_client)
+    passed = True
+    try:
+        with FixtureServer(latency_ms=args.latency_ms) as server, PeakRSSSampler() as sampler:
+            fixtures = [f for f in server.fixtures if not args.only or f["file"] in args.only]
+            # One unmeasured scrape so browser launch and imports are not in the first fixture's numbers
+            await scrape_once(scraper, args.path, server.url_for(fixtures[0]))
+
+            print(f"path={args.path} runs={args.runs} concurrency={args.concurrency} latency={args.latency_ms}ms")
+            all_latencies = []
+            for fixture in fixtures:
+                sampler.reset()
+                results = await run_fixture(scraper, args.path, server.url_for(fixture), args.runs, args.concurrency)
+                latencies = [ms for ms, _ in results]
+                all_latencies.extend(latencies)
+                checks = [check_fields(job_data, fixture["expected"]) for _, job_data in results]
+                correct = sum(sum(c.values()) for c in checks)
+                total = sum(len(c) for c in checks)
+                wrong = sorted({field for c in checks for field, ok in c.items() if not ok})
+                p95 = percentile(latencies, 95)
+
+                print(
+                    f"  {fixture['file']:<28} p50 {statistics.median(latencies):8.1f} ms  p95 {p95:8.1f} ms  "
+                    f"peak RSS {sampler.peak_kb / 1024:7.1f} MB  accuracy {correct / total:6.1%}"
+                    + (f"  wrong: {', '.join(wrong)}" if wrong else "")
+                )
+                if correct < total or (args.max_p95_ms and p95 > args.max_p95_ms):
+                    passed = False
+
+            print(f"  {'all fixtures':<28} p50 {statistics.median(all_latencies):8.1f} ms  "
+                  f"p95 {percentile(all_latencies, 95):8.1f} ms")
+    finally:
+        if pool is not None:
+            await pool.stop()
+        if http_client is not None:
+            await http_client.aclose()
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", choices=PATHS, default="browser")
+    parser.add_argument("--runs", type=int, default=10, help="scrapes per fixture")
+    parser.add_argument("--concurrency", type=int, default=1, help="scrapes of a fixture in flight at once")
+    parser.add_argument("--latency-ms", type=int, default=0, help="delay the stand-in server adds to each response")
+    parser.add_argument("--only", nargs="*", help="fixture file names to run")
+    parser.add_argument("--check", action="store_true", help="exit 1 on any wrong field or p95 over --max-p95-ms")
+    parser.add_argument("--max-p95-ms", type=float, default=0)
+    args = parser.parse_args()
+
+    passed = asyncio.run(run(args))
+    if args.check and not passed:
+        print("FAILED")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# In backend/benchmarks/structured_output.py
+"""
+Compares the old strict handling of single-call generation output with the
+schema-constrained call and tolerant parser, against the Gemini stub server
+returning a share of broken JSON answers.
+
+    cd backend
+    python -m benchmarks.structured_output --generations 200 --malformed-rate 0.2
+
+The strict baseline is the previous parser (strip a ```json fence, then
+json.loads); a failure costs the user a whole new generation, so it is
+retried until it parses. The new path asks for JSON with a response schema,
+repairs what it can and writes only the missing sections separately.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# Settings are read at import time, so point the client at the stub first
+STUB_PORT = _free_port()
+os.environ["LLM_PROVIDER"] = "gemini"
+os.environ["LLM_BASE_URL"] = f"http://127.0.0.1:{STUB_PORT}"
+os.environ["GENERATION_MODE"] = "single"
+os.environ["LOG_CONSOLE"] = "false"
+
+from app.core.security import build_application_prompt, llm_client  # noqa: E402
+from app.services.generation import generate_application_content_async  # noqa: E402
+from app.services.structured_output import structured_output_stats  # noqa: E402
+from benchmarks.llm_stub_server import LLMStubServer  # noqa: E402
+
+USER_DATA = {
+    "name": "Alex Doe",
+    "experiences": [{"title": "Platform Engineer", "company": "Acme", "description": "Ran Kubernetes clusters and CI."}],
+    "skills": ["Python", "Kubernetes", "PostgreSQL"],
+}
+JOB_DATA = {"job_title": "Site Reliability Engineer", "company_name": "Globex", "description": "Operate services at scale."}
+
+
+def strict_parse(text: str) -> dict:
+    """The parser this benchmark replaces."""
+    if text.startswith("```json") and text.endswith("```"):
+        text = text[7:-3].strip()
+    generated_data = json.loads(text.strip())
+    if "resume" not in generated_data or "cover_letter" not in generated_data:
+        raise ValueError("Gemini response did not contain the expected keys.")
+    return generated_data
+
+
+async def strict_generation() -> int:
+    """Full generations until one parses; returns how many failed first."""
+    prompt = build_application_prompt(USER_DATA, JOB_DATA)
+    failures = 0
+    while True:
+        response = await llm_client.generate(prompt)
+        try:
+            strict_parse(response.text)
+            return failures
+        except ValueError:
+            failures += 1
+
+
+async def run(stub: LLMStubServer, generate, generations: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    timings = []
+    outcomes = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            outcomes.append(await generate())
+            timings.append((time.perf_counter() - started) * 1000)
+
+    requests, output_tokens = stub.requests, stub.output_tokens
+    await asyncio.gather(*(one() for _ in range(generations)))
+    return {
+        "requests": (stub.requests - requests) / generations,
+        "output_tokens": (stub.output_tokens - output_tokens) / generations,
+        "p50": statistics.median(timings),
+        "p95": statistics.quantiles(timings, n=20)[-1],
+        "outcomes": outcomes,
+    }
+
+
+async def main_async(stub: LLMStubServer, args):
+    strict = await run(stub, strict_generation, args.generations, args.concurrency)
+    structured = await run(stub, lambda: generate_application_content_async(USER_DATA, JOB_DATA), args.generations, args.concurrency)
+    await llm_client.aclose()
+
+    print(f"{args.generations} generations, {args.malformed_rate:.0%} of JSON answers malformed")
+    failed_first = sum(1 for failures in strict["outcomes"] if failures)
+    print(f"  strict     {strict['requests']:.2f} LLM calls/generation   {strict['output_tokens']:7.0f} output tokens/generation"
+          f"   p50 {strict['p50']:6.0f} ms   p95 {strict['p95']:6.0f} ms   ({failed_first} needed a full regeneration)")
+    print(f"  structured {structured['requests']:.2f} LLM calls/generation   {structured['output_tokens']:7.0f} output tokens/generation"
+          f"   p50 {structured['p50']:6.0f} ms   p95 {structured['p95']:6.0f} ms")
+    print(f"  requests with a response schema: {stub.schema_requests}")
+    print(f"  parser: {structured_output_stats.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--generations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--malformed-rate", type=float, default=0.2)
+    parser.add_argument("--latency-ms", type=int, default=100, help="stub time to first token")
+    parser.add_argument("--ms-per-output-token", type=float, default=0.5)
+    args = parser.parse_args()
+
+    with LLMStubServer(port=STUB_PORT, latency_ms=args.latency_ms, ms_per_output_token=args.ms_per_output_token,
+                       malformed_rate=args.malformed_rate) as stub:
+        asyncio.run(main_async(stub, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Initial schema, as previously created by Base.metadata.create_all
+
+Databases created with the old `python -m app.db.create_tables` already
+have these tables: mark them with `alembic stamp 0001_initial_schema` and
+then run `alembic upgrade head`.
+
+Revision ID: 0001_initial_schema
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001_initial_schema"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("password_hash", sa.String(), nullable=False),
+        sa.Column("name", sa.String()),
+        sa.Column("phone_number", sa.String()),
+        sa.Column("location", sa.String()),
+        sa.Column("linkedin_url", sa.String()),
+        sa.Column("personal_website_url", sa.String()),
+        sa.Column("professional_summary", sa.Text()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "experiences",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id")),
+        sa.Column("company_name", sa.String()),
+        sa.Column("title", sa.String()),
+        sa.Column("start_date", sa.Date()),
+        sa.Column("end_date", sa.Date()),
+        sa.Column("is_current", sa.Boolean()),
+        sa.Column("description", sa.Text()),
+    )
+    op.create_index("ix_experiences_id", "experiences", ["id"])
+
+    op.create_table(
+        "educations",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id")),
+        sa.Column("institution_name", sa.String()),
+        sa.Column("degree", sa.String()),
+        sa.Column("field_of_study", sa.String()),
+        sa.Column("start_date", sa.Date()),
+        sa.Column("end_date", sa.Date()),
+    )
+    op.create_index("ix_educations_id", "educations", ["id"])
+
+    op.create_table(
+        "projects",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id")),
+        sa.Column("name", sa.String()),
+        sa.Column("description", sa.Text()),
+        sa.Column("github_url", sa.String()),
+        sa.Column("live_url", sa.String()),
+    )
+    op.create_index("ix_projects_id", "projects", ["id"])
+
+    op.create_table(
+        "skills",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id")),
+        sa.Column("name", sa.String()),
+        sa.Column("category", sa.String()),
+    )
+    op.create_index("ix_skills_id", "skills", ["id"])
+
+    op.create_table(
+        "job_postings",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id")),
+        sa.Column("url", sa.String()),
+        sa.Column("job_title", sa.String()),
+        sa.Column("company_name", sa.String()),
+        sa.Column("location", sa.String()),
+        sa.Column("job_description", sa.Text()),
+        sa.Column("applied_at", sa.DateTime()),
+        sa.UniqueConstraint("url", name="job_postings_url_key"),
+    )
+    op.create_index("ix_job_postings_id", "job_postings", ["id"])
+
+    op.create_table(
+        "applications",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id")),
+        sa.Column("job_posting_id", sa.Integer(), sa.ForeignKey("job_postings.id")),
+        sa.Column("generated_resume_text", sa.Text()),
+        sa.Column("generated_cover_letter_text", sa.Text()),
+        sa.Column("generated_email_template", sa.Text()),
+        sa.Column("generated_at", sa.DateTime()),
+    )
+    op.create_index("ix_applications_id", "applications", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("applications")
+    op.drop_table("job_postings")
+    op.drop_table("skills")
+    op.drop_table("projects")
+    op.drop_table("educations")
+    op.drop_table("experiences")
+    op.drop_table("users")
@@ -0,0 +1,56 @@
+"""Generation queue, generation fingerprints, per-user posting URLs
+
+Schema changes made while create_all was still in use: the generation_jobs
+queue, applications.generation_fingerprint for the generation cache,
+job_postings URLs unique per user instead of globally, and
+job_postings.created_at for the paginated listing.
+
+Revision ID: 0002_generation_queue_and_dedupe
+Revises: 0001_initial_schema
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0002_generation_queue_and_dedupe"
+down_revision = "0001_initial_schema"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("applications", sa.Column("generation_fingerprint", sa.String(length=64)))
+    op.create_index("ix_applications_generation_fingerprint", "applications", ["generation_fingerprint"])
+
+    op.drop_constraint("job_postings_url_key", "job_postings", type_="unique")
+    op.create_unique_constraint("uq_job_postings_user_id_url", "job_postings", ["user_id", "url"])
+    op.add_column("job_postings", sa.Column("created_at", sa.DateTime()))
+
+    op.create_table(
+        "generation_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("job_posting_id", sa.Integer(), sa.ForeignKey("job_postings.id"), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("force_regenerate", sa.Boolean(), nullable=False),
+        sa.Column("application_id", sa.Integer(), sa.ForeignKey("applications.id")),
+        sa.Column("error", sa.Text()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("started_at", sa.DateTime()),
+        sa.Column("finished_at", sa.DateTime()),
+    )
+    op.create_index("ix_generation_jobs_status_created_at", "generation_jobs", ["status", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_generation_jobs_status_created_at", table_name="generation_jobs")
+    op.drop_table("generation_jobs")
+
+    op.drop_column("job_postings", "created_at")
+    op.drop_constraint("uq_job_postings_user_id_url", "job_postings", type_="unique")
+    op.create_unique_constraint("job_postings_url_key", "job_postings", ["url"])
+
+    op.drop_index("ix_applications_generation_fingerprint", table_name="applications")
+    op.drop_column("applications", "generation_fingerprint")
@@ -0,0 +1,48 @@
+"""Indexes matched to the crud query shapes
+
+- experiences / educations / projects / skills: user_id, for the
+  selectinload profile loaders (WHERE user_id IN (...)).
+- job_postings: (user_id, id) for the newest-first listing and per-user id
+  lookups; url for the cross-user stored-posting lookup, which the
+  (user_id, url) unique constraint cannot serve.
+- applications: job_posting_id for get_application_by_job_id and
+  (user_id, generated_at, id) for the keyset listing. Generation cache
+  lookups keep the existing fingerprint index: a SHA-256 is already
+  selective, and a (user_id, fingerprint, generated_at) index measured
+  slower in benchmarks/db_indexes.py.
+
+Indexes are built CONCURRENTLY so existing tables stay writable.
+
+Revision ID: 0003_query_indexes
+Revises: 0002_generation_queue_and_dedupe
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0003_query_indexes"
+down_revision = "0002_generation_queue_and_dedupe"
+branch_labels = None
+depends_on = None
+
+PROFILE_TABLES = ("experiences", "educations", "projects", "skills")
+
+INDEXES = [
+    *((f"ix_{table}_user_id", table, ["user_id"]) for table in PROFILE_TABLES),
+    ("ix_job_postings_user_id_id", "job_postings", ["user_id", "id"]),
+    ("ix_job_postings_url", "job_postings", ["url"]),
+    ("ix_applications_job_posting_id", "applications", ["job_posting_id"]),
+    ("ix_applications_user_id_generated_at_id", "applications", ["user_id", "generated_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
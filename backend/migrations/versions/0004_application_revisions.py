@@ -0,0 +1,39 @@
+"""Revision history for sections regenerated in place
+
+application_revisions keeps the previous text of an application section each
+time POST /applications/{id}/regenerate replaces it.
+
+Revision ID: 0004_application_revisions
+Revises: 0003_query_indexes
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_application_revisions"
+down_revision = "0003_query_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "application_revisions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("application_id", sa.Integer(), sa.ForeignKey("applications.id"), nullable=False),
+        sa.Column("section", sa.String(length=32), nullable=False),
+        sa.Column("previous_text", sa.Text()),
+        sa.Column("instructions", sa.Text()),
+        sa.Column("model", sa.String()),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    op.create_index(
+        "ix_application_revisions_application_id_created_at",
+        "application_revisions",
+        ["application_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_application_revisions_application_id_created_at", table_name="application_revisions")
+    op.drop_table("application_revisions")
@@ -0,0 +1,26 @@
+"""Preprocessed job descriptions
+
+job_postings.job_description_compact holds the description without
+boilerplate, split into summary, responsibilities and requirements. It is
+filled at scrape time; postings saved earlier are condensed when used.
+
+Revision ID: 0005_job_description_compact
+Revises: 0004_application_revisions
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0005_job_description_compact"
+down_revision = "0004_application_revisions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("job_postings", sa.Column("job_description_compact", postgresql.JSONB(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("job_postings", "job_description_compact")
@@ -0,0 +1,16 @@
+# In backend/tests/test_description.py
+
+from app.scraping.description import condense_job_description
+
+
+def test_compensation_plus_benefits_is_dropped_as_boilerplate():
+    compact = condense_job_description(
+        "Build data pipelines.\n\n**Compensation plus benefits:**\n\n- 401k\n- Free lunch\n\n**Requirements:**\n- Python"
+    )
+    assert "preferred" not in compact
+    assert compact["requirements"] == ["Python"]
+
+
+def test_plus_headings_are_still_nice_to_haves():
+    compact = condense_job_description("**It's a plus if you have:**\n- Go\n\n**Pluses**\n- Rust")
+    assert compact["preferred"] == ["Go", "Rust"]
@@ -0,0 +1,38 @@
+# In backend/tests/test_generation_coalescing.py
+
+import threading
+import uuid
+from types import SimpleNamespace
+
+from app.services import generation
+
+
+def test_forced_request_does_not_join_a_normal_flight(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fake_generate(db, user, posting, force_regenerate=False):
+        calls.append(force_regenerate)
+        if not force_regenerate:
+            started.set()
+            release.wait(5)
+        return ("forced" if force_regenerate else "cached"), None
+
+    monkeypatch.setattr(generation, "generate_and_store_application", fake_generate)
+    user, posting = SimpleNamespace(id=uuid.uuid4()), SimpleNamespace(id=1)
+    results = {}
+    normal = threading.Thread(
+        target=lambda: results.setdefault("normal", generation.generate_application_coalesced(None, user, posting))
+    )
+    normal.start()
+    started.wait(5)
+    try:
+        forced = generation.generate_application_coalesced(None, user, posting, force_regenerate=True)
+    finally:
+        release.set()
+        normal.join(5)
+
+    assert forced == "forced"
+    assert results["normal"] == "cached"
+    assert sorted(calls) == [False, True]
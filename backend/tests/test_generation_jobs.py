@@ -0,0 +1,69 @@
+# In backend/tests/test_generation_jobs.py
+
+import random
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app import crud, models, schemas
+from app.db.database import SessionLocal
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        session.execute(text("SELECT 1"))
+    except OperationalError:
+        session.close()
+        pytest.skip("PostgreSQL is not reachable at DATABASE_URL")
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def running_job(db):
+    user = crud.users.create_user(
+        db, schemas.UserCreate(name="Worker Test", email=f"worker-{uuid.uuid4().hex[:8]}@example.com", password="pw")
+    )
+    posting = crud.jobpostings.create_job_posting(db, schemas.JobPostingCreate(
+        user_id=user.id,
+        url=f"https://www.linkedin.com/jobs/view/{random.randint(1, 10**9)}/",
+        job_title="SRE",
+        company_name="Globex",
+    ))
+    job = crud.generation_jobs.create_generation_job(db, user.id, posting.id)
+    job.status, job.attempts, job.started_at = "running", 1, datetime.utcnow()
+    db.commit()
+    yield job
+    db.rollback()
+    for row in (job, posting, user):
+        db.delete(row)
+        db.commit()
+
+
+def reclaim(db, job):
+    # What claim_next_generation_job does to an expired lease
+    job.attempts += 1
+    job.started_at = datetime.utcnow()
+    db.commit()
+
+
+def test_reclaimed_job_ignores_the_stale_worker(db, running_job):
+    job_id = running_job.id
+    reclaim(db, running_job)
+
+    assert not crud.generation_jobs.mark_generation_job_failed(db, job_id, 1, error="timed out", retry=True)
+    assert not crud.generation_jobs.mark_generation_job_succeeded(db, job_id, 1, application_id=None)
+    assert not crud.generation_jobs.renew_generation_job_lease(db, job_id, 1)
+
+    db.expire_all()
+    job = db.get(models.GenerationJob, job_id)
+    assert (job.status, job.attempts, job.error) == ("running", 2, None)
+
+    assert crud.generation_jobs.mark_generation_job_failed(db, job_id, 2, error="boom", retry=False)
+    db.expire_all()
+    assert db.get(models.GenerationJob, job_id).status == "failed"
@@ -0,0 +1,94 @@
+# In backend/tests/test_llm_client.py
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.ratelimit import AsyncTokenBucket
+from app.llm import CircuitBreaker, LLMClient, LLMError, LLMUnavailable
+from app.llm.stub import StubProvider
+
+
+class FlakyProvider(StubProvider):
+    """StubProvider that raises `errors` in turn before answering normally."""
+
+    def __init__(self, errors):
+        super().__init__()
+        self.errors = list(errors)
+
+    async def generate(self, prompt, model, max_output_tokens=None, response_schema=None):
+        if self.errors:
+            raise self.errors.pop(0)
+        return await super().generate(prompt, model, max_output_tokens, response_schema)
+
+    async def stream(self, prompt, model, max_output_tokens=None, response_schema=None):
+        if self.errors:
+            raise self.errors.pop(0)
+        async for chunk in super().stream(prompt, model, max_output_tokens, response_schema):
+            yield chunk
+
+
+def make_client(provider, breaker):
+    return LLMClient(
+        lambda: provider,
+        default_model="test-model",
+        rate_limiter=AsyncTokenBucket(60000, 1000),
+        breaker=breaker,
+        timeout=5,
+        attempt_timeout=5,
+        max_retries=0,
+        backoff_base=0.01,
+        backoff_max=0.01,
+    )
+
+
+def open_breaker(breaker):
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    # Let the reset timeout lapse so the next call is the half-open trial
+    breaker._opened_at = time.monotonic() - breaker.reset_timeout
+
+
+async def consume(client, prompt):
+    return [chunk async for chunk in client.stream(prompt)]
+
+
+@pytest.mark.parametrize("mode", ["generate", "stream"])
+def test_unexpected_error_in_half_open_trial_frees_the_breaker(mode):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    client = make_client(FlakyProvider([ValueError("bad payload")]), breaker)
+
+    async def call():
+        if mode == "generate":
+            return await client.generate("Return only the email text")
+        return await consume(client, "Return only the email text")
+
+    async def scenario():
+        open_breaker(breaker)
+        with pytest.raises(ValueError):
+            await call()
+        # The failed trial reopened the circuit instead of leaving it half-open
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(LLMUnavailable):
+            await call()
+        open_breaker(breaker)
+        assert await call()
+        assert breaker.state == CircuitBreaker.CLOSED
+        await client.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_llm_error_in_half_open_trial_reopens_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    client = make_client(FlakyProvider([LLMError("overloaded", status_code=503, retryable=True)]), breaker)
+
+    async def scenario():
+        open_breaker(breaker)
+        with pytest.raises(LLMError):
+            await client.generate("Return only the email text")
+        assert breaker.state == CircuitBreaker.OPEN
+        await client.aclose()
+
+    asyncio.run(scenario())
@@ -0,0 +1,17 @@
+# In backend/tests/test_sections.py
+
+import pytest
+
+from app.services.sections import SECTIONS_BY_KEY, clean_section_text
+
+RESUME = SECTIONS_BY_KEY["resume"]
+
+
+def test_clean_section_text_strips_fences():
+    assert clean_section_text(RESUME, "```text\nSummary\n\nEngineer.\n```\n") == "Summary\n\nEngineer."
+
+
+@pytest.mark.parametrize("text", ["", "  \n", "```\n```"])
+def test_clean_section_text_rejects_empty_sections(text):
+    with pytest.raises(ValueError, match="empty resume"):
+        clean_section_text(RESUME, text, "MAX_TOKENS")
@@ -2,4 +2,12 @@ export interface ApplicationContent {
   generated_resume_text: string;
   generated_cover_letter_text: string;
   generated_email_template: string;
-}
\ No newline at end of file
+}
+export interface ApplicationSummary {
+  id: number;
+  job_posting_id: number;
+  generated_at: string;
+  job_title: string | null;
+  company_name: string | null;
+  location: string | null;
+}
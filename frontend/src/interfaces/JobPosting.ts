@@ -8,6 +8,7 @@ export interface JobPosting {
   location: string;
   job_description: string;
   applied_at?: string; // Optional field, use string for DateTime objects
+  created_at?: string;
 }
 
 export interface JobScrapeRequest {
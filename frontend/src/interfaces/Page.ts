@@ -0,0 +1,14 @@
+// In frontend/src/interfaces/Page.ts
+
+export interface Page<T> {
+  items: T[];
+  next_cursor: string | null; // Pass back as `cursor` to fetch the next page
+}
+
+export interface ListParams {
+  limit?: number;
+  cursor?: string;
+  company?: string;
+  location?: string;
+  fields?: 'summary' | 'full';
+}
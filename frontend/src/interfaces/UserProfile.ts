@@ -21,5 +21,4 @@ export interface UserProfile {
   projects: Project[];
   skills: Skill[];
   job_postings: any[]; // Or a specific JobPosting interface
-  applications: any[]; // Or a specific Application interface
 }
\ No newline at end of file
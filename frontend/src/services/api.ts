@@ -5,7 +5,8 @@ import type { Skill } from '../interfaces/Skill';
 import type { Project } from '../interfaces/Project';
 import type { UserProfile } from '../interfaces/UserProfile';
 import type { JobPosting } from '../interfaces/JobPosting';
-import type { ApplicationContent } from '../interfaces/ApplicationContent';
+import type { ApplicationContent, ApplicationSummary } from '../interfaces/ApplicationContent';
+import type { Page, ListParams } from '../interfaces/Page';
 
 const BASE_URL = 'http://localhost:8000/api';
 
@@ -121,6 +122,51 @@ export const getJobPosting = async (token: string, jobPostingId: string): Promis
     return data;
 };
 
+const toQueryString = (params: ListParams): string => {
+    const query = new URLSearchParams();
+    Object.entries(params).forEach(([key, value]) => {
+        if (value !== undefined && value !== '') {
+            query.set(key, String(value));
+        }
+    });
+    const text = query.toString();
+    return text ? `?${text}` : '';
+};
+
+export const listJobPostings = async (token: string, params: ListParams = {}): Promise<Page<JobPosting>> => {
+    const response = await fetch(`${BASE_URL}/jobpostings${toQueryString(params)}`, {
+        method: 'GET',
+        headers: {
+            'Authorization': `Bearer ${token}`,
+            'Content-Type': 'application/json',
+        },
+    });
+
+    if (!response.ok) {
+        const errorData = await response.json();
+        throw new Error(errorData.detail || 'Failed to fetch job postings.');
+    }
+
+    return response.json();
+};
+
+export const listApplications = async (token: string, params: ListParams = {}): Promise<Page<ApplicationSummary>> => {
+    const response = await fetch(`${BASE_URL}/applications${toQueryString(params)}`, {
+        method: 'GET',
+        headers: {
+            'Authorization': `Bearer ${token}`,
+            'Content-Type': 'application/json',
+        },
+    });
+
+    if (!response.ok) {
+        const errorData = await response.json();
+        throw new Error(errorData.detail || 'Failed to fetch applications.');
+    }
+
+    return response.json();
+};
+
 export const getApplication = async (token: string, jobPostingId: number): Promise<ApplicationContent> => {
     const response = await fetch(`${BASE_URL}/applications/${jobPostingId}`, {
         method: 'GET',